@@ -0,0 +1,39 @@
+"""
+Gunicorn profile serving core/asgi.py with uvicorn workers, each of which
+handles many concurrent requests on one event loop. The read-only list and
+detail pages use their async views. Async views run their queries on
+varying threads, so connections are shared through the per-process pool
+rather than kept per thread. Workers start with compiled templates, a
+populated URL resolver and open database connections:
+gunicorn -c core/gunicorn_asgi.py
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "uvicorn.workers.UvicornWorker"
+wsgi_app = "core.asgi:application"
+raw_env = [
+    "DJANGO_ASYNC_VIEWS=True",
+    "DJANGO_CONN_MAX_AGE=0",
+    "DJANGO_DB_POOL=True",
+]
+
+# Load the app in the master so that the warmup below is done once and
+# inherited by every worker, instead of paid for by their first requests.
+preload_app = True
+
+
+def when_ready(server):
+    from manager import warmup
+
+    warmup.warmup(open_db=False)
+
+
+def post_fork(server, worker):
+    # Connections must not be shared with the master, so each worker opens
+    # its own after the fork.
+    from manager import warmup
+
+    warmup.open_connections()
@@ -0,0 +1,32 @@
+"""
+Gunicorn profile serving core/wsgi.py with synchronous worker processes.
+Database connections come from a pool that checks them before reuse, so a
+worker does not fail its first request after idling. Workers start with
+compiled templates, a populated URL resolver and open database connections:
+gunicorn -c core/gunicorn_wsgi.py
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+wsgi_app = "core.wsgi:application"
+raw_env = ["DJANGO_DB_POOL=True"]
+
+# Load the app in the master so that the warmup below is done once and
+# inherited by every worker, instead of paid for by their first requests.
+preload_app = True
+
+
+def when_ready(server):
+    from manager import warmup
+
+    warmup.warmup(open_db=False)
+
+
+def post_fork(server, worker):
+    # Connections must not be shared with the master, so each worker opens
+    # its own after the fork.
+    from manager import warmup
+
+    warmup.open_connections()
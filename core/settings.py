@@ -45,24 +45,31 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "manager.middleware.RequestTimingMiddleware",
+    "manager.middleware.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "manager.middleware.ActivityMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
 
+TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"]
         ,
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -70,6 +77,10 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # Compiled templates are kept in memory outside of development.
+            "loaders": TEMPLATE_LOADERS if DEBUG else [
+                ("django.template.loaders.cached.Loader", TEMPLATE_LOADERS),
+            ],
         },
     },
 ]
@@ -89,10 +100,82 @@ DATABASES = {
     }
 }
 
-db_from_env = dj_database_url.config(conn_max_age=500, )
+# Persistent connections are per thread. Under ASGI every request may run
+# its queries on a different thread, so the ASGI profile sets this to 0.
+db_from_env = dj_database_url.config(
+    conn_max_age=int(os.environ.get("DJANGO_CONN_MAX_AGE", 500)),
+)
 
 DATABASES["default"].update(db_from_env)
 
+# Read replicas as comma separated database URLs, e.g.
+# DATABASE_REPLICA_URLS=sqlite:///replica.sqlite3 to try it locally with a
+# copy of db.sqlite3. GET requests read from them, except for sessions that
+# wrote less than REPLICA_PIN_SECONDS ago; see manager/routers.py.
+DATABASE_REPLICAS = []
+replica_urls = os.environ.get("DATABASE_REPLICA_URLS", "")
+for url in filter(None, replica_urls.split(",")):
+    alias = f"replica_{len(DATABASE_REPLICAS) + 1}"
+    DATABASES[alias] = dj_database_url.parse(
+        url.strip(),
+        conn_max_age=int(os.environ.get("DJANGO_CONN_MAX_AGE", 500)),
+    )
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["manager.routers.ReplicaRouter"]
+
+# With DJANGO_DB_POOL=True each process shares a pool of at most
+# DJANGO_DB_POOL_SIZE connections per database between its threads instead
+# of keeping one per thread. Connections go back to the pool after each
+# request, are pinged before reuse and are replaced once they are older than
+# DJANGO_DB_POOL_MAX_LIFETIME seconds. Pool metrics are logged to
+# manager.performance every DJANGO_DB_POOL_METRICS_INTERVAL seconds and when
+# a pool runs out of connections; see manager/db/pool.py.
+POOLED_ENGINES = {
+    "django.db.backends.postgresql": "manager.db.postgresql",
+    "django.db.backends.sqlite3": "manager.db.sqlite3",
+}
+
+if os.environ.get("DJANGO_DB_POOL", "") == "True":
+    for database in DATABASES.values():
+        if database["ENGINE"] not in POOLED_ENGINES:
+            continue
+        database["ENGINE"] = POOLED_ENGINES[database["ENGINE"]]
+        database["CONN_MAX_AGE"] = 0
+        database["POOL"] = {
+            "SIZE": int(os.environ.get("DJANGO_DB_POOL_SIZE", 5)),
+            "TIMEOUT": float(os.environ.get("DJANGO_DB_POOL_TIMEOUT", 10)),
+            "MAX_LIFETIME": int(
+                os.environ.get("DJANGO_DB_POOL_MAX_LIFETIME", 1800)
+            ),
+            "PRE_PING": True,
+            "METRICS_INTERVAL": float(
+                os.environ.get("DJANGO_DB_POOL_METRICS_INTERVAL", 60)
+            ),
+        }
+
+REPLICA_PIN_SECONDS = int(os.environ.get("DJANGO_REPLICA_PIN_SECONDS", 5))
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# The local-memory cache is per process; set REDIS_URL when running more than
+# one worker so that invalidations are shared.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+if os.environ.get("REDIS_URL"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+
+DASHBOARD_CACHE_TIMEOUT = 60 * 60
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -113,8 +196,55 @@ AUTH_PASSWORD_VALIDATORS = [
 
 AUTH_USER_MODEL = "manager.Worker"
 
+# Resolved permission sets are cached between requests and invalidated by
+# signals when groups, user permissions or a user's flags change.
+AUTHENTICATION_BACKENDS = ["manager.backends.CachedPermissionBackend"]
+
+PERMISSION_CACHE_TIMEOUT = 60 * 60
+
 LOGIN_REDIRECT_URL = "/"
 
+# "offset" uses page numbers, "cursor" uses keyset pagination without COUNT(*)
+PAGINATION_MODE = os.environ.get("DJANGO_PAGINATION_MODE", "offset")
+
+# run_deadline_scheduler queues "due soon" notifications this many days
+# before a task's deadline.
+DEADLINE_DUE_SOON_DAYS = 2
+
+# compact_activity merges runs of edits older than ACTIVITY_COMPACT_DAYS and
+# deletes events older than ACTIVITY_RETENTION_DAYS.
+ACTIVITY_COMPACT_DAYS = 30
+ACTIVITY_RETENTION_DAYS = 365
+
+# Answer worker autocomplete queries from a per-process prefix index instead
+# of the database.
+WORKER_AUTOCOMPLETE_INDEX = True
+
+# Serve the read-only list and detail pages with their async views, for
+# deployments under core/asgi.py.
+ASYNC_VIEWS = os.environ.get("DJANGO_ASYNC_VIEWS", "") == "True"
+
+# Per-request SQL/template/view timings in a Server-Timing header and on the
+# "manager.performance" logger. Requests over either threshold are logged as
+# warnings along with their duplicate SQL statements.
+REQUEST_TIMING_ENABLED = os.environ.get("DJANGO_REQUEST_TIMING", "") == "True"
+REQUEST_TIMING_SLOW_MS = 500
+REQUEST_TIMING_MAX_QUERIES = 20
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "manager.performance": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+    },
+}
+
 INTERNAL_IPS = [
     "127.0.0.1",
 ]
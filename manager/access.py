@@ -0,0 +1,54 @@
+from manager.models import Task
+
+Assignment = Task.assigned.through
+
+
+def is_assigned(user, task):
+    if not user.is_authenticated:
+        return False
+    prefetched = getattr(task, "_prefetched_objects_cache", {})
+    if "assigned" in prefetched:
+        return any(worker.pk == user.pk for worker in prefetched["assigned"])
+    return Assignment.objects.filter(
+        task_id=task.pk, worker_id=user.pk
+    ).exists()
+
+
+def can_view(user, task):
+    return user.is_authenticated
+
+
+def can_edit(user, task):
+    return user.is_authenticated
+
+
+def viewable(user, tasks):
+    """
+    Narrow the ``tasks`` queryset to the ones ``user`` may view, the
+    queryset counterpart of can_view used by the task views.
+    """
+    return tasks if user.is_authenticated else tasks.none()
+
+
+def editable(user, tasks):
+    """
+    Narrow the ``tasks`` queryset to the ones ``user`` may edit or delete.
+    """
+    return tasks if user.is_authenticated else tasks.none()
+
+
+def can_complete(user, task):
+    return (
+        user.is_authenticated
+        and not task.is_completed
+        and (user.is_superuser or is_assigned(user, task))
+    )
+
+
+def completable(user, tasks):
+    """
+    Narrow the ``tasks`` queryset to the ones ``user`` may complete.
+    """
+    if user.is_superuser:
+        return tasks
+    return tasks.filter(assigned=user)
@@ -0,0 +1,183 @@
+from contextvars import ContextVar
+
+from django.db import transaction
+
+from manager.models import Activity
+
+TASK_FIELDS = (
+    "name", "description", "deadline", "priority", "is_completed",
+    "task_type_id", "project_id",
+)
+# Logged as changed without their values to keep rows small.
+VALUELESS_FIELDS = {"description"}
+
+# The request being handled, set by ActivityMiddleware. Its user is only
+# looked up when something is recorded.
+current_request = ContextVar("activity_request", default=None)
+
+
+def current_actor_id():
+    user = getattr(current_request.get(), "user", None)
+    if user is not None and user.is_authenticated:
+        return user.pk
+    return None
+
+
+class ActivityBuffer:
+    """
+    Events recorded at one savepoint level of a transaction, written with
+    one bulk insert when it commits. Rolling back the savepoint discards
+    the buffer together with its on_commit hook.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.flushed = False
+
+    def flush(self):
+        self.flushed = True
+        Activity.objects.bulk_create(self.events, batch_size=500)
+        self.events = []
+
+
+def pending_buffer(connection):
+    # Atomic blocks without a savepoint add None; they cannot be rolled
+    # back on their own, so they share the buffer of the enclosing level.
+    savepoint_ids = set(connection.savepoint_ids) - {None}
+    for hook_savepoint_ids, hook, robust in reversed(
+        connection.run_on_commit
+    ):
+        buffer = getattr(hook, "__self__", None)
+        if (
+            isinstance(buffer, ActivityBuffer)
+            and not buffer.flushed
+            and hook_savepoint_ids - {None} == savepoint_ids
+        ):
+            return buffer
+    buffer = ActivityBuffer()
+    connection.on_commit(buffer.flush)
+    return buffer
+
+
+def record_many(model, object_ids, action, changes=None):
+    """
+    Log ``action`` on each of ``object_ids``. Inside a transaction the
+    events are buffered and inserted in one batch once it commits.
+    """
+    actor_id = current_actor_id()
+    events = [
+        Activity(
+            actor_id=actor_id,
+            model=model,
+            object_id=object_id,
+            action=action,
+            changes=changes or {},
+        )
+        for object_id in object_ids
+    ]
+    if not events:
+        return
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        pending_buffer(connection).events.extend(events)
+    else:
+        Activity.objects.bulk_create(events)
+
+
+def record(model, object_id, action, changes=None):
+    record_many(model, [object_id], action, changes)
+
+
+def task_changes(task, previous_state):
+    return {
+        field: None if field in VALUELESS_FIELDS else getattr(task, field)
+        for field in TASK_FIELDS
+        if getattr(task, field) != previous_state[field]
+    }
+
+
+def task_saved(task, previous_state):
+    if previous_state is None:
+        record(Activity.TASK, task.pk, Activity.CREATED, {"name": task.name})
+        return
+    changes = task_changes(task, previous_state)
+    if not changes:
+        return
+    action = Activity.UPDATED
+    if "is_completed" in changes:
+        action = Activity.COMPLETED if task.is_completed else Activity.REOPENED
+    record(Activity.TASK, task.pk, action, changes)
+
+
+def relation_changed(model, instance, reverse, pk_set, field, added):
+    """
+    Log an m2m change as ASSIGNED or UNASSIGNED events on the ``model``
+    side of the relation.
+    """
+    if not pk_set:
+        return
+    action = Activity.ASSIGNED if added else Activity.UNASSIGNED
+    if reverse:
+        record_many(model, pk_set, action, {field: [instance.pk]})
+    else:
+        record(model, instance.pk, action, {field: sorted(pk_set)})
+
+
+def compact(before, batch_size=1000):
+    """
+    Merge each run of consecutive UPDATED events on the same object by the
+    same actor older than ``before`` into its last event. Returns the
+    number of events removed.
+    """
+    events = Activity.objects.filter(created_at__lt=before).order_by(
+        "model", "object_id", "id"
+    ).values_list("id", "model", "object_id", "actor_id", "action",
+                  "changes")
+    removed = 0
+    kept, redundant = [], []
+
+    def close(run):
+        if len(run) > 1:
+            changes = {}
+            for event in run:
+                changes.update(event[5])
+            kept.append(Activity(id=run[-1][0], changes=changes))
+            redundant.extend(event[0] for event in run[:-1])
+
+    def write():
+        with transaction.atomic():
+            Activity.objects.bulk_update(kept, ["changes"])
+            Activity.objects.filter(pk__in=redundant).delete()
+        count = len(redundant)
+        kept.clear()
+        redundant.clear()
+        return count
+
+    run = []
+    for event in events.iterator(chunk_size=batch_size):
+        if run and event[1:4] != run[-1][1:4]:
+            close(run)
+            run = []
+        if event[4] == Activity.UPDATED:
+            run.append(event)
+        else:
+            close(run)
+            run = []
+        if len(redundant) >= batch_size:
+            removed += write()
+    close(run)
+    return removed + write()
+
+
+def purge(before, batch_size=1000):
+    """
+    Delete the events older than ``before`` in batches of ``batch_size``.
+    Returns the number deleted.
+    """
+    deleted = 0
+    old = Activity.objects.filter(created_at__lt=before).order_by("id")
+    while True:
+        ids = list(old.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += Activity.objects.filter(pk__in=ids).delete()[0]
@@ -0,0 +1,155 @@
+import heapq
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from manager import activity, stats
+from manager.models import Activity, Task, Team, WorkerTaskStats
+from manager.signals import bulk_changed
+
+PRIORITY_WEIGHTS = {
+    "urgent": 8,
+    "high": 4,
+    "medium": 2,
+    "low": 1,
+}
+# Extra load of a task that is overdue or due within
+# DEADLINE_DUE_SOON_DAYS, on top of its priority weight.
+URGENCY_WEIGHT = 4
+
+Assignment = Task.assigned.through
+Membership = Team.members.through
+
+
+def candidates(project_ids):
+    """Memberships of the active workers of the projects' teams."""
+    return Membership.objects.filter(
+        team__project__in=set(project_ids) - {None},
+        worker__is_active=True,
+    )
+
+
+def task_weight(priority, deadline, today=None):
+    today = today or timezone.localdate()
+    deadline = Task._meta.get_field("deadline").to_python(deadline)
+    weight = PRIORITY_WEIGHTS.get(priority, 1)
+    due_soon = today + timedelta(days=settings.DEADLINE_DUE_SOON_DAYS)
+    if deadline <= due_soon:
+        weight += URGENCY_WEIGHT
+    return weight
+
+
+def worker_load(task_stats):
+    """
+    Weighted open-task load of a worker from its precomputed counters.
+    The counters only track overdue tasks, so those stand in for the
+    deadline part of the weight.
+    """
+    return sum(
+        PRIORITY_WEIGHTS[priority] * task_stats[field]
+        for priority, field in stats.PRIORITY_COUNTERS.items()
+    ) + URGENCY_WEIGHT * task_stats["overdue_tasks"]
+
+
+class AutoAssigner:
+    """
+    Picks the least loaded members of the teams linked to a task's project.
+
+    Candidates and their loads are read with one query each for all the
+    projects of a batch. Each project keeps a min-heap of (load, worker)
+    entries; a worker's load grows as tasks are given to it and outdated
+    entries, left behind in the heaps of its other projects, are refreshed
+    when they reach the top.
+    """
+
+    def __init__(self, project_ids, today=None):
+        self.today = today or timezone.localdate()
+        rows = candidates(project_ids).values_list(
+            "team__project", "worker_id"
+        ).distinct()
+        members = {}
+        for project_id, worker_id in rows:
+            members.setdefault(project_id, set()).add(worker_id)
+
+        worker_ids = set().union(*members.values())
+        self.loads = dict.fromkeys(worker_ids, 0)
+        rows = WorkerTaskStats.objects.filter(
+            worker_id__in=worker_ids
+        ).values(
+            "worker_id", "overdue_tasks", *stats.PRIORITY_COUNTERS.values()
+        )
+        for row in rows:
+            self.loads[row["worker_id"]] = worker_load(row)
+
+        self.heaps = {}
+        for project_id, worker_ids in members.items():
+            heap = [(self.loads[pk], pk) for pk in worker_ids]
+            heapq.heapify(heap)
+            self.heaps[project_id] = heap
+
+    def pick(self, task, count=1):
+        heap = self.heaps.get(task.project_id)
+        if not heap:
+            return []
+        picked = []
+        while heap and len(picked) < count:
+            load, worker_id = heapq.heappop(heap)
+            if load != self.loads[worker_id]:
+                heapq.heappush(heap, (self.loads[worker_id], worker_id))
+                continue
+            picked.append(worker_id)
+
+        weight = task_weight(task.priority, task.deadline, self.today)
+        for worker_id in picked:
+            self.loads[worker_id] += weight
+            heapq.heappush(heap, (self.loads[worker_id], worker_id))
+        return picked
+
+    def assign(self, tasks, count=1):
+        """
+        Return {task id: [worker ids]} for the open ``tasks``, spreading
+        them across candidates in order.
+        """
+        return {
+            task.pk: self.pick(task, count)
+            for task in tasks
+            if not task.is_completed
+        }
+
+
+@transaction.atomic
+def auto_assign(tasks, count=1):
+    """
+    Assign up to ``count`` workers to each of ``tasks`` with
+    :class:`AutoAssigner` and return {task id: [worker ids]}. Tasks without
+    a project or without candidates are left as they are.
+    """
+    tasks = list(tasks)
+    assigner = AutoAssigner({task.project_id for task in tasks})
+    picks = {
+        task_id: worker_ids
+        for task_id, worker_ids in assigner.assign(tasks, count).items()
+        if worker_ids
+    }
+    if not picks:
+        return picks
+    Assignment.objects.bulk_create(
+        [
+            Assignment(task_id=task_id, worker_id=worker_id)
+            for task_id, worker_ids in picks.items()
+            for worker_id in worker_ids
+        ],
+        ignore_conflicts=True,
+    )
+    bulk_changed.send(
+        sender=Task,
+        task_ids=list(picks),
+        worker_ids=set().union(*picks.values()),
+    )
+    for task_id, worker_ids in picks.items():
+        activity.record(
+            Activity.TASK, task_id, Activity.ASSIGNED, {"workers": worker_ids}
+        )
+    return picks
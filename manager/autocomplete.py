@@ -0,0 +1,251 @@
+import bisect
+import random
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from manager.models import Worker
+from manager.pagination import keyset_filter
+from manager.routers import read_from_primary
+
+GENERATION_KEY = "manager:autocomplete:workers:generation"
+# The change that produced a generation, kept so that other processes can
+# apply it to their index instead of rebuilding the whole of it.
+CHANGE_KEY = "manager:autocomplete:workers:change:{}"
+CHANGE_TIMEOUT = 60 * 60
+MAX_REPLAY = 100
+
+FIELDS = ("pk", "username", "first_name", "last_name")
+
+
+def generation():
+    # A random starting point, so that an index built before the key was
+    # evicted never matches the generation that replaces it.
+    return cache.get_or_set(
+        GENERATION_KEY, lambda: random.randrange(1 << 30), None
+    )
+
+
+def bump_generation():
+    generation()
+    try:
+        return cache.incr(GENERATION_KEY)
+    except ValueError:
+        return generation()
+
+
+def publish_change(pk, label):
+    current = bump_generation()
+    cache.set(CHANGE_KEY.format(current), (pk, label), CHANGE_TIMEOUT)
+    return current
+
+
+def terms(username, first_name, last_name):
+    return {term.lower() for term in (username, first_name, last_name) if term}
+
+
+def first_match(prefix, username, first_name, last_name):
+    # The term a worker is listed under when several of its names match.
+    return min(
+        term for term in terms(username, first_name, last_name)
+        if term.startswith(prefix)
+    )
+
+
+class PrefixIndex:
+    """
+    Sorted array of (term, pk) pairs, one per lowercased username, first
+    name and last name, answering prefix queries with a binary search.
+    """
+
+    def __init__(self, rows=()):
+        self.labels = {pk: tuple(label) for pk, *label in rows}
+        self.entries = sorted(
+            (term, pk)
+            for pk, label in self.labels.items()
+            for term in terms(*label)
+        )
+
+    def copy(self):
+        index = PrefixIndex()
+        index.labels = dict(self.labels)
+        index.entries = list(self.entries)
+        return index
+
+    def add(self, pk, username, first_name, last_name):
+        self.remove(pk)
+        self.labels[pk] = (username, first_name, last_name)
+        for term in terms(username, first_name, last_name):
+            bisect.insort(self.entries, (term, pk))
+
+    def remove(self, pk):
+        label = self.labels.pop(pk, None)
+        if label is None:
+            return
+        for term in terms(*label):
+            index = bisect.bisect_left(self.entries, (term, pk))
+            if self.entries[index:index + 1] == [(term, pk)]:
+                del self.entries[index]
+
+    def search(self, prefix, limit=10, after=None):
+        """
+        Matches ordered by their first matching term and pk, starting
+        after the (term, pk) position ``after`` when it is given.
+        """
+        prefix = prefix.lower()
+        found = []
+        index = bisect.bisect_left(self.entries, (prefix,))
+        if after is not None:
+            index = max(index, bisect.bisect_right(self.entries, tuple(after)))
+        while index < len(self.entries) and len(found) < limit:
+            term, pk = self.entries[index]
+            if not term.startswith(prefix):
+                break
+            label = self.labels[pk]
+            if first_match(prefix, *label) == term:
+                found.append((pk, *label))
+            index += 1
+        return found
+
+    def __len__(self):
+        return len(self.labels)
+
+
+class WorkerIndex:
+    """
+    Per-process PrefixIndex of the active workers, built on first use.
+    Saves and deletes are applied to it after commit and published as a
+    new generation in the cache. The other processes replay the changes
+    they missed on their next query, and only rebuild from the database
+    when the changes are no longer in the cache, too many of them are
+    missing, or a bulk rewrite bumped the generation without one.
+    """
+
+    def __init__(self):
+        self.index = None
+        self.generation = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        if self.index is not None and self.generation == generation():
+            return self.index
+        with self.lock:
+            # Another thread may have caught up while this one waited.
+            current = generation()
+            if self.index is None or self.generation != current:
+                self.index = self.replay(current) or self.build()
+                self.generation = current
+        return self.index
+
+    def build(self):
+        with read_from_primary():
+            return PrefixIndex(
+                Worker.objects.filter(is_active=True).values_list(*FIELDS)
+            )
+
+    def replay(self, current):
+        if self.index is None or self.generation is None:
+            return None
+        if not 0 < current - self.generation <= MAX_REPLAY:
+            return None
+        keys = [
+            CHANGE_KEY.format(number)
+            for number in range(self.generation + 1, current + 1)
+        ]
+        changes = cache.get_many(keys)
+        if len(changes) < len(keys):
+            return None
+        index = self.index.copy()
+        for key in keys:
+            pk, label = changes[key]
+            if label is None:
+                index.remove(pk)
+            else:
+                index.add(pk, *label)
+        return index
+
+    def search(self, prefix, limit=10, after=None):
+        return self.get().search(prefix, limit, after)
+
+    def update(self, pk, label=None):
+        # Readers keep using the previous index while the copy is changed.
+        with self.lock:
+            previous = self.generation
+            if (
+                self.index is not None
+                and self.index.labels.get(pk) == label
+                and previous == generation()
+            ):
+                # Nothing searchable changed.
+                return
+            if self.index is not None:
+                index = self.index.copy()
+                if label is None:
+                    index.remove(pk)
+                else:
+                    index.add(pk, *label)
+                self.index = index
+            current = publish_change(pk, label)
+            if previous is not None and current == previous + 1:
+                self.generation = current
+
+    def reset(self):
+        with self.lock:
+            self.index = None
+            self.generation = None
+
+
+workers = WorkerIndex()
+
+
+def worker_saved(worker):
+    label = None
+    if worker.is_active:
+        label = (worker.username, worker.first_name, worker.last_name)
+    transaction.on_commit(lambda: workers.update(worker.pk, label))
+
+
+def worker_deleted(worker_id):
+    transaction.on_commit(lambda: workers.update(worker_id))
+
+
+def workers_rewritten():
+    transaction.on_commit(bump_generation)
+
+
+def search_database(prefix, limit=10, after=None):
+    # Served by the UPPER(...) text_pattern_ops indexes on PostgreSQL.
+    queryset = Worker.objects.filter(is_active=True).filter(
+        Q(username__istartswith=prefix)
+        | Q(first_name__istartswith=prefix)
+        | Q(last_name__istartswith=prefix)
+    )
+    if after is not None:
+        queryset = queryset.filter(
+            keyset_filter(("username", "pk"), after, "gt")
+        )
+    return list(
+        queryset.order_by("username", "pk").values_list(*FIELDS)[:limit]
+    )
+
+
+def search_workers(prefix, limit=10, after=None):
+    """
+    Return (pk, username, first_name, last_name) of up to ``limit`` active
+    workers whose username, first name or last name starts with ``prefix``,
+    following the search_position() ``after`` of a previous page's last row.
+    """
+    if settings.WORKER_AUTOCOMPLETE_INDEX:
+        return workers.search(prefix, limit, after)
+    return search_database(prefix, limit, after)
+
+
+def search_position(prefix, row):
+    pk, username, first_name, last_name = row
+    if settings.WORKER_AUTOCOMPLETE_INDEX:
+        prefix = prefix.lower()
+        return [first_match(prefix, username, first_name, last_name), pk]
+    return [username, pk]
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+from manager.routers import read_from_primary
+
+GENERATION_KEY = "manager:perms:generation"
+
+
+def permission_generation():
+    return cache.get_or_set(GENERATION_KEY, 1, None)
+
+
+def permission_key(user_id, generation=None):
+    generation = generation or permission_generation()
+    return f"manager:perms:{generation}:{user_id}"
+
+
+def invalidate_user_permissions(user_ids):
+    user_ids = set(user_ids)
+
+    def invalidate():
+        cache.delete_many([permission_key(user_id) for user_id in user_ids])
+
+    # Once now for the rest of this transaction, and again after commit in
+    # case another request cached the old permissions in between.
+    if user_ids:
+        invalidate()
+        transaction.on_commit(invalidate)
+
+
+def bump_permission_generation():
+    """
+    Invalidate every cached permission set at once, e.g. after a group's
+    permissions changed.
+    """
+    def bump():
+        permission_generation()
+        try:
+            cache.incr(GENERATION_KEY)
+        except ValueError:
+            cache.set(GENERATION_KEY, 2, None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+class CachedPermissionBackend(ModelBackend):
+    """
+    ModelBackend whose resolved permission sets are kept in the cache
+    between requests, keyed by user and permission generation.
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, "_perm_cache"):
+            key = permission_key(user_obj.pk)
+            permissions = cache.get(key)
+            if permissions is None:
+                with read_from_primary():
+                    permissions = super().get_all_permissions(user_obj)
+                cache.set(
+                    key, permissions, settings.PERMISSION_CACHE_TIMEOUT
+                )
+            user_obj._perm_cache = permissions
+        return user_obj._perm_cache
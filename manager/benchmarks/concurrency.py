@@ -0,0 +1,132 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+
+PROFILES = {
+    "wsgi": "core/gunicorn_wsgi.py",
+    "asgi": "core/gunicorn_asgi.py",
+}
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(int(len(ordered) * fraction), len(ordered) - 1)
+    return round(ordered[index], 2)
+
+
+async def slow_request(host, port, path, cookie, delay):
+    """
+    Send a GET request like a client on a slow connection: the headers are
+    sent in two halves ``delay`` seconds apart, and the response is read
+    only after another ``delay``. Returns the status code and the latency
+    in milliseconds.
+    """
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n".encode()
+        )
+        await writer.drain()
+        await asyncio.sleep(delay)
+        writer.write(
+            f"Cookie: {cookie}\r\nConnection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+        await asyncio.sleep(delay)
+        status_line = await reader.readline()
+        await reader.read()
+    finally:
+        writer.close()
+    status = int(status_line.split()[1]) if status_line else 0
+    return status, (time.perf_counter() - started) * 1000
+
+
+async def run_clients(host, port, path, cookie, clients, requests, delay):
+    """
+    Issue ``requests`` slow requests from ``clients`` concurrent clients and
+    summarize throughput and latency.
+    """
+    limit = asyncio.Semaphore(clients)
+
+    async def one():
+        async with limit:
+            try:
+                return await slow_request(host, port, path, cookie, delay)
+            except OSError:
+                return 0, None
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(requests)))
+    seconds = time.perf_counter() - started
+
+    latencies = [ms for status, ms in results if status == 200]
+    return {
+        "requests": requests,
+        "errors": requests - len(latencies),
+        "seconds": round(seconds, 3),
+        "throughput_rps": round(len(latencies) / seconds, 2),
+        "p50_ms": percentile(latencies, 0.5),
+        "p95_ms": percentile(latencies, 0.95),
+    }
+
+
+def wait_for_port(host, port, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with {process.returncode}")
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not listen on {host}:{port}")
+
+
+def start_server(profile, host, port, workers):
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn",
+            "--config", PROFILES[profile],
+            "--bind", f"{host}:{port}",
+            "--workers", str(workers),
+        ],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "core.settings"},
+    )
+    try:
+        wait_for_port(host, port, process)
+    except RuntimeError:
+        process.kill()
+        raise
+    return process
+
+
+def run(profiles, path, cookie, clients=100, requests=500, delay=0.5,
+        workers=2, host="127.0.0.1", port=8765, log=print):
+    """
+    Serve the project with each gunicorn profile in turn and hit ``path``
+    with many simultaneous slow clients.
+    """
+    report = {}
+    for profile in profiles:
+        process = start_server(profile, host, port, workers)
+        try:
+            report[profile] = asyncio.run(
+                run_clients(
+                    host, port, path, cookie, clients, requests, delay
+                )
+            )
+        finally:
+            process.terminate()
+            process.wait()
+        log(f"{profile}: {report[profile]}")
+    return report
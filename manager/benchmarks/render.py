@@ -0,0 +1,49 @@
+import statistics
+import time
+
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+
+from manager.views import TaskListView, TeamsListView, WorkerListView
+
+LIST_VIEWS = {
+    "manager:task-list": TaskListView,
+    "manager:worker-list": WorkerListView,
+    "manager:team-list": TeamsListView,
+}
+
+NO_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+}
+
+
+def render_ms(view, request):
+    response = view(request)
+    started = time.perf_counter()
+    response.render()
+    return (time.perf_counter() - started) * 1000
+
+
+def measure_render(user, rows=100, repeat=5):
+    """
+    Time the template rendering of each list page showing ``rows`` rows,
+    with fragment caching disabled and with a warm fragment cache.
+    """
+    request = RequestFactory().get("/", {"page": 1})
+    request.user = user
+    results = {}
+    for name, view_class in LIST_VIEWS.items():
+        view = view_class.as_view(
+            paginate_by=rows, pagination_mode="offset"
+        )
+        with override_settings(CACHES=NO_CACHE):
+            uncached = [render_ms(view, request) for _ in range(repeat)]
+        cache.clear()
+        render_ms(view, request)
+        warm = [render_ms(view, request) for _ in range(repeat)]
+        results[name] = {
+            "rows": rows,
+            "uncached_ms": round(statistics.median(uncached), 3),
+            "warm_ms": round(statistics.median(warm), 3),
+        }
+    return results
@@ -0,0 +1,203 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+
+import django
+from django.db import connection
+from django.test import Client
+from django.urls import URLPattern, get_resolver, reverse
+
+from manager.benchmarks.render import measure_render
+from manager.benchmarks.seed import seed
+from manager.models import Position, Project, Tag, Task, Team, Worker
+
+POST_ROUTES = {"task-complete", "task-bulk"}
+
+PK_SOURCES = {
+    "task": Task,
+    "worker": Worker,
+    "team": Team,
+    "tag": Tag,
+    "position": Position,
+    "project": Project,
+}
+
+
+def manager_routes():
+    resolver = get_resolver()
+    namespace = resolver.namespace_dict["manager"][1]
+    for pattern in namespace.url_patterns:
+        if isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern.name, pattern
+
+
+def route_kwargs(name, pattern):
+    if not pattern.pattern.converters:
+        return {}
+    model = PK_SOURCES.get(name.split("-")[0])
+    if model is None or set(pattern.pattern.converters) != {"pk"}:
+        return None
+    pk = model.objects.order_by("pk").values_list("pk", flat=True).first()
+    return None if pk is None else {"pk": pk}
+
+
+class QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+
+
+def measure(client, method, url, repeat):
+    send = client.post if method == "POST" else client.get
+    send(url)
+
+    wall, db_time, queries, status = [], [], 0, None
+    for _ in range(repeat):
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            started = time.perf_counter()
+            response = send(url)
+            wall.append((time.perf_counter() - started) * 1000)
+        db_time.append(timer.seconds * 1000)
+        queries = timer.count
+        status = response.status_code
+    return {
+        "method": method,
+        "status": status,
+        "wall_ms": round(statistics.median(wall), 3),
+        "wall_ms_max": round(max(wall), 3),
+        "db_ms": round(statistics.median(db_time), 3),
+        "queries": queries,
+    }
+
+
+def run(sizes, repeat=5, routes=None, log=None, render_rows=None):
+    """
+    Seed each dataset size in the current database and measure every named
+    route of manager/urls.py through the test client. With ``render_rows``
+    the list templates are also rendered at that page size with and
+    without fragment caching.
+    """
+    results, render = {}, {}
+    for size in sizes:
+        started = time.perf_counter()
+        admin = seed(size)
+        if log:
+            log(f"Seeded {size} tasks in {time.perf_counter() - started:.1f}s")
+
+        client = Client()
+        client.force_login(admin)
+        size_results = results[str(size)] = {}
+        for name, pattern in manager_routes():
+            if routes and name not in routes:
+                continue
+            kwargs = route_kwargs(name, pattern)
+            if kwargs is None:
+                continue
+            url = reverse(f"manager:{name}", kwargs=kwargs)
+            method = "POST" if name in POST_ROUTES else "GET"
+            size_results[f"manager:{name}"] = measure(
+                client, method, url, repeat
+            )
+            if log:
+                row = size_results[f"manager:{name}"]
+                log(
+                    f"  {name:<20} {row['status']} "
+                    f"{row['wall_ms']:>9.2f}ms {row['queries']:>4}q "
+                    f"{row['db_ms']:>8.2f}ms db"
+                )
+
+        if render_rows:
+            render[str(size)] = measure_render(admin, render_rows, repeat)
+            for name, row in render[str(size)].items() if log else ():
+                log(
+                    f"  render {name:<20} {row['rows']} rows "
+                    f"{row['uncached_ms']:>9.2f}ms uncached "
+                    f"{row['warm_ms']:>9.2f}ms cached"
+                )
+
+    report = {"meta": environment(repeat), "results": results}
+    if render:
+        report["render"] = render
+    return report
+
+
+def environment(repeat):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "repeat": repeat,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def route_budget(budgets, size, route):
+    budget = dict(budgets.get("default", {}))
+    budget.update(budgets.get("routes", {}).get(route, {}))
+    budget.update(
+        budgets.get("sizes", {}).get(str(size), {}).get(route, {})
+    )
+    return budget
+
+
+def check(report, budgets, baseline=None):
+    """
+    Return a list of human readable budget and regression failures.
+    """
+    failures = []
+    max_regression = budgets.get("max_regression")
+    previous = (baseline or {}).get("results", {})
+
+    for size, routes in report["results"].items():
+        for route, row in routes.items():
+            budget = route_budget(budgets, size, route)
+            where = f"{route} @ {size} tasks"
+            if row["status"] >= 400:
+                failures.append(f"{where}: HTTP {row['status']}")
+            for metric in ("wall_ms", "db_ms", "queries"):
+                if metric in budget and row[metric] > budget[metric]:
+                    failures.append(
+                        f"{where}: {metric} {row[metric]} "
+                        f"> budget {budget[metric]}"
+                    )
+
+            old = previous.get(size, {}).get(route)
+            if old is None:
+                continue
+            if row["queries"] > old["queries"]:
+                failures.append(
+                    f"{where}: queries {old['queries']} -> {row['queries']}"
+                )
+            if (
+                max_regression is not None
+                and row["wall_ms"] > old["wall_ms"] * (1 + max_regression)
+            ):
+                failures.append(
+                    f"{where}: wall_ms {old['wall_ms']} -> {row['wall_ms']} "
+                    f"(> {max_regression:.0%} slower)"
+                )
+    return failures
+
+
+def load(path):
+    with open(path, encoding="utf-8") as stream:
+        return json.load(stream)
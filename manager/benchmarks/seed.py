@@ -0,0 +1,112 @@
+import random
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+
+from manager import search, stats, summary
+from manager.models import (
+    Position,
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+BATCH_SIZE = 2000
+
+
+def clear():
+    for model in (Task, Team, Project, Tag, TaskType, Worker, Position):
+        model.objects.all().delete()
+
+
+def seed(tasks, seed=0):
+    """
+    Fill the database with ``tasks`` tasks and a proportional number of
+    workers, projects, teams and tags. Returns the benchmark superuser.
+    """
+    rng = random.Random(seed)
+    clear()
+
+    positions = Position.objects.bulk_create(
+        [Position(name=f"Position {i}") for i in range(5)]
+    )
+    task_types = TaskType.objects.bulk_create(
+        [TaskType(name=f"Type {i}") for i in range(5)]
+    )
+    tags = Tag.objects.bulk_create([Tag(name=f"tag{i}") for i in range(50)])
+    projects = Project.objects.bulk_create([
+        Project(name=f"Project {i}", description=f"Project {i} description")
+        for i in range(max(tasks // 100, 5))
+    ])
+
+    password = make_password("benchmark")
+    workers = Worker.objects.bulk_create([
+        Worker(
+            username=f"worker{i:06}",
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            password=password,
+            position=rng.choice(positions),
+        )
+        for i in range(max(tasks // 20, 10))
+    ], batch_size=BATCH_SIZE)
+    admin = Worker.objects.create_superuser(
+        username="benchmark", password="benchmark"
+    )
+
+    teams = Team.objects.bulk_create(
+        [Team(name=f"Team {i}") for i in range(max(tasks // 200, 5))]
+    )
+    Team.members.through.objects.bulk_create([
+        Team.members.through(team=team, worker=worker)
+        for team in teams
+        for worker in rng.sample(workers, min(8, len(workers)))
+    ], batch_size=BATCH_SIZE, ignore_conflicts=True)
+    Team.project.through.objects.bulk_create([
+        Team.project.through(team=team, project=project)
+        for team in teams
+        for project in rng.sample(projects, 2)
+    ], batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+    today = date.today()
+    priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+    for start in range(0, tasks, BATCH_SIZE):
+        created = []
+        for i in range(start, min(start + BATCH_SIZE, tasks)):
+            deadline = today + timedelta(days=rng.randint(-30, 90))
+            is_completed = rng.random() < 0.3
+            created.append(Task(
+                name=f"Task {i}",
+                description=f"Description of task {i}",
+                deadline=deadline,
+                is_completed=is_completed,
+                # Set by task_saving, which bulk_create skips.
+                is_overdue=stats.is_overdue(is_completed, deadline, today),
+                priority=rng.choice(priorities),
+                task_type=rng.choice(task_types),
+                project=rng.choice(projects),
+            ))
+        created = Task.objects.bulk_create(created)
+        Task.assigned.through.objects.bulk_create([
+            Task.assigned.through(task=task, worker=worker)
+            for task in created
+            for worker in rng.sample(workers, rng.randint(1, 3))
+        ], ignore_conflicts=True)
+        Task.tags.through.objects.bulk_create([
+            Task.tags.through(task=task, tag=tag)
+            for task in created
+            for tag in rng.sample(tags, rng.randint(0, 2))
+        ], ignore_conflicts=True)
+
+    Task.assigned.through.objects.bulk_create([
+        Task.assigned.through(task_id=task_id, worker=admin)
+        for task_id in Task.objects.values_list("pk", flat=True)[:20]
+    ], ignore_conflicts=True)
+
+    search.rebuild_index()
+    stats.reconcile()
+    summary.rebuild()
+    return admin
@@ -0,0 +1,153 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from manager import activity
+from manager.access import completable
+from manager.dashboard import task_worker_ids
+from manager.models import Activity, Task
+from manager.signals import bulk_changed
+
+Assignment = Task.assigned.through
+Tagging = Task.tags.through
+
+
+def permitted_task_ids(user, tasks, action):
+    """
+    Return the ids of ``tasks`` that ``user`` may apply ``action`` to, in a
+    single query. Completing a task requires being assigned to it unless
+    the user is a superuser; every other action is open to any user.
+    """
+    if action == "complete":
+        tasks = completable(user, tasks)
+    return list(tasks.order_by().values_list("pk", flat=True).distinct())
+
+
+def complete(task_ids):
+    changed = list(
+        Task.objects.filter(pk__in=task_ids, is_completed=False)
+        .values_list("pk", flat=True)
+    )
+    Task.objects.filter(pk__in=changed).update(
+        is_completed=True, is_overdue=False
+    )
+    return changed, list(task_worker_ids(changed))
+
+
+def set_priority(task_ids, priority):
+    changed = list(
+        Task.objects.filter(pk__in=task_ids)
+        .exclude(priority=priority)
+        .values_list("pk", flat=True)
+    )
+    Task.objects.filter(pk__in=changed).update(priority=priority)
+    return changed, list(task_worker_ids(changed))
+
+
+def new_pairs(through, field, task_ids, other_ids):
+    """
+    Return the (task id, ``field`` value) pairs of ``task_ids`` and
+    ``other_ids`` that have no row in ``through`` yet.
+    """
+    existing = set(
+        through.objects.filter(
+            task_id__in=task_ids, **{f"{field}__in": other_ids}
+        ).values_list("task_id", field)
+    )
+    return [
+        (task_id, other_id)
+        for task_id in task_ids
+        for other_id in other_ids
+        if (task_id, other_id) not in existing
+    ]
+
+
+def assign(task_ids, worker_ids):
+    pairs = new_pairs(Assignment, "worker_id", task_ids, worker_ids)
+    Assignment.objects.bulk_create(
+        [
+            Assignment(task_id=task_id, worker_id=worker_id)
+            for task_id, worker_id in pairs
+        ],
+        ignore_conflicts=True,
+    )
+    return pairs
+
+
+def unassign(task_ids, worker_ids):
+    rows = Assignment.objects.filter(
+        task_id__in=task_ids, worker_id__in=worker_ids
+    )
+    pairs = list(rows.values_list("pk", "task_id", "worker_id"))
+    Assignment.objects.filter(pk__in=[pk for pk, *_ in pairs]).delete()
+    return [(task_id, worker_id) for _, task_id, worker_id in pairs]
+
+
+def add_tags(task_ids, tag_ids):
+    pairs = new_pairs(Tagging, "tag_id", task_ids, tag_ids)
+    Tagging.objects.bulk_create(
+        [Tagging(task_id=task_id, tag_id=tag_id) for task_id, tag_id in pairs],
+        ignore_conflicts=True,
+    )
+    return pairs
+
+
+def pair_events(pairs, action, name):
+    """
+    Group the (task id, other id) pairs a link action changed into
+    (task ids, action, changes) events, one per set of ids linked to or
+    unlinked from the tasks.
+    """
+    linked = defaultdict(list)
+    for task_id, other_id in pairs:
+        linked[task_id].append(other_id)
+    grouped = defaultdict(list)
+    for task_id, other_ids in linked.items():
+        grouped[tuple(sorted(other_ids))].append(task_id)
+    return [
+        (task_ids, action, {name: list(other_ids)})
+        for other_ids, task_ids in grouped.items()
+    ]
+
+
+@transaction.atomic
+def apply_action(user, tasks, action, workers=(), tags=(), priority=None):
+    """
+    Apply ``action`` to every task of ``tasks`` the user is permitted to
+    change with set-based writes, and return the ids of the tasks acted on.
+    """
+    task_ids = permitted_task_ids(user, tasks, action)
+    if not task_ids:
+        return task_ids
+
+    worker_ids = [worker.pk for worker in workers]
+    if action == "complete":
+        changed, affected = complete(task_ids)
+        events = [(changed, Activity.COMPLETED, {"is_completed": True})]
+    elif action == "priority":
+        changed, affected = set_priority(task_ids, priority)
+        events = [(changed, Activity.UPDATED, {"priority": priority})]
+    elif action in ("assign", "unassign"):
+        change = assign if action == "assign" else unassign
+        pairs = change(task_ids, worker_ids)
+        changed = sorted({task_id for task_id, _ in pairs})
+        affected = sorted({worker_id for _, worker_id in pairs})
+        events = pair_events(
+            pairs,
+            Activity.ASSIGNED if action == "assign" else Activity.UNASSIGNED,
+            "workers",
+        )
+    elif action == "tag":
+        pairs = add_tags(task_ids, [tag.pk for tag in tags])
+        changed = sorted({task_id for task_id, _ in pairs})
+        affected = []
+        events = pair_events(pairs, Activity.UPDATED, "tags")
+    else:
+        raise ValueError(f"Unknown bulk action: {action}")
+
+    bulk_changed.send(sender=Task, task_ids=changed, worker_ids=affected)
+    for event_task_ids, logged_action, changes in events:
+        activity.record_many(
+            Activity.TASK, event_task_ids, logged_action, changes
+        )
+    return task_ids
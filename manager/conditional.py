@@ -0,0 +1,164 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from manager.pagination import (
+    CURSOR_ERRORS,
+    apaginate_by_cursor,
+    paginate_by_cursor,
+)
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET requests with 304 Not Modified when the page is unchanged.
+
+    The validator is computed with one cheap query before the view runs:
+    the ``updated_at`` of the object for detail views, the latest
+    ``updated_at`` plus the row count for offset-paginated lists, and the
+    keys and timestamps of the rows on the page for cursor-paginated lists.
+    Further timestamp lookups can be listed in ``validator_fields``. The ETag
+    also covers the user, the session and CSRF secret, whose tokens are in
+    the page's forms, and the full path, as all of them change the page.
+
+    Only detail views send Last-Modified: removing a row from a list does
+    not move the latest timestamp of the rows left, which the ETag catches
+    through the row count or keys.
+    """
+
+    validator_fields = ("updated_at",)
+
+    def get_extra_validators(self):
+        return []
+
+    async def aget_extra_validators(self):
+        return []
+
+    def get_validator_queryset(self):
+        if hasattr(self, "get_object"):
+            return self.get_queryset().filter(pk=self.kwargs["pk"])
+        return self.get_queryset()
+
+    def uses_cursor_validator(self):
+        return getattr(self, "get_pagination_mode", lambda: None)() == "cursor"
+
+    def cursor_validator_args(self, queryset):
+        return (
+            queryset.values(
+                "pk", *self.cursor_ordering, *self.validator_fields
+            ),
+            self.cursor_ordering,
+            self.get_paginate_by(queryset),
+            self.request.GET.get(self.cursor_kwarg),
+        )
+
+    def page_validator_values(self, page):
+        rows = [row["pk"] for row in page] + [page.has_next()]
+        timestamps = [
+            row[field] for row in page for field in self.validator_fields
+        ]
+        return rows, timestamps
+
+    def validator_aggregates(self):
+        return {
+            "count": Count("pk"),
+            **{
+                f"max_{index}": Max(field)
+                for index, field in enumerate(self.validator_fields)
+            },
+        }
+
+    def get_validator_values(self):
+        queryset = self.get_validator_queryset()
+        if self.uses_cursor_validator():
+            try:
+                page = paginate_by_cursor(
+                    *self.cursor_validator_args(queryset)
+                )
+            except CURSOR_ERRORS:
+                return None
+            return self.page_validator_values(page)
+
+        values = queryset.order_by().aggregate(**self.validator_aggregates())
+        return [values.pop("count")], list(values.values())
+
+    async def aget_validator_values(self):
+        queryset = self.get_validator_queryset()
+        if self.uses_cursor_validator():
+            try:
+                page = await apaginate_by_cursor(
+                    *self.cursor_validator_args(queryset)
+                )
+            except CURSOR_ERRORS:
+                return None
+            return self.page_validator_values(page)
+
+        values = await queryset.order_by().aaggregate(
+            **self.validator_aggregates()
+        )
+        return [values.pop("count")], list(values.values())
+
+    def make_validators(self, values, extra):
+        if values is None:
+            return None, None
+        rows, timestamps = values
+        timestamps = [stamp for stamp in timestamps if stamp is not None]
+        request = self.request
+        user = request.user
+        # Sets up the CSRF secret of a first visit now, so that the page
+        # rendered for this ETag already carries it.
+        get_token(request)
+        session = getattr(request, "session", None)
+        key = "|".join(map(str, [
+            user.pk,
+            getattr(user, "updated_at", ""),
+            session and session.session_key,
+            request.META["CSRF_COOKIE"],
+            request.get_full_path(),
+            *rows,
+            *timestamps,
+            *extra,
+        ]))
+        etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+        if not hasattr(self, "get_object") or not timestamps:
+            return etag, None
+        # HTTP dates have whole-second precision.
+        return etag, int(max(timestamps).timestamp())
+
+    def get_validators(self):
+        return self.make_validators(
+            self.get_validator_values(), self.get_extra_validators()
+        )
+
+    async def aget_validators(self):
+        return self.make_validators(
+            await self.aget_validator_values(),
+            await self.aget_extra_validators(),
+        )
+
+    def not_modified_response(self, etag, last_modified):
+        if etag is None:
+            return None
+        return get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def add_validator_headers(self, response, etag, last_modified):
+        if etag is not None:
+            response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        response = self.not_modified_response(etag, last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return self.add_validator_headers(response, etag, last_modified)
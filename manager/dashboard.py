@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from manager.models import Project, Task, Team
+from manager.routers import read_from_primary
+
+Assignment = Task.assigned.through
+Membership = Team.members.through
+
+
+def dashboard_key(worker_id):
+    return f"manager:dashboard:{worker_id}"
+
+
+def build_dashboard(worker):
+    teams = worker.teams.order_by("name").values("id", "name")
+    projects = Project.objects.filter(tasks__assigned=worker).annotate(
+        open_tasks=Count(
+            "tasks", filter=Q(tasks__is_completed=False), distinct=True
+        )
+    ).order_by("name").values("id", "name", "description", "open_tasks")
+    return {"teams": list(teams), "projects": list(projects)}
+
+
+def get_dashboard(worker):
+    key = dashboard_key(worker.pk)
+    dashboard = cache.get(key)
+    if dashboard is None:
+        with read_from_primary():
+            dashboard = build_dashboard(worker)
+        cache.set(key, dashboard, settings.DASHBOARD_CACHE_TIMEOUT)
+    return dashboard
+
+
+def invalidate_dashboards(worker_ids):
+    keys = [dashboard_key(worker_id) for worker_id in set(worker_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def task_worker_ids(task_ids):
+    return Assignment.objects.filter(
+        task_id__in=task_ids
+    ).values_list("worker_id", flat=True).distinct()
+
+
+def project_worker_ids(project_id):
+    return Assignment.objects.filter(
+        task__project_id=project_id
+    ).values_list("worker_id", flat=True).distinct()
+
+
+def team_member_ids(team_id):
+    return Membership.objects.filter(
+        team_id=team_id
+    ).values_list("worker_id", flat=True)
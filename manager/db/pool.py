@@ -0,0 +1,284 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger("manager.performance")
+
+
+class PoolExhausted(Exception):
+    pass
+
+
+def ping_connection(connection):
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+        connection.rollback()
+    except Exception:
+        return False
+    return True
+
+
+def close_quietly(connection):
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of at most ``size`` DB-API connections opened with
+    ``connect``.
+
+    Idle connections are handed out most recently returned first, so that
+    the rest can age out. A connection older than ``max_lifetime`` seconds
+    is closed instead of being reused and, with ``pre_ping``, one that no
+    longer answers ``ping`` is replaced before it reaches a request. A
+    checkout waits up to ``timeout`` seconds for a connection to come back
+    before raising PoolExhausted.
+
+    The metrics() of the pool named ``name`` are logged to
+    manager.performance every ``report_interval`` seconds of checkouts,
+    and whenever it runs out of connections.
+    """
+
+    def __init__(self, connect, size=5, timeout=10, max_lifetime=1800,
+                 pre_ping=True, ping=ping_connection, name="default",
+                 report_interval=60):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.pre_ping = pre_ping
+        self.ping = ping
+        self.name = name
+        self.report_interval = report_interval
+        self.reported_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.returned = threading.Condition(self.lock)
+        self.idle = deque()
+        # Open connections, checked out or idle, and when they were opened.
+        self.opened_at = {}
+        self.connecting = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.exhausted = 0
+        self.discarded = 0
+
+    def checkout(self, connect=None):
+        """
+        Return a usable connection and the seconds spent waiting for it.
+        New connections are opened with ``connect`` if it is given.
+        """
+        waited = 0.0
+        while True:
+            connection, seconds = self.reserve()
+            waited += seconds
+            if connection is None:
+                connection = self.open(connect or self.connect)
+                break
+            if self.is_expired(connection) or (
+                self.pre_ping and not self.ping(connection)
+            ):
+                self.discard(connection)
+                continue
+            break
+        record = None
+        with self.lock:
+            self.checkouts += 1
+            if waited:
+                self.waits += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            now = time.monotonic()
+            if (
+                self.report_interval is not None
+                and now - self.reported_at >= self.report_interval
+            ):
+                self.reported_at = now
+                record = self.record()
+        if record is not None:
+            logger.info(json.dumps(record), extra={"pool": record})
+        return connection, waited
+
+    def reserve(self):
+        # Take an idle connection, or a free slot for a new one (None).
+        started = time.monotonic()
+        seconds = 0.0
+        with self.lock:
+            while not self.idle and self.open_count >= self.size:
+                remaining = started + self.timeout - time.monotonic()
+                if remaining <= 0:
+                    self.exhausted += 1
+                    record = self.record()
+                    logger.warning(
+                        "Connection pool exhausted: %s",
+                        json.dumps(record),
+                        extra={"pool": record},
+                    )
+                    raise PoolExhausted(
+                        f"No connection was returned to the pool of "
+                        f"{self.size} within {self.timeout} seconds."
+                    )
+                self.returned.wait(remaining)
+                seconds = time.monotonic() - started
+            if self.idle:
+                return self.idle.pop(), seconds
+            self.connecting += 1
+            return None, seconds
+
+    def open(self, connect):
+        try:
+            connection = connect()
+        except BaseException:
+            with self.lock:
+                self.connecting -= 1
+                self.returned.notify()
+            raise
+        with self.lock:
+            self.connecting -= 1
+            self.opened_at[connection] = time.monotonic()
+        return connection
+
+    def checkin(self, connection):
+        if self.is_expired(connection):
+            self.discard(connection)
+            return
+        with self.lock:
+            self.idle.append(connection)
+            self.returned.notify()
+
+    def discard(self, connection):
+        close_quietly(connection)
+        with self.lock:
+            self.opened_at.pop(connection, None)
+            self.discarded += 1
+            self.returned.notify()
+
+    def is_expired(self, connection):
+        opened_at = self.opened_at.get(connection)
+        return opened_at is None or (
+            self.max_lifetime is not None
+            and time.monotonic() - opened_at > self.max_lifetime
+        )
+
+    @property
+    def open_count(self):
+        return len(self.opened_at) + self.connecting
+
+    def close_all(self):
+        with self.lock:
+            idle = list(self.idle)
+            self.idle.clear()
+            for connection in idle:
+                self.opened_at.pop(connection, None)
+        for connection in idle:
+            close_quietly(connection)
+
+    def metrics(self):
+        with self.lock:
+            return self.snapshot()
+
+    def snapshot(self):
+        # The caller holds the lock.
+        return {
+            "size": self.size,
+            "open": len(self.opened_at),
+            "idle": len(self.idle),
+            "in_use": len(self.opened_at) - len(self.idle),
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "wait_ms": round(self.wait_seconds * 1000, 2),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "exhausted": self.exhausted,
+            "discarded": self.discarded,
+        }
+
+    def record(self):
+        return {"pool": self.name, **self.snapshot()}
+
+
+pools = {}
+pools_lock = threading.Lock()
+pools_pid = None
+
+
+def get_pool(alias, create):
+    """
+    Return the pool of the database ``alias`` in this process, making it
+    with ``create()`` on first use.
+    """
+    global pools_pid
+    with pools_lock:
+        if pools_pid != os.getpid():
+            # A forked worker must not share its parent's sockets; leave
+            # them to the parent and start empty.
+            pools.clear()
+            pools_pid = os.getpid()
+        if alias not in pools:
+            pools[alias] = create()
+        return pools[alias]
+
+
+def pool_metrics():
+    with pools_lock:
+        return {alias: pool.metrics() for alias, pool in pools.items()}
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Take connections from a per-process ConnectionPool configured by the
+    database's POOL settings, and give them back instead of closing them.
+    Use with CONN_MAX_AGE = 0 so that they are returned after each request.
+    """
+
+    # The pool the current connection came from and how long it waited.
+    pool = None
+    pool_wait_seconds = 0.0
+
+    def get_new_connection(self, conn_params):
+        # Opened by this wrapper, which the backend may set up while
+        # connecting.
+        connect = functools.partial(super().get_new_connection, conn_params)
+        options = self.settings_dict.get("POOL", {})
+
+        def create():
+            return ConnectionPool(
+                connect,
+                size=options.get("SIZE", 5),
+                timeout=options.get("TIMEOUT", 10),
+                max_lifetime=options.get("MAX_LIFETIME", 1800),
+                pre_ping=options.get("PRE_PING", True),
+                name=self.alias,
+                report_interval=options.get("METRICS_INTERVAL", 60),
+            )
+
+        self.pool = get_pool(self.alias, create)
+        connection, self.pool_wait_seconds = self.pool.checkout(connect)
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+        self.pool_wait_seconds = 0.0
+        # A connection closed mid-transaction keeps its wrapper in an
+        # aborted state until the next connect(), so it is not reused.
+        if self.in_atomic_block:
+            self.pool.discard(self.connection)
+            return
+        try:
+            self.connection.rollback()
+        except Exception:
+            self.pool.discard(self.connection)
+        else:
+            self.pool.checkin(self.connection)
@@ -0,0 +1,192 @@
+import heapq
+import time
+from datetime import timedelta
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from manager.dashboard import task_worker_ids
+from manager.models import DeadlineNotification, Task
+from manager import signals
+
+Assignment = Task.assigned.through
+
+OVERDUE = DeadlineNotification.OVERDUE
+DUE_SOON = DeadlineNotification.DUE_SOON
+
+
+def chunks(items, size=500):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def flag_overdue(task_ids, today):
+    """
+    Set ``is_overdue`` on the tasks of ``task_ids`` that are still open and
+    past their deadline, and return their ids.
+    """
+    flagged = []
+    for batch in chunks(task_ids):
+        with transaction.atomic():
+            ids = list(
+                Task.objects.filter(
+                    pk__in=batch,
+                    is_completed=False,
+                    is_overdue=False,
+                    deadline__lt=today,
+                ).values_list("pk", flat=True)
+            )
+            if not ids:
+                continue
+            Task.objects.filter(pk__in=ids).update(is_overdue=True)
+            signals.bulk_changed.send(
+                sender=Task,
+                task_ids=ids,
+                worker_ids=list(task_worker_ids(ids)),
+            )
+        flagged.extend(ids)
+    return flagged
+
+
+def enqueue_notifications(kind, deadlines):
+    """
+    Add a ``kind`` notification for every worker assigned to the tasks of
+    ``deadlines`` ({task id: deadline}) to the outbox. A notification for
+    the same task, worker, kind and deadline is only queued once.
+    """
+    for batch in chunks(deadlines):
+        assignments = Assignment.objects.filter(
+            task_id__in=batch
+        ).values_list("task_id", "worker_id")
+        DeadlineNotification.objects.bulk_create(
+            [
+                DeadlineNotification(
+                    task_id=task_id,
+                    worker_id=worker_id,
+                    kind=kind,
+                    deadline=deadlines[task_id],
+                )
+                for task_id, worker_id in assignments
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def task_flagged(task):
+    """
+    Queue the overdue notifications of a task whose save set is_overdue
+    before the scheduler did, which leaves it out of the scheduler's heap.
+    """
+    transaction.on_commit(
+        lambda: enqueue_notifications(OVERDUE, {task.pk: task.deadline})
+    )
+
+
+class DeadlineScheduler:
+    """
+    Min-heap of the upcoming "due soon" and "overdue" events of every open
+    task. It is loaded with one query over the open-deadline index and then
+    kept current from the tasks whose ``updated_at`` moved past a
+    watermark. Changed and closed tasks leave stale heap entries behind,
+    which are skipped when they come up.
+    """
+
+    def __init__(self, due_soon_days=2, overlap=timedelta(minutes=1)):
+        self.due_soon_days = due_soon_days
+        # Rows committed late can carry an updated_at just before the
+        # watermark; re-reading a short overlap catches them.
+        self.overlap = overlap
+        self.heap = []
+        self.deadlines = {}
+        self.watermark = None
+
+    def events(self, task_id, deadline):
+        return [
+            (deadline - timedelta(days=self.due_soon_days), DUE_SOON,
+             task_id, deadline),
+            (deadline + timedelta(days=1), OVERDUE, task_id, deadline),
+        ]
+
+    def load(self):
+        self.watermark = timezone.now()
+        rows = Task.objects.filter(
+            is_completed=False, is_overdue=False
+        ).order_by("deadline").values_list("pk", "deadline")
+        self.deadlines = dict(rows.iterator(chunk_size=2000))
+        self.heap = [
+            event
+            for task_id, deadline in self.deadlines.items()
+            for event in self.events(task_id, deadline)
+        ]
+        heapq.heapify(self.heap)
+        return len(self.deadlines)
+
+    def schedule(self, task_id, deadline, is_completed, is_overdue):
+        if is_completed or is_overdue:
+            self.deadlines.pop(task_id, None)
+        elif self.deadlines.get(task_id) != deadline:
+            self.deadlines[task_id] = deadline
+            for event in self.events(task_id, deadline):
+                heapq.heappush(self.heap, event)
+
+    def poll(self):
+        started = timezone.now()
+        rows = Task.objects.filter(
+            updated_at__gte=self.watermark - self.overlap
+        ).values_list("pk", "deadline", "is_completed", "is_overdue")
+        count = 0
+        for row in rows.iterator(chunk_size=2000):
+            self.schedule(*row)
+            count += 1
+        self.watermark = started
+        if len(self.heap) > 4 * len(self.deadlines) + 1000:
+            self.compact()
+        return count
+
+    def compact(self):
+        self.heap = [
+            event for event in self.heap
+            if self.deadlines.get(event[2]) == event[3]
+        ]
+        heapq.heapify(self.heap)
+
+    def pop_due(self, today):
+        due = {DUE_SOON: {}, OVERDUE: {}}
+        while self.heap and self.heap[0][0] <= today:
+            _, kind, task_id, deadline = heapq.heappop(self.heap)
+            if self.deadlines.get(task_id) != deadline:
+                continue
+            if kind == OVERDUE:
+                del self.deadlines[task_id]
+            elif deadline < today:
+                continue
+            due[kind][task_id] = deadline
+        return due
+
+    def fire(self, today=None):
+        """
+        Flag the tasks that became overdue and queue notifications for them
+        and for the tasks now due soon. Returns the number of each.
+        """
+        today = today or timezone.localdate()
+        due = self.pop_due(today)
+        flagged = flag_overdue(due[OVERDUE], today)
+        enqueue_notifications(
+            OVERDUE, {task_id: due[OVERDUE][task_id] for task_id in flagged}
+        )
+        enqueue_notifications(DUE_SOON, due[DUE_SOON])
+        return {OVERDUE: len(flagged), DUE_SOON: len(due[DUE_SOON])}
+
+    def run(self, poll_interval=10, log=print):
+        log(f"Scheduled {self.load()} open tasks")
+        while True:
+            close_old_connections()
+            self.poll()
+            fired = self.fire()
+            if any(fired.values()):
+                log(
+                    f"{fired[OVERDUE]} tasks overdue, "
+                    f"{fired[DUE_SOON]} due soon"
+                )
+            time.sleep(poll_interval)
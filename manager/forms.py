@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
+from django.urls import reverse_lazy
 
+from manager.assignment import candidates
 from manager.models import (
     Task,
     Worker,
@@ -8,6 +10,24 @@ from manager.models import (
     Tag,
     Position,
 )
+from manager.widgets import SearchSelect, SearchSelectMultiple
+
+
+def worker_picker():
+    return SearchSelectMultiple(
+        reverse_lazy("manager:api-worker-autocomplete"),
+        search_param="q",
+        label_fields=("username", "first_name", "last_name"),
+    )
+
+
+def tag_picker():
+    return SearchSelectMultiple(reverse_lazy("manager:api-tag-list"))
+
+
+def project_picker(multiple=False):
+    widget_class = SearchSelectMultiple if multiple else SearchSelect
+    return widget_class(reverse_lazy("manager:api-project-list"))
 
 
 class TaskForm(forms.ModelForm):
@@ -18,14 +38,49 @@ class TaskForm(forms.ModelForm):
             "priority", "task_type", "assigned", "tags", "project"
         ]
         widgets = {
-            "assigned": forms.CheckboxSelectMultiple,
-            "tags": forms.CheckboxSelectMultiple,
+            "assigned": worker_picker(),
+            "tags": tag_picker(),
+            "project": project_picker(),
             "deadline": forms.DateInput(
                 attrs={"type": "date",
                        "class": "form-control"}),
         }
 
 
+class TaskCreateForm(TaskForm):
+    auto_assign = forms.BooleanField(
+        required=False,
+        label="Auto-assign",
+        help_text=(
+            "Assign the least loaded member of the project's teams "
+            "when no workers are selected."
+        ),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["assigned"].required = False
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get("assigned") or "assigned" in self.errors:
+            return cleaned_data
+        if not cleaned_data.get("auto_assign"):
+            self.add_error(
+                "assigned", self.fields["assigned"].error_messages["required"]
+            )
+        elif not cleaned_data.get("project"):
+            self.add_error(
+                "project", "Auto-assign needs a project to pick workers from."
+            )
+        elif not candidates([cleaned_data["project"].pk]).exists():
+            self.add_error(
+                "project",
+                "No team of this project has active members to assign.",
+            )
+        return cleaned_data
+
+
 class TaskSearchForm(forms.Form):
     query = forms.CharField(
         max_length=64,
@@ -43,6 +98,49 @@ class TaskSearchForm(forms.Form):
     )
 
 
+class TaskBulkActionForm(forms.Form):
+    ACTION_CHOICES = [
+        ("complete", "Mark completed"),
+        ("assign", "Assign workers"),
+        ("unassign", "Unassign workers"),
+        ("tag", "Add tags"),
+        ("priority", "Set priority"),
+    ]
+    REQUIRED_FIELDS = {
+        "assign": "workers",
+        "unassign": "workers",
+        "tag": "tags",
+        "priority": "priority",
+    }
+
+    tasks = forms.ModelMultipleChoiceField(
+        queryset=Task.objects.all(),
+        widget=forms.MultipleHiddenInput,
+    )
+    action = forms.ChoiceField(choices=ACTION_CHOICES)
+    workers = forms.ModelMultipleChoiceField(
+        queryset=Worker.objects.order_by("username"),
+        required=False,
+        widget=worker_picker(),
+    )
+    tags = forms.ModelMultipleChoiceField(
+        queryset=Tag.objects.order_by("name"),
+        required=False,
+        widget=tag_picker(),
+    )
+    priority = forms.ChoiceField(
+        choices=[("", "---------")] + Task.PRIORITY_CHOICES,
+        required=False,
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        field = self.REQUIRED_FIELDS.get(cleaned_data.get("action"))
+        if field and not cleaned_data.get(field):
+            self.add_error(field, "This field is required for this action.")
+        return cleaned_data
+
+
 class WorkerCreationForm(UserCreationForm):
     class Meta:
         model = Worker
@@ -83,8 +181,8 @@ class TeamForm(forms.ModelForm):
         model = Team
         fields = ["name", "members", "project"]
         widgets = {
-            "members": forms.CheckboxSelectMultiple,
-            "project": forms.CheckboxSelectMultiple,
+            "members": worker_picker(),
+            "project": project_picker(multiple=True),
         }
 
 
@@ -0,0 +1,85 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+from manager.benchmarks import concurrency
+from manager.benchmarks.seed import seed
+from manager.models import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the project with the WSGI and ASGI gunicorn profiles in turn "
+        "and compare their throughput and latency for one page under many "
+        "simultaneous slow clients. Runs against the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            action="append",
+            dest="profiles",
+            choices=sorted(concurrency.PROFILES),
+            help="Only run this gunicorn profile (repeatable).",
+        )
+        parser.add_argument("--path", default="/tasks/")
+        parser.add_argument("--clients", type=int, default=100)
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0.5,
+            help="Seconds each client pauses while sending the request and "
+                 "again before reading the response.",
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument(
+            "--username",
+            default="benchmark",
+            help="Existing user whose session the clients send.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="DELETE all data and seed this many tasks first; the "
+                 "seeded user is 'benchmark'.",
+        )
+        parser.add_argument(
+            "--output", "-o", help="Write the JSON results to this file."
+        )
+
+    def handle(self, *args, **options):
+        if options["seed"] is not None:
+            user = seed(options["seed"])
+        else:
+            user = Worker.objects.filter(
+                username=options["username"]
+            ).first()
+            if user is None:
+                raise CommandError(
+                    f"No user {options['username']!r}; pass --seed N to "
+                    f"create one."
+                )
+
+        client = Client()
+        client.force_login(user)
+        cookie = "; ".join(
+            f"{name}={morsel.value}" for name, morsel in client.cookies.items()
+        )
+
+        report = concurrency.run(
+            options["profiles"] or sorted(concurrency.PROFILES, reverse=True),
+            options["path"],
+            cookie,
+            clients=options["clients"],
+            requests=options["requests"],
+            delay=options["delay"],
+            workers=options["workers"],
+            port=options["port"],
+            log=self.stdout.write,
+        )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as stream:
+                json.dump(report, stream, indent=2, sort_keys=True)
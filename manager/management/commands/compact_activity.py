@@ -0,0 +1,51 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from manager import activity
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete activity log events past the retention period and merge "
+        "runs of consecutive edits to the same object by the same worker "
+        "into one event once they are older than the compaction age."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.ACTIVITY_RETENTION_DAYS,
+            help="Delete events older than this many days.",
+        )
+        parser.add_argument(
+            "--compact-days",
+            type=int,
+            default=settings.ACTIVITY_COMPACT_DAYS,
+            help="Merge edit runs older than this many days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of events to delete per query.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        now = timezone.now()
+        batch_size = options["batch_size"]
+        deleted = activity.purge(
+            now - timedelta(days=options["retention_days"]), batch_size
+        )
+        merged = activity.compact(
+            now - timedelta(days=options["compact_days"]), batch_size
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} expired events, merged {merged} edits "
+            f"in {time.monotonic() - started:.2f}s"
+        ))
@@ -0,0 +1,65 @@
+import time
+from functools import partial
+
+from django.core.management.base import BaseCommand, CommandError
+
+from manager import transfer
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream tasks, workers or teams from JSON Lines or CSV, upserting "
+        "by natural key: workers by username, teams by name and tasks by "
+        "name and project. Task types, tags, positions and projects are "
+        "created on first reference. Import workers before tasks and teams."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("entity", choices=sorted(transfer.IMPORTERS))
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=["jsonl", "csv"],
+            help="Defaults to the file extension, then jsonl.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--auto-assign",
+            action="store_true",
+            help=(
+                "Assign open tasks listed without workers to the least "
+                "loaded member of their project's teams."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or (
+            "csv" if path.endswith(".csv") else "jsonl"
+        )
+        importer = transfer.IMPORTERS[options["entity"]]
+        if options["auto_assign"]:
+            if options["entity"] != "tasks":
+                raise CommandError("--auto-assign only applies to tasks.")
+            importer = partial(importer, auto_assign=True)
+        report = transfer.ImportReport()
+
+        started = time.monotonic()
+        with open(path, newline="", encoding="utf-8") as stream:
+            records = transfer.read_records(stream, fmt)
+            for report in importer(records, report, options["batch_size"]):
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{report.rows} rows "
+                    f"({report.rows / max(elapsed, 1e-9):.0f} rows/s)"
+                )
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report.rows} {options['entity']} in {elapsed:.2f}s "
+            f"({report.rows / max(elapsed, 1e-9):.0f} rows/s)"
+        ))
+        if report.skipped_references:
+            self.stdout.write(self.style.WARNING(
+                f"Skipped {report.skipped_references} unknown usernames"
+            ))
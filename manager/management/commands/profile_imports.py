@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def parse_importtime(output):
+    """
+    Return (module, self us, cumulative us) tuples from the report that
+    ``python -X importtime`` writes to stderr.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        imports.append(
+            (fields[2].strip(), int(fields[0]), int(fields[1]))
+        )
+    return imports
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a module in a fresh interpreter with -X importtime and list "
+        "the slowest imports, to see what a cold start of the web process "
+        "spends its time on."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "module",
+            nargs="?",
+            default="core.wsgi",
+            help="Module to import, core.wsgi by default.",
+        )
+        parser.add_argument(
+            "--warmup",
+            action="store_true",
+            help=(
+                "Also run the web process warmup, which imports the views, "
+                "forms and template tags."
+            ),
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of imports to list.",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Rank by time including or excluding nested imports.",
+        )
+
+    def handle(self, *args, **options):
+        script = f"import {options['module']}"
+        if options["warmup"]:
+            script += "\nfrom manager import warmup\nwarmup.warmup(False)"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": os.environ.get(
+                    "DJANGO_SETTINGS_MODULE", "core.settings"
+                ),
+            },
+        )
+        imports = parse_importtime(result.stderr)
+        if result.returncode or not imports:
+            raise CommandError(
+                f"Could not import {options['module']}:\n"
+                f"{result.stderr.strip()[-2000:]}"
+            )
+
+        index = 2 if options["sort"] == "cumulative" else 1
+        imports.sort(key=lambda row: row[index], reverse=True)
+        total_ms = sum(row[1] for row in imports) / 1000
+        self.stdout.write(
+            f"Imported {options['module']} in {total_ms:.1f} ms "
+            f"({len(imports)} modules)"
+        )
+        self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for module, self_us, cumulative_us in imports[:options["limit"]]:
+            self.stdout.write(
+                f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  "
+                f"{module}"
+            )
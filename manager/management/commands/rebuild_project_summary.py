@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from manager import summary
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the per-project and per-member task summaries from the "
+        "Task table. Run this after loaddata or any other raw bulk load."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of projects to recompute per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        count = summary.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {count} project summaries "
+            f"in {time.monotonic() - started:.2f}s"
+        ))
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from manager import search
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the task full-text search index from scratch. "
+        "Run this after loaddata or any other raw bulk load."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of tasks to index per query.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        count = search.rebuild_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {count} tasks in {time.monotonic() - started:.2f}s"
+        ))
@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from manager.benchmarks import runner
+
+DEFAULT_BUDGETS = Path(runner.__file__).with_name("budgets.json")
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed throwaway test databases with 1k/10k/100k tasks and measure "
+        "wall time, query count and query time of every route in "
+        "manager/urls.py. Fails when a budget is exceeded or when the run "
+        "regressed against --baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[1000],
+            help="Dataset sizes in tasks, e.g. --sizes 1000 10000 100000.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--route",
+            action="append",
+            dest="routes",
+            help="Only measure this route name (repeatable).",
+        )
+        parser.add_argument(
+            "--output", "-o", help="Write the JSON results to this file."
+        )
+        parser.add_argument(
+            "--baseline", help="Results file of a previous run to diff with."
+        )
+        parser.add_argument("--budgets", default=str(DEFAULT_BUDGETS))
+        parser.add_argument(
+            "--render-rows",
+            type=int,
+            default=100,
+            help="Also time list page rendering with and without fragment "
+                 "caching at this page size (0 to skip).",
+        )
+        parser.add_argument(
+            "--no-check",
+            action="store_true",
+            help="Record results without enforcing budgets.",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment(debug=False)
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            report = runner.run(
+                options["sizes"],
+                repeat=options["repeat"],
+                routes=options["routes"],
+                log=self.stdout.write,
+                render_rows=options["render_rows"],
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as stream:
+                json.dump(report, stream, indent=2, sort_keys=True)
+
+        if options["no_check"]:
+            return
+        failures = runner.check(
+            report,
+            runner.load(options["budgets"]),
+            runner.load(options["baseline"]) if options["baseline"] else None,
+        )
+        for failure in failures:
+            self.stderr.write(failure)
+        if failures:
+            raise CommandError(f"{len(failures)} benchmark budget failures")
+        self.stdout.write(self.style.SUCCESS("All routes within budget"))
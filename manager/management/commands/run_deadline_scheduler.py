@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from manager.deadlines import DUE_SOON, OVERDUE, DeadlineScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Keep the deadlines of open tasks in memory and, as they pass, flag "
+        "overdue tasks and queue overdue and due-soon notifications for "
+        "their assignees. Runs until interrupted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=10,
+            help="Seconds between checks for changed tasks.",
+        )
+        parser.add_argument(
+            "--due-soon-days",
+            type=int,
+            default=settings.DEADLINE_DUE_SOON_DAYS,
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Fire the events that are due now and exit, e.g. from cron.",
+        )
+
+    def handle(self, *args, **options):
+        scheduler = DeadlineScheduler(due_soon_days=options["due_soon_days"])
+        if not options["once"]:
+            scheduler.run(options["poll"], log=self.stdout.write)
+            return
+
+        scheduled = scheduler.load()
+        fired = scheduler.fire()
+        self.stdout.write(self.style.SUCCESS(
+            f"Scheduled {scheduled} open tasks: {fired[OVERDUE]} overdue, "
+            f"{fired[DUE_SOON]} due soon"
+        ))
@@ -0,0 +1,216 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from manager import activity, routers
+
+logger = logging.getLogger("manager.performance")
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.seconds = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.statements[sql] += 1
+
+    @property
+    def count(self):
+        return sum(self.statements.values())
+
+    def duplicates(self):
+        return [
+            {"sql": sql, "count": count}
+            for sql, count in self.statements.most_common()
+            if count > 1
+        ]
+
+
+class RequestTimingMiddleware:
+    """
+    Record query count, database time, template render time and view time
+    of each request. The numbers are sent back in a ``Server-Timing`` header
+    and logged as JSON on the ``manager.performance`` logger; requests above
+    REQUEST_TIMING_SLOW_MS or REQUEST_TIMING_MAX_QUERIES are logged as
+    warnings together with their repeated SQL statements.
+
+    Disabled unless REQUEST_TIMING_ENABLED is set, in which case Django drops
+    the middleware from the stack at startup.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_TIMING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, "REQUEST_TIMING_SLOW_MS", None)
+        self.max_queries = getattr(
+            settings, "REQUEST_TIMING_MAX_QUERIES", None
+        )
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        request._query_recorder = recorder
+        request._template_seconds = 0.0
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        # Queries of lazy querysets run while rendering count as database
+        # time, not template time.
+        template_ms = request._template_seconds * 1000
+        db_ms = recorder.seconds * 1000
+        # Time spent waiting for a pooled connection, see manager/db/pool.py.
+        pool_wait_ms = 1000 * sum(
+            getattr(connection, "pool_wait_seconds", 0.0)
+            for connection in connections.all(initialized_only=True)
+        )
+        record = {
+            "url_name": self.url_name(request),
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(db_ms, 2),
+            "pool_wait_ms": round(pool_wait_ms, 2),
+            "template_ms": round(template_ms, 2),
+            "view_ms": round(total_ms - template_ms - db_ms, 2),
+            "total_ms": round(total_ms, 2),
+        }
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={db_ms:.2f};desc="{recorder.count} queries"',
+            f"tpl;dur={template_ms:.2f}",
+            f"view;dur={record['view_ms']:.2f}",
+            f"total;dur={total_ms:.2f}",
+        ])
+
+        if self.is_slow(record):
+            record["duplicates"] = recorder.duplicates()
+            logger.warning(json.dumps(record), extra={"timing": record})
+        else:
+            logger.info(json.dumps(record), extra={"timing": record})
+        return response
+
+    def process_template_response(self, request, response):
+        render = response.render
+
+        def timed_render():
+            recorder = request._query_recorder
+            started = time.perf_counter()
+            db_started = recorder.seconds
+            try:
+                return render()
+            finally:
+                request._template_seconds += (
+                    time.perf_counter() - started
+                    - (recorder.seconds - db_started)
+                )
+
+        response.render = timed_render
+        return response
+
+    def is_slow(self, record):
+        return (
+            self.slow_ms is not None and record["total_ms"] > self.slow_ms
+        ) or (
+            self.max_queries is not None
+            and record["queries"] > self.max_queries
+        )
+
+    @staticmethod
+    def url_name(request):
+        match = getattr(request, "resolver_match", None)
+        return match.view_name if match else None
+
+
+class ActivityMiddleware:
+    """
+    Make the current request available to the activity log, which reads
+    the acting user from it when an event is recorded. Runs in either
+    mode, so that the async views are not adapted to sync under ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = activity.current_request.set(request)
+        try:
+            return self.get_response(request)
+        finally:
+            activity.current_request.reset(token)
+
+    async def __acall__(self, request):
+        token = activity.current_request.set(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            activity.current_request.reset(token)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let GET and HEAD requests read from DATABASE_REPLICAS. A request that
+    writes, or uses an unsafe method, pins its client to the primary for
+    REPLICA_PIN_SECONDS with a cookie, so that it reads its own writes
+    despite replication lag.
+
+    Dropped from the stack at startup when no replica is configured.
+    """
+
+    cookie_name = "primary_until"
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = routers.RoutingState(
+            use_replica=request.method in ("GET", "HEAD")
+            and not self.is_pinned(request)
+        )
+        token = routers.routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routers.routing_state.reset(token)
+        if state.wrote or request.method not in ("GET", "HEAD"):
+            seconds = settings.REPLICA_PIN_SECONDS
+            response.set_cookie(
+                self.cookie_name,
+                str(time.time() + seconds),
+                max_age=seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def is_pinned(self, request):
+        try:
+            return float(request.COOKIES[self.cookie_name]) > time.time()
+        except (KeyError, ValueError):
+            return False
@@ -0,0 +1,120 @@
+# Generated by Django 5.0.7 on 2026-10-17 17:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE manager_task_fts USING fts5(
+        document,
+        content='manager_tasksearchdocument',
+        content_rowid='task_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER manager_task_fts_ai
+    AFTER INSERT ON manager_tasksearchdocument BEGIN
+        INSERT INTO manager_task_fts(rowid, document)
+        VALUES (new.task_id, new.document);
+    END
+    """,
+    """
+    CREATE TRIGGER manager_task_fts_ad
+    AFTER DELETE ON manager_tasksearchdocument BEGIN
+        INSERT INTO manager_task_fts(manager_task_fts, rowid, document)
+        VALUES ('delete', old.task_id, old.document);
+    END
+    """,
+    """
+    CREATE TRIGGER manager_task_fts_au
+    AFTER UPDATE ON manager_tasksearchdocument BEGIN
+        INSERT INTO manager_task_fts(manager_task_fts, rowid, document)
+        VALUES ('delete', old.task_id, old.document);
+        INSERT INTO manager_task_fts(rowid, document)
+        VALUES (new.task_id, new.document);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS manager_task_fts_au",
+    "DROP TRIGGER IF EXISTS manager_task_fts_ad",
+    "DROP TRIGGER IF EXISTS manager_task_fts_ai",
+    "DROP TABLE IF EXISTS manager_task_fts",
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE manager_tasksearchdocument
+    ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', document)) STORED
+    """,
+    """
+    CREATE INDEX manager_task_search_vector_idx
+    ON manager_tasksearchdocument USING GIN (search_vector)
+    """,
+]
+
+POSTGRESQL_REVERSE = [
+    "DROP INDEX IF EXISTS manager_task_search_vector_idx",
+    "ALTER TABLE manager_tasksearchdocument DROP COLUMN search_vector",
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+def build_documents(apps, schema_editor):
+    Task = apps.get_model("manager", "Task")
+    TaskSearchDocument = apps.get_model("manager", "TaskSearchDocument")
+    alias = schema_editor.connection.alias
+    documents = TaskSearchDocument.objects.using(alias)
+    tasks = Task.objects.using(alias).select_related("project").prefetch_related("tags")
+
+    batch = []
+    for task in tasks.iterator(chunk_size=500):
+        parts = [task.name, task.description]
+        if task.project is not None:
+            parts.append(task.project.name)
+        parts.extend(tag.name for tag in task.tags.all())
+        batch.append(
+            TaskSearchDocument(task_id=task.pk, document=" ".join(parts))
+        )
+        if len(batch) >= 500:
+            documents.bulk_create(batch)
+            batch = []
+    documents.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSearchDocument',
+            fields=[
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='manager.task')),
+                ('document', models.TextField()),
+            ],
+        ),
+        migrations.RunPython(
+            run_vendor_sql({
+                "sqlite": SQLITE_FORWARD,
+                "postgresql": POSTGRESQL_FORWARD,
+            }),
+            run_vendor_sql({
+                "sqlite": SQLITE_REVERSE,
+                "postgresql": POSTGRESQL_REVERSE,
+            }),
+        ),
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
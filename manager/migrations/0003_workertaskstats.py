@@ -0,0 +1,59 @@
+# Generated by Django 5.0.7 on 2026-10-17 17:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+def backfill_stats(apps, schema_editor):
+    Worker = apps.get_model("manager", "Worker")
+    WorkerTaskStats = apps.get_model("manager", "WorkerTaskStats")
+    alias = schema_editor.connection.alias
+    today = timezone.localdate()
+    is_open = Q(assigned_tasks__is_completed=False)
+
+    def count(condition):
+        return Count("assigned_tasks", filter=condition)
+
+    rows = Worker.objects.using(alias).annotate(
+        open_tasks=count(is_open),
+        completed_tasks=count(Q(assigned_tasks__is_completed=True)),
+        overdue_tasks=count(is_open & Q(assigned_tasks__deadline__lt=today)),
+        urgent_open=count(is_open & Q(assigned_tasks__priority="urgent")),
+        high_open=count(is_open & Q(assigned_tasks__priority="high")),
+        medium_open=count(is_open & Q(assigned_tasks__priority="medium")),
+        low_open=count(is_open & Q(assigned_tasks__priority="low")),
+    ).values(
+        "pk", "open_tasks", "completed_tasks", "overdue_tasks",
+        "urgent_open", "high_open", "medium_open", "low_open",
+    )
+    WorkerTaskStats.objects.using(alias).bulk_create(
+        [WorkerTaskStats(worker_id=row.pop("pk"), **row) for row in rows],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0002_tasksearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkerTaskStats',
+            fields=[
+                ('worker', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('open_tasks', models.IntegerField(default=0)),
+                ('completed_tasks', models.IntegerField(default=0)),
+                ('overdue_tasks', models.IntegerField(default=0)),
+                ('urgent_open', models.IntegerField(default=0)),
+                ('high_open', models.IntegerField(default=0)),
+                ('medium_open', models.IntegerField(default=0)),
+                ('low_open', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
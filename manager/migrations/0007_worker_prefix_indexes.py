@@ -0,0 +1,39 @@
+# Generated by Django 5.0.7 on 2026-10-17 19:02
+
+from django.db import migrations
+
+# Expression indexes matching the UPPER("col"::text) LIKE UPPER(%s) clauses
+# of the __istartswith lookups, usable for prefix matches in any collation.
+POSTGRESQL_FORWARD = [
+    f"""
+    CREATE INDEX manager_worker_{column}_prefix_idx
+    ON manager_worker (UPPER({column}::text) text_pattern_ops)
+    """
+    for column in ("username", "first_name", "last_name")
+]
+
+POSTGRESQL_REVERSE = [
+    f"DROP INDEX IF EXISTS manager_worker_{column}_prefix_idx"
+    for column in ("username", "first_name", "last_name")
+]
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0006_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql({"postgresql": POSTGRESQL_FORWARD}),
+            run_vendor_sql({"postgresql": POSTGRESQL_REVERSE}),
+        ),
+    ]
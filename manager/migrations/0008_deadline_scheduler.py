@@ -0,0 +1,61 @@
+# Generated by Django 5.0.7 on 2026-10-17 18:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def flag_overdue_tasks(apps, schema_editor):
+    Task = apps.get_model("manager", "Task")
+    Task.objects.using(schema_editor.connection.alias).filter(
+        is_completed=False, deadline__lt=django.utils.timezone.localdate()
+    ).update(is_overdue=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0007_worker_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeadlineNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('overdue', 'Overdue'), ('due_soon', 'Due soon')], max_length=20)),
+                ('deadline', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='is_overdue',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['updated_at'], name='task_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='deadlinenotification',
+            name='task',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deadline_notifications', to='manager.task'),
+        ),
+        migrations.AddField(
+            model_name='deadlinenotification',
+            name='worker',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deadline_notifications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='deadlinenotification',
+            index=models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['created_at'], name='notification_unsent_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='deadlinenotification',
+            constraint=models.UniqueConstraint(fields=('task', 'worker', 'kind', 'deadline'), name='unique_deadline_notification'),
+        ),
+        migrations.RunPython(flag_overdue_tasks, migrations.RunPython.noop),
+    ]
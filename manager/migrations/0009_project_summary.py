@@ -0,0 +1,94 @@
+# Generated by Django 5.0.7 on 2026-10-17 18:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+def backfill_summary(apps, schema_editor):
+    Project = apps.get_model("manager", "Project")
+    ProjectTaskStats = apps.get_model("manager", "ProjectTaskStats")
+    ProjectMemberStats = apps.get_model("manager", "ProjectMemberStats")
+    Assignment = apps.get_model("manager", "Task").assigned.through
+    alias = schema_editor.connection.alias
+    today = timezone.localdate()
+    is_open = Q(tasks__is_completed=False)
+
+    def count(condition):
+        return Count("tasks", filter=condition)
+
+    rows = Project.objects.using(alias).annotate(
+        open_tasks=count(is_open),
+        completed_tasks=count(Q(tasks__is_completed=True)),
+        overdue_tasks=count(is_open & Q(tasks__deadline__lt=today)),
+        urgent_open=count(is_open & Q(tasks__priority="urgent")),
+        high_open=count(is_open & Q(tasks__priority="high")),
+        medium_open=count(is_open & Q(tasks__priority="medium")),
+        low_open=count(is_open & Q(tasks__priority="low")),
+    ).values(
+        "pk", "open_tasks", "completed_tasks", "overdue_tasks",
+        "urgent_open", "high_open", "medium_open", "low_open",
+    )
+    ProjectTaskStats.objects.using(alias).bulk_create(
+        [ProjectTaskStats(project_id=row.pop("pk"), **row) for row in rows],
+        batch_size=500,
+    )
+
+    is_open = Q(task__is_completed=False)
+    members = Assignment.objects.using(alias).filter(
+        task__project__isnull=False
+    ).values("task__project_id", "worker_id").annotate(
+        open_tasks=Count("task", filter=is_open),
+        overdue_tasks=Count(
+            "task", filter=is_open & Q(task__deadline__lt=today)
+        ),
+    ).order_by()
+    ProjectMemberStats.objects.using(alias).bulk_create(
+        [
+            ProjectMemberStats(project_id=row.pop("task__project_id"), **row)
+            for row in members
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0008_deadline_scheduler'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTaskStats',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_stats', serialize=False, to='manager.project')),
+                ('open_tasks', models.IntegerField(default=0)),
+                ('completed_tasks', models.IntegerField(default=0)),
+                ('overdue_tasks', models.IntegerField(default=0)),
+                ('urgent_open', models.IntegerField(default=0)),
+                ('high_open', models.IntegerField(default=0)),
+                ('medium_open', models.IntegerField(default=0)),
+                ('low_open', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProjectMemberStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('open_tasks', models.IntegerField(default=0)),
+                ('overdue_tasks', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='member_stats', to='manager.project')),
+                ('worker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='projectmemberstats',
+            constraint=models.UniqueConstraint(fields=('project', 'worker'), name='unique_project_member_stats'),
+        ),
+        migrations.RunPython(backfill_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.7 on 2026-10-17 19:09
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manager', '0009_project_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('model', models.PositiveSmallIntegerField(choices=[(1, 'Task'), (2, 'Team'), (3, 'Worker')])),
+                ('object_id', models.PositiveIntegerField()),
+                ('action', models.PositiveSmallIntegerField(choices=[(1, 'created'), (2, 'updated'), (3, 'deleted'), (4, 'completed'), (5, 'reopened'), (6, 'assigned'), (7, 'unassigned')])),
+                ('changes', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'activities',
+                'indexes': [models.Index(fields=['model', 'object_id', '-id'], name='activity_object_idx'), models.Index(fields=['created_at'], name='activity_created_idx')],
+            },
+        ),
+    ]
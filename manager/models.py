@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
 
 
 class TaskType(models.Model):
@@ -26,6 +28,7 @@ class Tag(models.Model):
 class Project(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -35,6 +38,13 @@ class Team(models.Model):
     name = models.CharField(max_length=255)
     members = models.ManyToManyField("Worker", related_name="teams")
     project = models.ManyToManyField(Project, related_name="teams")
+    version = models.PositiveIntegerField(default=1, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["name", "id"], name="team_name_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -50,6 +60,8 @@ class Worker(AbstractUser):
     tasks_not_completed = models.ManyToManyField(
         "Task", related_name="not_completed_by", blank=True
     )
+    version = models.PositiveIntegerField(default=1, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.username} ({self.first_name}, {self.last_name})"
@@ -67,6 +79,7 @@ class Task(models.Model):
     description = models.TextField()
     deadline = models.DateField()
     is_completed = models.BooleanField(default=False)
+    is_overdue = models.BooleanField(default=False, editable=False)
     priority = models.CharField(max_length=40, choices=PRIORITY_CHOICES)
     task_type = models.ForeignKey(TaskType, on_delete=models.CASCADE)
     assigned = models.ManyToManyField(Worker, related_name="assigned_tasks")
@@ -75,6 +88,199 @@ class Task(models.Model):
         Project, on_delete=models.CASCADE,
         related_name="tasks", null=True, blank=True
     )
+    version = models.PositiveIntegerField(default=1, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["deadline", "id"], name="task_deadline_idx"
+            ),
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_open_deadline_idx"
+            ),
+            models.Index(
+                fields=["project", "deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_project_open_idx"
+            ),
+            models.Index(fields=["updated_at"], name="task_updated_idx"),
+        ]
 
     def __str__(self):
         return self.name
+
+
+class TaskSearchDocument(models.Model):
+    task = models.OneToOneField(
+        Task, on_delete=models.CASCADE,
+        primary_key=True, related_name="search_document"
+    )
+    document = models.TextField()
+
+    def __str__(self):
+        return f"Search document for {self.task_id}"
+
+
+class WorkerTaskStats(models.Model):
+    worker = models.OneToOneField(
+        Worker, on_delete=models.CASCADE,
+        primary_key=True, related_name="task_stats"
+    )
+    open_tasks = models.IntegerField(default=0)
+    completed_tasks = models.IntegerField(default=0)
+    overdue_tasks = models.IntegerField(default=0)
+    urgent_open = models.IntegerField(default=0)
+    high_open = models.IntegerField(default=0)
+    medium_open = models.IntegerField(default=0)
+    low_open = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Task stats for {self.worker_id}"
+
+
+class ProjectTaskStats(models.Model):
+    project = models.OneToOneField(
+        Project, on_delete=models.CASCADE,
+        primary_key=True, related_name="task_stats"
+    )
+    open_tasks = models.IntegerField(default=0)
+    completed_tasks = models.IntegerField(default=0)
+    overdue_tasks = models.IntegerField(default=0)
+    urgent_open = models.IntegerField(default=0)
+    high_open = models.IntegerField(default=0)
+    medium_open = models.IntegerField(default=0)
+    low_open = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def total_tasks(self):
+        return self.open_tasks + self.completed_tasks
+
+    def __str__(self):
+        return f"Task stats for project {self.project_id}"
+
+
+class ProjectMemberStats(models.Model):
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="member_stats"
+    )
+    worker = models.ForeignKey(
+        Worker, on_delete=models.CASCADE, related_name="project_stats"
+    )
+    open_tasks = models.IntegerField(default=0)
+    overdue_tasks = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "worker"],
+                name="unique_project_member_stats",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"Task stats for worker {self.worker_id} "
+            f"in project {self.project_id}"
+        )
+
+
+class DeadlineNotification(models.Model):
+    OVERDUE = "overdue"
+    DUE_SOON = "due_soon"
+    KIND_CHOICES = [
+        (OVERDUE, "Overdue"),
+        (DUE_SOON, "Due soon"),
+    ]
+
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="deadline_notifications"
+    )
+    worker = models.ForeignKey(
+        Worker, on_delete=models.CASCADE,
+        related_name="deadline_notifications"
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    deadline = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task", "worker", "kind", "deadline"],
+                name="unique_deadline_notification",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(sent_at__isnull=True),
+                name="notification_unsent_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} notification for task {self.task_id}"
+
+
+class Activity(models.Model):
+    TASK = 1
+    TEAM = 2
+    WORKER = 3
+    MODEL_CHOICES = [
+        (TASK, "Task"),
+        (TEAM, "Team"),
+        (WORKER, "Worker"),
+    ]
+
+    CREATED = 1
+    UPDATED = 2
+    DELETED = 3
+    COMPLETED = 4
+    REOPENED = 5
+    ASSIGNED = 6
+    UNASSIGNED = 7
+    ACTION_CHOICES = [
+        (CREATED, "created"),
+        (UPDATED, "updated"),
+        (DELETED, "deleted"),
+        (COMPLETED, "completed"),
+        (REOPENED, "reopened"),
+        (ASSIGNED, "assigned"),
+        (UNASSIGNED, "unassigned"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    actor = models.ForeignKey(
+        Worker, on_delete=models.SET_NULL,
+        null=True, blank=True, related_name="activities"
+    )
+    model = models.PositiveSmallIntegerField(choices=MODEL_CHOICES)
+    object_id = models.PositiveIntegerField()
+    action = models.PositiveSmallIntegerField(choices=ACTION_CHOICES)
+    changes = models.JSONField(
+        default=dict, blank=True, encoder=DjangoJSONEncoder
+    )
+
+    class Meta:
+        verbose_name_plural = "activities"
+        indexes = [
+            models.Index(
+                fields=["model", "object_id", "-id"],
+                name="activity_object_idx"
+            ),
+            models.Index(fields=["created_at"], name="activity_created_idx"),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.get_model_display()} {self.object_id} "
+            f"{self.get_action_display()}"
+        )
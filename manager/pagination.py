@@ -0,0 +1,184 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+# Everything a malformed cursor can raise while being decoded or compared.
+CURSOR_ERRORS = (InvalidCursor, ValidationError, ValueError, TypeError)
+
+
+def encode_cursor(direction, values):
+    data = json.dumps([direction, *values], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, size):
+    try:
+        data = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+    if (
+        not isinstance(data, list)
+        or len(data) != size + 1
+        or data[0] not in ("next", "prev")
+    ):
+        raise InvalidCursor(cursor)
+    return data[0], data[1:]
+
+
+FLIPPED = {"gt": "lt", "lt": "gt"}
+
+
+def field_name(field):
+    return field.lstrip("-")
+
+
+def reverse_ordering(ordering):
+    return [
+        field_name(field) if field.startswith("-") else f"-{field}"
+        for field in ordering
+    ]
+
+
+def keyset_filter(ordering, values, lookup):
+    """
+    Rows after ``values`` in ``ordering`` ("gt") or before them ("lt").
+    Fields prefixed with "-" are descending.
+    """
+
+    def bound(field, suffix=""):
+        name = field_name(field)
+        field_lookup = FLIPPED[lookup] if field.startswith("-") else lookup
+        return f"{name}__{field_lookup}{suffix}"
+
+    condition = Q()
+    for index, field in enumerate(ordering):
+        step = Q(**{bound(field): values[index]})
+        for previous, value in zip(ordering[:index], values):
+            step &= Q(**{field_name(previous): value})
+        condition |= step
+    # The redundant bound on the leading key lets the database walk an
+    # index on it in order instead of merging the OR branches and sorting.
+    return Q(**{bound(ordering[0], "e"): values[0]}) & condition
+
+
+class CursorPage:
+    def __init__(self, object_list, ordering, has_next, has_previous):
+        self.object_list = object_list
+        self.ordering = ordering
+        self.next_cursor = None
+        self.previous_cursor = None
+        if object_list and has_next:
+            self.next_cursor = encode_cursor(
+                "next", self.key(object_list[-1])
+            )
+        if object_list and has_previous:
+            self.previous_cursor = encode_cursor(
+                "prev", self.key(object_list[0])
+            )
+
+    def key(self, obj):
+        fields = [field_name(field) for field in self.ordering]
+        if isinstance(obj, dict):
+            return [obj[field] for field in fields]
+        return [getattr(obj, field) for field in fields]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+def cursor_window(queryset, ordering, page_size, cursor=None):
+    """
+    Return the (unevaluated) queryset of up to ``page_size + 1`` rows for
+    ``cursor`` and the direction it was read in.
+    """
+    if not cursor:
+        return queryset.order_by(*ordering)[:page_size + 1], None
+
+    direction, values = decode_cursor(cursor, len(ordering))
+    if direction == "next":
+        return (
+            queryset.filter(keyset_filter(ordering, values, "gt"))
+            .order_by(*ordering)[:page_size + 1]
+        ), direction
+    return (
+        queryset.filter(keyset_filter(ordering, values, "lt"))
+        .order_by(*reverse_ordering(ordering))[:page_size + 1]
+    ), direction
+
+
+def cursor_page(rows, ordering, page_size, direction):
+    if direction == "prev":
+        return CursorPage(
+            rows[:page_size][::-1], ordering, True, len(rows) > page_size
+        )
+    return CursorPage(
+        rows[:page_size],
+        ordering,
+        len(rows) > page_size,
+        direction == "next",
+    )
+
+
+def paginate_by_cursor(queryset, ordering, page_size, cursor=None):
+    """
+    Return a CursorPage of ``queryset`` ordered by ``ordering``, which
+    must end with a unique field such as "pk". Pages are fetched with
+    a keyset WHERE clause, so there is no COUNT(*) and no OFFSET scan.
+    """
+    window, direction = cursor_window(queryset, ordering, page_size, cursor)
+    return cursor_page(list(window), ordering, page_size, direction)
+
+
+async def apaginate_by_cursor(queryset, ordering, page_size, cursor=None):
+    window, direction = cursor_window(queryset, ordering, page_size, cursor)
+    rows = [row async for row in window]
+    return cursor_page(rows, ordering, page_size, direction)
+
+
+class CursorPaginationMixin:
+    pagination_mode = None
+    cursor_ordering = ("pk",)
+    cursor_kwarg = "cursor"
+
+    def get_pagination_mode(self):
+        return self.pagination_mode or settings.PAGINATION_MODE
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.get_pagination_mode() != "cursor":
+            return super().paginate_queryset(queryset, page_size)
+
+        try:
+            page = paginate_by_cursor(
+                queryset,
+                self.cursor_ordering,
+                page_size,
+                self.request.GET.get(self.cursor_kwarg),
+            )
+        except CURSOR_ERRORS:
+            raise Http404("Invalid cursor.")
+        return None, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,71 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class RoutingState:
+    def __init__(self, use_replica):
+        self.use_replica = use_replica
+        self.wrote = False
+
+
+# Set by ReplicaRoutingMiddleware for the request being handled. Outside
+# requests (management commands, the deadline scheduler) every query goes
+# to the primary.
+routing_state = ContextVar("routing_state", default=None)
+
+
+@contextmanager
+def read_from_primary():
+    """
+    Read from the primary inside the block. Wraps the queries whose results
+    are cached across requests: filled from a lagging replica, the cache
+    would keep rows older than a write it was just cleared for.
+    """
+    state = routing_state.get()
+    if state is None:
+        yield
+        return
+    use_replica = state.use_replica
+    state.use_replica = False
+    try:
+        yield
+    finally:
+        state.use_replica = use_replica
+
+
+class ReplicaRouter:
+    """
+    Send reads to a random alias of DATABASE_REPLICAS when the current
+    request allows it, and everything else to the primary. A request stops
+    reading from replicas as soon as it writes, and so does a transaction
+    open on the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = routing_state.get()
+        if (
+            state is None
+            or not state.use_replica
+            or state.wrote
+            or not settings.DATABASE_REPLICAS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
@@ -0,0 +1,116 @@
+import re
+
+from django.db import connections
+from django.db.models import Prefetch, Value, FloatField
+from django.db.models.expressions import RawSQL
+
+from manager.models import Task, Tag, TaskSearchDocument
+
+TERM_RE = re.compile(r"\w+")
+
+SQLITE_FILTER = (
+    "SELECT rowid FROM manager_task_fts WHERE manager_task_fts MATCH %s"
+)
+SQLITE_RANK = (
+    "SELECT rank FROM manager_task_fts "
+    "WHERE manager_task_fts MATCH %s AND rowid = manager_task.id"
+)
+POSTGRESQL_FILTER = (
+    "SELECT task_id FROM manager_tasksearchdocument "
+    "WHERE search_vector @@ to_tsquery('english', %s)"
+)
+POSTGRESQL_RANK = (
+    "SELECT -ts_rank(search_vector, to_tsquery('english', %s)) "
+    "FROM manager_tasksearchdocument WHERE task_id = manager_task.id"
+)
+
+
+def build_document(task):
+    parts = [task.name, task.description]
+    if task.project is not None:
+        parts.append(task.project.name)
+    parts.extend(tag.name for tag in task.tags.all())
+    return " ".join(parts)
+
+
+def document_queryset():
+    return Task.objects.select_related("project").only(
+        "name", "description", "project__name"
+    ).prefetch_related(
+        Prefetch("tags", queryset=Tag.objects.only("name"))
+    )
+
+
+def update_documents(task_ids, batch_size=500):
+    task_ids = list(task_ids)
+    for start in range(0, len(task_ids), batch_size):
+        tasks = document_queryset().filter(
+            pk__in=task_ids[start:start + batch_size]
+        )
+        TaskSearchDocument.objects.bulk_create(
+            [
+                TaskSearchDocument(task=task, document=build_document(task))
+                for task in tasks
+            ],
+            update_conflicts=True,
+            unique_fields=["task"],
+            update_fields=["document"],
+        )
+
+
+def rebuild_index(batch_size=500):
+    task_ids = Task.objects.values_list("pk", flat=True).order_by("pk")
+    count = 0
+    batch = []
+    for task_id in task_ids.iterator(chunk_size=batch_size):
+        batch.append(task_id)
+        if len(batch) >= batch_size:
+            update_documents(batch, batch_size)
+            count += len(batch)
+            batch = []
+    update_documents(batch, batch_size)
+    count += len(batch)
+
+    connection = connections[TaskSearchDocument.objects.db]
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO manager_task_fts(manager_task_fts) "
+                "VALUES ('rebuild')"
+            )
+            cursor.execute(
+                "INSERT INTO manager_task_fts(manager_task_fts) "
+                "VALUES ('optimize')"
+            )
+    return count
+
+
+def search_tasks(queryset, query):
+    """
+    Filter ``queryset`` down to tasks matching ``query`` and annotate them
+    with ``search_rank``, where lower values are better matches.
+    """
+    terms = TERM_RE.findall(query)
+    vendor = connections[queryset.db].vendor
+
+    if terms and vendor == "sqlite":
+        match = " ".join(f'"{term}"*' for term in terms)
+        return queryset.filter(
+            pk__in=RawSQL(SQLITE_FILTER, (match,))
+        ).annotate(
+            search_rank=RawSQL(SQLITE_RANK, (match,))
+        )
+
+    if terms and vendor == "postgresql":
+        match = " & ".join(f"{term}:*" for term in terms)
+        return queryset.filter(
+            pk__in=RawSQL(POSTGRESQL_FILTER, (match,))
+        ).annotate(
+            search_rank=RawSQL(POSTGRESQL_RANK, (match,))
+        )
+
+    return queryset.filter(
+        search_document__document__icontains=query
+    ).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
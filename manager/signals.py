@@ -0,0 +1,366 @@
+from django.contrib.auth.models import Group, Permission
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import Signal, receiver
+
+from manager import (
+    activity,
+    autocomplete,
+    dashboard,
+    deadlines,
+    search,
+    stats,
+    summary,
+    versions,
+)
+from manager.backends import (
+    bump_permission_generation,
+    invalidate_user_permissions,
+)
+from manager.models import (
+    Activity,
+    Task,
+    Project,
+    ProjectTaskStats,
+    Tag,
+    Team,
+    Worker,
+    WorkerTaskStats,
+)
+
+TRACKED_TASK_FIELDS = tuple(
+    dict.fromkeys((*stats.STATE_FIELDS, *activity.TASK_FIELDS))
+)
+
+# Sent after set-based writes (bulk_create, update(), through-table inserts)
+# that bypass the model signals below, with the ids of the tasks and teams
+# whose content changed and of the workers whose assignments or teams
+# changed. With sender=Worker the workers themselves were rewritten.
+bulk_changed = Signal()
+
+
+@receiver(bulk_changed)
+def bulk_change_applied(sender, task_ids=(), worker_ids=(), team_ids=(),
+                        **kwargs):
+    search.update_documents(task_ids)
+    stats.refresh_worker_stats(worker_ids)
+    summary.tasks_rewritten(task_ids)
+    dashboard.invalidate_dashboards(worker_ids)
+    versions.bump(Task, task_ids)
+    versions.bump(Team, team_ids)
+    if sender is Worker:
+        versions.bump(Worker, worker_ids)
+        versions.bump_dependents(Worker, worker_ids)
+        autocomplete.workers_rewritten()
+
+
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=Team)
+@receiver(pre_save, sender=Worker)
+def versioned_saving(sender, instance, raw=False, update_fields=None,
+                     **kwargs):
+    if raw or instance._state.adding:
+        return
+    if update_fields is None or "version" in update_fields:
+        # Incremented by the UPDATE itself, so that a bump() made since the
+        # instance was loaded is not overwritten with a stale number.
+        instance.version = F("version") + 1
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Worker)
+def versioned_saved(sender, instance, created, raw=False, update_fields=None,
+                    **kwargs):
+    # Logging in only changes last_login, which no fragment shows.
+    if created or raw or update_fields == {"last_login"}:
+        return
+    if update_fields is not None and "version" not in update_fields:
+        versions.bump(sender, [instance.pk])
+    instance.version = sender.objects.values_list(
+        "version", flat=True
+    ).get(pk=instance.pk)
+
+
+def displayed_object_saved(sender, instance, created, raw=False,
+                           update_fields=None, **kwargs):
+    if not created and not raw and update_fields != {"last_login"}:
+        versions.bump_dependents(sender, [instance.pk])
+
+
+def displayed_object_deleting(sender, instance, **kwargs):
+    versions.bump_dependents(sender, [instance.pk])
+
+
+def versioned_relation_changed(sender, instance, action, reverse, pk_set,
+                               **kwargs):
+    versions.relation_changed(sender, instance, action, reverse, pk_set)
+
+
+for model in versions.DEPENDENTS:
+    post_save.connect(displayed_object_saved, sender=model)
+    pre_delete.connect(displayed_object_deleting, sender=model)
+
+for through in versions.OWNERS:
+    m2m_changed.connect(versioned_relation_changed, sender=through)
+
+
+@receiver(pre_save, sender=Task)
+def task_saving(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance.is_overdue = stats.is_overdue(
+        instance.is_completed, instance.deadline
+    )
+    if instance.pk is not None:
+        instance._previous_state = Task.objects.filter(
+            pk=instance.pk
+        ).values(*TRACKED_TASK_FIELDS).first()
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    search.update_documents([instance.pk])
+    previous_state = instance.__dict__.pop("_previous_state", None)
+    activity.task_saved(instance, previous_state)
+    if previous_state is None:
+        summary.task_added(instance)
+        return
+    stats.task_changed(instance, previous_state)
+    summary.task_changed(instance, previous_state)
+    if instance.is_overdue and not previous_state["is_overdue"]:
+        deadlines.task_flagged(instance)
+    if (
+        previous_state["project_id"] != instance.project_id
+        or previous_state["is_completed"] != instance.is_completed
+    ):
+        dashboard.invalidate_dashboards(
+            dashboard.task_worker_ids([instance.pk])
+        )
+
+
+@receiver(pre_delete, sender=Task)
+def task_deleting(sender, instance, **kwargs):
+    instance._assigned_worker_ids = stats.assigned_worker_ids(instance.pk)
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    worker_ids = instance.__dict__.pop("_assigned_worker_ids", [])
+    stats.assignments_changed(instance, False, worker_ids, -1)
+    summary.task_removed(instance, worker_ids)
+    dashboard.invalidate_dashboards(worker_ids)
+    activity.record(
+        Activity.TASK, instance.pk, Activity.DELETED, {"name": instance.name}
+    )
+
+
+@receiver(m2m_changed, sender=Task.assigned.through)
+def task_assigned_changed(sender, instance, action, reverse, pk_set,
+                          **kwargs):
+    if action in ("pre_remove", "pre_clear"):
+        assignments = sender.objects.filter(
+            **{"worker_id" if reverse else "task_id": instance.pk}
+        )
+        if action == "pre_remove":
+            assignments = assignments.filter(
+                **{"task_id__in" if reverse else "worker_id__in": pk_set}
+            )
+        instance._unassigned_ids = set(assignments.values_list(
+            "task_id" if reverse else "worker_id", flat=True
+        ))
+    elif action == "post_add":
+        stats.assignments_changed(instance, reverse, pk_set, 1)
+        summary.assignments_changed(instance, reverse, pk_set, 1)
+        activity.relation_changed(
+            Activity.TASK, instance, reverse, pk_set, "workers", True
+        )
+        dashboard.invalidate_dashboards([instance.pk] if reverse else pk_set)
+    elif action in ("post_remove", "post_clear"):
+        unassigned_ids = instance.__dict__.pop("_unassigned_ids", set())
+        stats.assignments_changed(instance, reverse, unassigned_ids, -1)
+        summary.assignments_changed(instance, reverse, unassigned_ids, -1)
+        activity.relation_changed(
+            Activity.TASK, instance, reverse, unassigned_ids, "workers",
+            False,
+        )
+        if unassigned_ids:
+            dashboard.invalidate_dashboards(
+                [instance.pk] if reverse else unassigned_ids
+            )
+
+
+@receiver(post_save, sender=Worker)
+def worker_saved(sender, instance, created, **kwargs):
+    if created:
+        WorkerTaskStats.objects.bulk_create(
+            [WorkerTaskStats(worker=instance)], ignore_conflicts=True
+        )
+    update_fields = kwargs.get("update_fields")
+    if update_fields == {"last_login"}:
+        return
+    autocomplete.worker_saved(instance)
+    if not kwargs.get("raw"):
+        activity.record(
+            Activity.WORKER,
+            instance.pk,
+            Activity.CREATED if created else Activity.UPDATED,
+            {"fields": sorted(update_fields)} if update_fields else {},
+        )
+    if not created:
+        invalidate_user_permissions([instance.pk])
+
+
+@receiver(post_delete, sender=Worker)
+def worker_deleted(sender, instance, **kwargs):
+    autocomplete.worker_deleted(instance.pk)
+    activity.record(Activity.WORKER, instance.pk, Activity.DELETED)
+
+
+@receiver(m2m_changed, sender=Worker.groups.through)
+@receiver(m2m_changed, sender=Worker.user_permissions.through)
+def worker_permissions_changed(sender, instance, action, reverse, pk_set,
+                               **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user_permissions([instance.pk])
+    elif pk_set:
+        invalidate_user_permissions(pk_set)
+    else:
+        bump_permission_generation()
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def group_permissions_changed(sender, **kwargs):
+    if kwargs.get("action", "post_").startswith("post_"):
+        bump_permission_generation()
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def task_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        instance._cleared_task_ids = list(
+            instance.tasks.values_list("pk", flat=True)
+        )
+    elif action in ("post_add", "post_remove"):
+        search.update_documents(pk_set if reverse else [instance.pk])
+    elif action == "post_clear":
+        search.update_documents(
+            instance.__dict__.pop("_cleared_task_ids", [])
+            if reverse else [instance.pk]
+        )
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance, created, raw=False, **kwargs):
+    if created:
+        ProjectTaskStats.objects.bulk_create(
+            [ProjectTaskStats(project=instance)], ignore_conflicts=True
+        )
+    elif not raw:
+        search.update_documents(
+            instance.tasks.values_list("pk", flat=True)
+        )
+        dashboard.invalidate_dashboards(
+            dashboard.project_worker_ids(instance.pk)
+        )
+
+
+@receiver(post_save, sender=Tag)
+def tag_saved(sender, instance, created, raw=False, **kwargs):
+    if not created and not raw:
+        search.update_documents(
+            instance.tasks.values_list("pk", flat=True)
+        )
+
+
+@receiver(pre_delete, sender=Tag)
+def tag_deleting(sender, instance, **kwargs):
+    instance._tagged_task_ids = list(
+        instance.tasks.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Tag)
+def tag_deleted(sender, instance, **kwargs):
+    search.update_documents(instance.__dict__.pop("_tagged_task_ids", []))
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def team_members_changed(sender, instance, action, reverse, pk_set,
+                         **kwargs):
+    if action == "pre_clear":
+        instance._cleared_member_ids = list(
+            sender.objects.filter(worker_id=instance.pk)
+            .values_list("team_id", flat=True)
+            if reverse else dashboard.team_member_ids(instance.pk)
+        )
+    elif action in ("post_add", "post_remove"):
+        dashboard.invalidate_dashboards([instance.pk] if reverse else pk_set)
+        activity.relation_changed(
+            Activity.TEAM, instance, reverse, pk_set, "members",
+            action == "post_add",
+        )
+    elif action == "post_clear":
+        cleared_ids = instance.__dict__.pop("_cleared_member_ids", [])
+        dashboard.invalidate_dashboards(
+            [instance.pk] if reverse else cleared_ids
+        )
+        activity.relation_changed(
+            Activity.TEAM, instance, reverse, cleared_ids, "members", False
+        )
+
+
+@receiver(m2m_changed, sender=Team.project.through)
+def team_projects_changed(sender, instance, action, reverse, pk_set,
+                          **kwargs):
+    if action == "pre_clear":
+        instance._cleared_link_ids = list(sender.objects.filter(
+            **{"project_id" if reverse else "team_id": instance.pk}
+        ).values_list("team_id" if reverse else "project_id", flat=True))
+    elif action in ("post_add", "post_remove"):
+        activity.relation_changed(
+            Activity.TEAM, instance, reverse, pk_set, "projects",
+            action == "post_add",
+        )
+    elif action == "post_clear":
+        activity.relation_changed(
+            Activity.TEAM, instance, reverse,
+            instance.__dict__.pop("_cleared_link_ids", []), "projects",
+            False,
+        )
+
+
+@receiver(post_save, sender=Team)
+def team_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if not created:
+        dashboard.invalidate_dashboards(
+            dashboard.team_member_ids(instance.pk)
+        )
+    activity.record(
+        Activity.TEAM,
+        instance.pk,
+        Activity.CREATED if created else Activity.UPDATED,
+        {"name": instance.name},
+    )
+
+
+@receiver(pre_delete, sender=Team)
+def team_deleting(sender, instance, **kwargs):
+    dashboard.invalidate_dashboards(dashboard.team_member_ids(instance.pk))
+    activity.record(
+        Activity.TEAM, instance.pk, Activity.DELETED, {"name": instance.name}
+    )
@@ -0,0 +1,86 @@
+// Search-as-you-type picker for <select data-search-url> elements rendered
+// by manager.widgets.SearchSelect and SearchSelectMultiple. The select only
+// holds the chosen options; matches are fetched page by page from the JSON
+// endpoint and added to it when clicked.
+(function () {
+  "use strict";
+
+  function label(row, fields) {
+    return fields.map(function (field) { return row[field]; })
+      .filter(Boolean).join(" ");
+  }
+
+  function enhance(select) {
+    var fields = select.dataset.labelFields.split(",");
+    var input = document.createElement("input");
+    var results = document.createElement("div");
+    var timer = null;
+    input.type = "search";
+    input.className = "form-control mb-1";
+    input.placeholder = "Type to search";
+    results.className = "list-group mb-2";
+    select.parentNode.insertBefore(input, select);
+    select.parentNode.insertBefore(results, select.nextSibling);
+
+    function choose(row) {
+      var value = String(row.id);
+      var option = Array.prototype.find.call(select.options, function (o) {
+        return o.value === value;
+      });
+      if (!option) {
+        option = new Option(label(row, fields), value);
+        select.add(option);
+      }
+      option.selected = true;
+    }
+
+    function show(url, append) {
+      fetch(url, {credentials: "same-origin"})
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+          if (!append) {
+            results.innerHTML = "";
+          }
+          data.results.forEach(function (row) {
+            var item = document.createElement("button");
+            item.type = "button";
+            item.className = "list-group-item list-group-item-action";
+            item.textContent = label(row, fields);
+            item.addEventListener("click", function () { choose(row); });
+            results.appendChild(item);
+          });
+          if (data.next) {
+            var more = document.createElement("button");
+            more.type = "button";
+            more.className = "list-group-item list-group-item-light";
+            more.textContent = "More…";
+            more.addEventListener("click", function () {
+              results.removeChild(more);
+              show(data.next, true);
+            });
+            results.appendChild(more);
+          }
+        });
+    }
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () {
+        var term = input.value.trim();
+        if (!term) {
+          results.innerHTML = "";
+          return;
+        }
+        var params = new URLSearchParams({
+          limit: 20, fields: ["id"].concat(fields).join(",")
+        });
+        params.set(select.dataset.searchParam, term);
+        show(select.dataset.searchUrl + "?" + params, false);
+      }, 200);
+    });
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll("select[data-search-url]").forEach(enhance);
+  });
+})();
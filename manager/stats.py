@@ -0,0 +1,182 @@
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from manager.models import Task, Worker, WorkerTaskStats
+
+PRIORITY_COUNTERS = {
+    "urgent": "urgent_open",
+    "high": "high_open",
+    "medium": "medium_open",
+    "low": "low_open",
+}
+COUNTER_FIELDS = (
+    "open_tasks",
+    "completed_tasks",
+    "overdue_tasks",
+    *PRIORITY_COUNTERS.values(),
+)
+# The stored is_overdue flag rather than the deadline, so that the counters
+# a task added are the ones it takes back later, whatever the date is then.
+STATE_FIELDS = ("is_completed", "priority", "is_overdue")
+
+Assignment = Task.assigned.through
+
+
+def is_overdue(is_completed, deadline, today=None):
+    deadline = Task._meta.get_field("deadline").to_python(deadline)
+    return not is_completed and deadline < (today or timezone.localdate())
+
+
+def task_counters(is_completed, priority, is_overdue):
+    counters = dict.fromkeys(COUNTER_FIELDS, 0)
+    if is_completed:
+        counters["completed_tasks"] = 1
+        return counters
+
+    counters["open_tasks"] = 1
+    if is_overdue:
+        counters["overdue_tasks"] = 1
+    if priority in PRIORITY_COUNTERS:
+        counters[PRIORITY_COUNTERS[priority]] = 1
+    return counters
+
+
+def task_state(task):
+    return {field: getattr(task, field) for field in STATE_FIELDS}
+
+
+def combine(*counters, sign=1):
+    total = dict.fromkeys(COUNTER_FIELDS, 0)
+    for counter in counters:
+        for field, value in counter.items():
+            total[field] += sign * value
+    return total
+
+
+def apply_delta(worker_ids, delta):
+    worker_ids = set(worker_ids)
+    changes = {
+        field: F(field) + value for field, value in delta.items() if value
+    }
+    if not worker_ids or not changes:
+        return
+    updated = WorkerTaskStats.objects.filter(
+        worker_id__in=worker_ids
+    ).update(**changes, updated_at=timezone.now())
+    if updated < len(worker_ids):
+        refresh_worker_stats(worker_ids)
+
+
+def assigned_worker_ids(task_id):
+    return list(
+        Assignment.objects.filter(task_id=task_id)
+        .values_list("worker_id", flat=True)
+    )
+
+
+def task_changed(task, previous_state):
+    delta = combine(
+        task_counters(**task_state(task)),
+        combine(
+            task_counters(
+                **{field: previous_state[field] for field in STATE_FIELDS}
+            ),
+            sign=-1,
+        ),
+    )
+    if any(delta.values()):
+        apply_delta(assigned_worker_ids(task.pk), delta)
+
+
+def assignments_changed(instance, reverse, pk_set, sign):
+    if not pk_set:
+        return
+    if not reverse:
+        counters = task_counters(**task_state(instance))
+        apply_delta(pk_set, combine(counters, sign=sign))
+        return
+
+    tasks = Task.objects.filter(pk__in=pk_set).values(*STATE_FIELDS)
+    apply_delta(
+        [instance.pk],
+        combine(*(task_counters(**task) for task in tasks), sign=sign)
+    )
+
+
+def counter_annotations(relation):
+    """
+    Return the ``COUNTER_FIELDS`` as Count annotations over the tasks
+    reached through ``relation``. Overdue tasks are counted from the
+    stored flag, like task_counters() does.
+    """
+
+    def count(**lookups):
+        return Count(relation, filter=Q(**{
+            f"{relation}__{lookup}": value
+            for lookup, value in lookups.items()
+        }))
+
+    annotations = {
+        "open_tasks": count(is_completed=False),
+        "completed_tasks": count(is_completed=True),
+        "overdue_tasks": count(is_completed=False, is_overdue=True),
+    }
+    for priority, field in PRIORITY_COUNTERS.items():
+        annotations[field] = count(is_completed=False, priority=priority)
+    return annotations
+
+
+def compute_stats(worker_ids):
+    return Worker.objects.filter(pk__in=worker_ids).annotate(
+        **counter_annotations("assigned_tasks")
+    ).values("pk", *COUNTER_FIELDS)
+
+
+def refresh_worker_stats(worker_ids, batch_size=500):
+    """
+    Recompute the counters of ``worker_ids`` from the Task table and
+    write back the rows that drifted. Returns the number of rows written.
+    """
+    worker_ids = list(set(worker_ids))
+    if len(worker_ids) > batch_size:
+        return sum(
+            refresh_worker_stats(worker_ids[start:start + batch_size])
+            for start in range(0, len(worker_ids), batch_size)
+        )
+
+    expected = {row.pop("pk"): row for row in compute_stats(worker_ids)}
+    current = {
+        stats.worker_id: stats
+        for stats in WorkerTaskStats.objects.filter(worker_id__in=expected)
+    }
+    stale = [
+        WorkerTaskStats(worker_id=worker_id, **counters)
+        for worker_id, counters in expected.items()
+        if worker_id not in current or any(
+            getattr(current[worker_id], field) != value
+            for field, value in counters.items()
+        )
+    ]
+    WorkerTaskStats.objects.bulk_create(
+        stale,
+        update_conflicts=True,
+        unique_fields=["worker"],
+        update_fields=[*COUNTER_FIELDS, "updated_at"],
+    )
+    return len(stale)
+
+
+def reconcile(batch_size=500):
+    checked = repaired = 0
+    worker_ids = Worker.objects.values_list("pk", flat=True).order_by("pk")
+    batch = []
+    for worker_id in worker_ids.iterator(chunk_size=batch_size):
+        batch.append(worker_id)
+        if len(batch) >= batch_size:
+            repaired += refresh_worker_stats(batch, batch_size)
+            checked += len(batch)
+            batch = []
+    if batch:
+        repaired += refresh_worker_stats(batch, batch_size)
+        checked += len(batch)
+    return checked, repaired
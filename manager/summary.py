@@ -0,0 +1,266 @@
+from django.db import transaction
+from django.db.models import F, Prefetch
+from django.utils import timezone
+
+from manager import stats
+from manager.models import (
+    Project,
+    ProjectMemberStats,
+    ProjectTaskStats,
+    Task,
+    Worker,
+)
+
+MEMBER_FIELDS = ("open_tasks", "overdue_tasks")
+
+Assignment = Task.assigned.through
+
+
+def increments(delta, fields):
+    return {
+        field: F(field) + delta[field] for field in fields if delta[field]
+    }
+
+
+def adds_tasks(delta, fields):
+    # A missing row stands for zero counters, so it only needs repairing
+    # when something is added. Removals without a row come from cascades
+    # that are deleting the row's project.
+    return any(delta[field] > 0 for field in fields)
+
+
+def apply_project_delta(project_id, delta):
+    changes = increments(delta, stats.COUNTER_FIELDS)
+    if project_id is None or not changes:
+        return
+    updated = ProjectTaskStats.objects.filter(project_id=project_id).update(
+        **changes, updated_at=timezone.now()
+    )
+    if not updated and adds_tasks(delta, stats.COUNTER_FIELDS):
+        refresh_project_stats([project_id])
+
+
+def apply_member_delta(project_id, worker_ids, delta):
+    worker_ids = set(worker_ids)
+    changes = increments(delta, MEMBER_FIELDS)
+    if project_id is None or not worker_ids or not changes:
+        return
+    updated = ProjectMemberStats.objects.filter(
+        project_id=project_id, worker_id__in=worker_ids
+    ).update(**changes, updated_at=timezone.now())
+    if updated < len(worker_ids) and adds_tasks(delta, MEMBER_FIELDS):
+        refresh_member_stats(project_id, worker_ids)
+
+
+def task_added(task):
+    apply_project_delta(
+        task.project_id, stats.task_counters(**stats.task_state(task))
+    )
+
+
+def task_changed(task, previous_state):
+    before = stats.task_counters(
+        **{field: previous_state[field] for field in stats.STATE_FIELDS}
+    )
+    after = stats.task_counters(**stats.task_state(task))
+    if previous_state["project_id"] == task.project_id:
+        moves = [
+            (task.project_id,
+             stats.combine(after, stats.combine(before, sign=-1))),
+        ]
+    else:
+        moves = [
+            (previous_state["project_id"], stats.combine(before, sign=-1)),
+            (task.project_id, after),
+        ]
+    moves = [
+        (project_id, delta) for project_id, delta in moves
+        if project_id is not None and any(delta.values())
+    ]
+    if not moves:
+        return
+    worker_ids = stats.assigned_worker_ids(task.pk)
+    for project_id, delta in moves:
+        apply_project_delta(project_id, delta)
+        apply_member_delta(project_id, worker_ids, delta)
+
+
+def task_removed(task, worker_ids):
+    delta = stats.combine(
+        stats.task_counters(**stats.task_state(task)), sign=-1
+    )
+    apply_project_delta(task.project_id, delta)
+    apply_member_delta(task.project_id, worker_ids, delta)
+
+
+def assignments_changed(instance, reverse, pk_set, sign):
+    if not pk_set:
+        return
+    if not reverse:
+        apply_member_delta(
+            instance.project_id,
+            pk_set,
+            stats.combine(
+                stats.task_counters(**stats.task_state(instance)), sign=sign
+            ),
+        )
+        return
+
+    by_project = {}
+    tasks = Task.objects.filter(
+        pk__in=pk_set, project__isnull=False
+    ).values("project_id", *stats.STATE_FIELDS)
+    for task in tasks:
+        by_project.setdefault(task.pop("project_id"), []).append(
+            stats.task_counters(**task)
+        )
+    for project_id, counters in by_project.items():
+        apply_member_delta(
+            project_id, [instance.pk], stats.combine(*counters, sign=sign)
+        )
+
+
+def compute_member_stats(project_ids, worker_ids=None):
+    annotations = stats.counter_annotations("task")
+    assignments = Assignment.objects.filter(task__project_id__in=project_ids)
+    if worker_ids is not None:
+        assignments = assignments.filter(worker_id__in=worker_ids)
+    return assignments.values("task__project_id", "worker_id").annotate(
+        **{field: annotations[field] for field in MEMBER_FIELDS}
+    ).order_by()
+
+
+def refresh_member_stats(project_id, worker_ids):
+    expected = {
+        row["worker_id"]: row
+        for row in compute_member_stats([project_id], worker_ids)
+    }
+    ProjectMemberStats.objects.bulk_create(
+        [
+            ProjectMemberStats(
+                project_id=project_id,
+                worker_id=worker_id,
+                **{
+                    field: expected.get(worker_id, {}).get(field, 0)
+                    for field in MEMBER_FIELDS
+                },
+            )
+            for worker_id in worker_ids
+        ],
+        update_conflicts=True,
+        unique_fields=["project", "worker"],
+        update_fields=[*MEMBER_FIELDS, "updated_at"],
+    )
+
+
+@transaction.atomic
+def refresh_project_stats(project_ids):
+    """
+    Recompute the project and per-member summaries of ``project_ids``
+    from the Task table, counting overdue tasks from their stored flag
+    like the incremental updates do.
+    """
+    project_ids = list(set(project_ids))
+    rows = Project.objects.filter(pk__in=project_ids).annotate(
+        **stats.counter_annotations("tasks")
+    ).values("pk", *stats.COUNTER_FIELDS)
+    ProjectTaskStats.objects.bulk_create(
+        [ProjectTaskStats(project_id=row.pop("pk"), **row) for row in rows],
+        update_conflicts=True,
+        unique_fields=["project"],
+        update_fields=[*stats.COUNTER_FIELDS, "updated_at"],
+    )
+    ProjectMemberStats.objects.filter(project_id__in=project_ids).delete()
+    ProjectMemberStats.objects.bulk_create(
+        [
+            ProjectMemberStats(
+                project_id=row.pop("task__project_id"), **row
+            )
+            for row in compute_member_stats(project_ids)
+        ],
+        batch_size=500,
+    )
+
+
+def tasks_rewritten(task_ids):
+    project_ids = Task.objects.filter(
+        pk__in=task_ids, project__isnull=False
+    ).values_list("project_id", flat=True).distinct()
+    project_ids = list(project_ids)
+    if project_ids:
+        refresh_project_stats(project_ids)
+
+
+def rebuild(batch_size=100):
+    rebuilt = 0
+    project_ids = Project.objects.values_list("pk", flat=True).order_by("pk")
+    batch = []
+    for project_id in project_ids.iterator(chunk_size=batch_size):
+        batch.append(project_id)
+        if len(batch) >= batch_size:
+            refresh_project_stats(batch)
+            rebuilt += len(batch)
+            batch = []
+    if batch:
+        refresh_project_stats(batch)
+        rebuilt += len(batch)
+    return rebuilt
+
+
+def team_workload(project):
+    """
+    Return the open and overdue task counts of ``project`` for each member
+    of the teams working on it, read from the member summary. Assignees
+    outside those teams are listed under ``others``.
+    """
+    member_stats = {
+        row.worker_id: row
+        for row in ProjectMemberStats.objects.filter(
+            project_id=project.pk
+        ).select_related("worker").only(
+            "open_tasks", "overdue_tasks",
+            "worker__username", "worker__first_name", "worker__last_name",
+        )
+    }
+    teams = []
+    seen = set()
+    teams_queryset = project.teams.prefetch_related(
+        Prefetch(
+            "members",
+            queryset=Worker.objects.only(
+                "username", "first_name", "last_name"
+            ),
+        )
+    ).order_by("name")
+    for team in teams_queryset:
+        members = []
+        for member in team.members.all():
+            row = member_stats.get(member.pk)
+            members.append({
+                "worker": member,
+                "open_tasks": row.open_tasks if row else 0,
+                "overdue_tasks": row.overdue_tasks if row else 0,
+            })
+            seen.add(member.pk)
+        members.sort(key=lambda member: -member["open_tasks"])
+        teams.append({
+            "team": team,
+            "members": members,
+            "open_tasks": sum(member["open_tasks"] for member in members),
+            "overdue_tasks": sum(
+                member["overdue_tasks"] for member in members
+            ),
+        })
+    others = sorted(
+        (
+            {
+                "worker": row.worker,
+                "open_tasks": row.open_tasks,
+                "overdue_tasks": row.overdue_tasks,
+            }
+            for worker_id, row in member_stats.items()
+            if worker_id not in seen and row.open_tasks
+        ),
+        key=lambda member: -member["open_tasks"],
+    )
+    return {"teams": teams, "others": others}
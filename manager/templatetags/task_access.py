@@ -0,0 +1,15 @@
+from django import template
+
+from manager import access
+
+register = template.Library()
+
+
+@register.filter
+def can_complete(task, user):
+    return access.can_complete(user, task)
+
+
+@register.filter
+def can_edit(task, user):
+    return access.can_edit(user, task)
@@ -0,0 +1,77 @@
+from datetime import date
+
+from django.contrib.auth.models import AnonymousUser
+from django.template import Context, Template
+from django.test import TestCase
+
+from company_task_manager.manager import access
+from company_task_manager.manager.models import Task, TaskType, Worker
+
+
+class TaskAccessTest(TestCase):
+    def setUp(self):
+        self.user = Worker.objects.create_user(
+            username="user", password="password"
+        )
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today(),
+            priority="low",
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+        self.task.assigned.add(self.user)
+        self.other_task = Task.objects.create(
+            name="Other",
+            description="Description",
+            deadline=date.today(),
+            priority="low",
+            task_type=self.task.task_type,
+        )
+
+    def test_is_assigned_uses_single_exists_query(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(access.is_assigned(self.user, self.task))
+
+    def test_is_assigned_uses_prefetched_workers(self):
+        task = Task.objects.prefetch_related("assigned").get(pk=self.task.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(access.is_assigned(self.user, task))
+
+    def test_can_complete(self):
+        admin = Worker.objects.create_superuser(
+            username="admin", password="password"
+        )
+
+        self.assertTrue(access.can_complete(self.user, self.task))
+        self.assertFalse(access.can_complete(self.user, self.other_task))
+        self.assertTrue(access.can_complete(admin, self.other_task))
+        self.assertFalse(access.can_complete(AnonymousUser(), self.task))
+
+        self.task.is_completed = True
+        self.assertFalse(access.can_complete(self.user, self.task))
+
+    def test_completable(self):
+        self.assertEqual(
+            list(access.completable(self.user, Task.objects.all())),
+            [self.task],
+        )
+
+    def test_viewable_and_editable(self):
+        tasks = Task.objects.order_by("pk")
+
+        for narrow in (access.viewable, access.editable):
+            self.assertEqual(
+                list(narrow(self.user, tasks)), [self.task, self.other_task]
+            )
+            self.assertFalse(narrow(AnonymousUser(), tasks).exists())
+
+    def test_template_filters(self):
+        template = Template(
+            "{% load task_access %}"
+            "{{ task|can_complete:user }} {{ task|can_edit:user }}"
+        )
+        context = Context({"task": self.other_task, "user": self.user})
+
+        self.assertEqual(template.render(context), "False True")
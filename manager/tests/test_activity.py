@@ -0,0 +1,194 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from company_task_manager.manager import activity
+from company_task_manager.manager.bulk import apply_action
+from company_task_manager.manager.models import (
+    Activity,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+
+def activity_inserts(queries):
+    return [
+        query for query in queries
+        if query["sql"].startswith('INSERT INTO "manager_activity"')
+    ]
+
+
+class ActivityLogTest(TestCase):
+    def setUp(self):
+        # Events are flushed when the enclosing transaction commits, which
+        # inside a TestCase only happens for captured on_commit hooks.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker = Worker.objects.create_user(
+                username="worker", password="password"
+            )
+            self.other = Worker.objects.create(username="other")
+            self.task = Task.objects.create(
+                name="Task",
+                description="Description",
+                deadline=date.today() + timedelta(days=3),
+                priority="low",
+                task_type=TaskType.objects.create(name="Bug"),
+            )
+            self.task.assigned.add(self.worker)
+        Activity.objects.all().delete()
+
+    def events(self, model=Activity.TASK, object_id=None):
+        return list(
+            Activity.objects.filter(
+                model=model, object_id=object_id or self.task.pk
+            ).order_by("id").values_list("actor__username", "action",
+                                         "changes")
+        )
+
+    def test_events_wait_for_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.task.priority = "high"
+            self.task.save()
+            self.assertFalse(Activity.objects.exists())
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(
+            self.events(), [(None, Activity.UPDATED, {"priority": "high"})]
+        )
+
+    def test_complete_view_logs_with_one_insert(self):
+        self.client.force_login(self.worker)
+        url = reverse("manager:task-complete", kwargs={"pk": self.task.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(url)
+
+        self.assertEqual(len(activity_inserts(queries)), 1)
+        self.assertEqual(
+            self.events()[-1],
+            ("worker", Activity.COMPLETED, {"is_completed": True}),
+        )
+
+    def test_one_insert_per_transaction(self):
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    self.task.assigned.add(self.other)
+                    self.task.deadline = date(2030, 1, 1)
+                    self.task.description = "Changed"
+                    self.task.save()
+                    self.task.assigned.remove(self.worker)
+
+        self.assertEqual(len(activity_inserts(queries)), 1)
+        self.assertEqual(self.events(), [
+            (None, Activity.ASSIGNED, {"workers": [self.other.pk]}),
+            (None, Activity.UPDATED,
+             {"deadline": "2030-01-01", "description": None}),
+            (None, Activity.UNASSIGNED, {"workers": [self.worker.pk]}),
+        ])
+
+    def test_rolled_back_savepoint_drops_its_events(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                activity.record(Activity.TASK, 1, Activity.UPDATED)
+                try:
+                    with transaction.atomic():
+                        activity.record(Activity.TASK, 2, Activity.UPDATED)
+                        raise ValueError
+                except ValueError:
+                    pass
+                activity.record(Activity.TASK, 3, Activity.UPDATED)
+
+        self.assertEqual(
+            list(Activity.objects.values_list("object_id", flat=True)),
+            [1, 3],
+        )
+
+    def test_bulk_actions_and_teams_are_logged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            team = Team.objects.create(name="Core")
+            apply_action(self.worker, Task.objects.all(), "complete")
+            team.members.add(self.worker)
+            self.worker.teams.clear()
+            team.delete()
+
+        self.assertEqual(
+            self.events()[-1],
+            (None, Activity.COMPLETED, {"is_completed": True}),
+        )
+        self.assertEqual(
+            [event[1:] for event in self.events(Activity.TEAM, team.pk)],
+            [
+                (Activity.CREATED, {"name": "Core"}),
+                (Activity.ASSIGNED, {"members": [self.worker.pk]}),
+                (Activity.UNASSIGNED, {"members": [self.worker.pk]}),
+                (Activity.DELETED, {"name": "Core"}),
+            ],
+        )
+
+    def test_history_view_pages_newest_first(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            activity.record_many(
+                Activity.TASK, [self.task.pk] * 24, Activity.UPDATED
+            )
+        self.client.force_login(self.worker)
+        url = reverse("manager:task-history", kwargs={"pk": self.task.pk})
+
+        response = self.client.get(url)
+        first_page = list(response.context["object_list"])
+        self.assertEqual(len(first_page), 20)
+        self.assertEqual(
+            [event.pk for event in first_page],
+            sorted((event.pk for event in first_page), reverse=True),
+        )
+
+        cursor = response.context["page_obj"].next_cursor
+        response = self.client.get(url, {"cursor": cursor})
+        second_page = list(response.context["object_list"])
+        self.assertEqual(len(second_page), 4)
+        self.assertLess(second_page[0].pk, first_page[-1].pk)
+
+    def test_compact_and_purge(self):
+        old = timezone.now() - timedelta(days=60)
+        expired = timezone.now() - timedelta(days=400)
+        Activity.objects.bulk_create([
+            Activity(model=Activity.TASK, object_id=1, created_at=old,
+                     action=Activity.UPDATED, changes={"priority": "high"}),
+            Activity(model=Activity.TASK, object_id=1, created_at=old,
+                     action=Activity.UPDATED, changes={"name": "A"}),
+            Activity(model=Activity.TASK, object_id=1, created_at=old,
+                     action=Activity.UPDATED, changes={"priority": "low"}),
+            Activity(model=Activity.TASK, object_id=1, created_at=old,
+                     action=Activity.COMPLETED),
+            Activity(model=Activity.TASK, object_id=1,
+                     action=Activity.UPDATED, changes={"name": "B"}),
+            Activity(model=Activity.TASK, object_id=2, created_at=expired,
+                     action=Activity.CREATED),
+        ])
+        out = StringIO()
+
+        call_command("compact_activity", stdout=out)
+
+        self.assertIn(
+            "Deleted 1 expired events, merged 2 edits", out.getvalue()
+        )
+        self.assertEqual(
+            list(Activity.objects.order_by("id").values_list(
+                "object_id", "action", "changes"
+            )),
+            [
+                (1, Activity.UPDATED, {"priority": "low", "name": "A"}),
+                (1, Activity.COMPLETED, {}),
+                (1, Activity.UPDATED, {"name": "B"}),
+            ],
+        )
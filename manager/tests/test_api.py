@@ -0,0 +1,148 @@
+import json
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+
+class TaskApiTest(TestCase):
+    def setUp(self):
+        self.user = Worker.objects.create_user(
+            username="user", password="password"
+        )
+        task_type = TaskType.objects.create(name="Bug")
+        project = Project.objects.create(name="Apollo", description="")
+        tag = Tag.objects.create(name="backend")
+        self.tasks = []
+        for i in range(7):
+            task = Task.objects.create(
+                name=f"Task {i}",
+                description="Description",
+                deadline=date.today() + timedelta(days=i),
+                priority="high",
+                task_type=task_type,
+                project=project,
+            )
+            task.tags.add(tag)
+            self.tasks.append(task)
+        self.tasks[0].assigned.add(self.user)
+        self.client.force_login(self.user)
+
+    def get(self, **params):
+        response = self.client.get(reverse("manager:api-task-list"), params)
+        return response, response.json()
+
+    def test_requires_login(self):
+        self.client.logout()
+        response = self.client.get(reverse("manager:api-task-list"))
+        self.assertEqual(response.status_code, 403)
+
+    def test_list_serializes_related_names(self):
+        with self.assertNumQueries(5):
+            response, data = self.get(limit=2)
+
+        self.assertEqual(response.status_code, 200)
+        first = data["results"][0]
+        self.assertEqual(first["name"], "Task 0")
+        self.assertEqual(first["project"], "Apollo")
+        self.assertEqual(first["task_type"], "Bug")
+        self.assertEqual(first["assigned"], ["user"])
+        self.assertEqual(first["tags"], ["backend"])
+        self.assertEqual(data["results"][1]["assigned"], [])
+        self.assertIsNone(data["previous"])
+
+    def test_sparse_fields(self):
+        with self.assertNumQueries(3):
+            response, data = self.get(fields="id,name")
+
+        self.assertEqual(
+            data["results"][0], {"id": self.tasks[0].pk, "name": "Task 0"}
+        )
+
+    def test_unknown_field(self):
+        response, data = self.get(fields="name,password")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", data["error"])
+
+    def test_cursor_pagination(self):
+        names = []
+        response, data = self.get(fields="name", limit=3)
+        names += [row["name"] for row in data["results"]]
+        while data["next"]:
+            data = self.client.get(data["next"]).json()
+            names += [row["name"] for row in data["results"]]
+
+        self.assertEqual(names, [task.name for task in self.tasks])
+
+    def test_invalid_cursor(self):
+        response, data = self.get(cursor="garbage")
+        self.assertEqual(response.status_code, 400)
+
+    def test_filters_match_search_form(self):
+        response, data = self.get(show_my_tasks="on", fields="name")
+        self.assertEqual(data["results"], [{"name": "Task 0"}])
+
+        response, data = self.get(query="Task 3", fields="name")
+        self.assertEqual(data["results"][0], {"name": "Task 3"})
+
+    def test_stream(self):
+        response = self.client.get(
+            reverse("manager:api-task-list"),
+            {"stream": "1", "fields": "name,tags"},
+        )
+
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data["results"]), 7)
+        self.assertEqual(data["results"][6]["tags"], ["backend"])
+
+
+class ResourceApiTest(TestCase):
+    def setUp(self):
+        self.user = Worker.objects.create_user(
+            username="user", password="password"
+        )
+        project = Project.objects.create(name="Apollo", description="")
+        team = Team.objects.create(name="Rocket")
+        team.members.add(self.user)
+        team.project.add(project)
+        self.client.force_login(self.user)
+
+    def test_workers(self):
+        data = self.client.get(reverse("manager:api-worker-list")).json()
+        worker = data["results"][0]
+
+        self.assertEqual(worker["username"], "user")
+        self.assertEqual(worker["teams"], ["Rocket"])
+        self.assertEqual(worker["open_tasks"], 0)
+        self.assertNotIn("password", worker)
+
+    def test_teams(self):
+        data = self.client.get(reverse("manager:api-team-list")).json()
+        self.assertEqual(data["results"][0]["members"], ["user"])
+        self.assertEqual(data["results"][0]["projects"], ["Apollo"])
+
+    def test_projects(self):
+        data = self.client.get(
+            reverse("manager:api-project-list"), {"name": "apo"}
+        ).json()
+        self.assertEqual(data["results"][0]["teams"], ["Rocket"])
+
+    def test_tags(self):
+        Tag.objects.create(name="backend")
+        Tag.objects.create(name="frontend")
+        data = self.client.get(
+            reverse("manager:api-tag-list"), {"name": "back"}
+        ).json()
+        self.assertEqual(
+            [tag["name"] for tag in data["results"]], ["backend"]
+        )
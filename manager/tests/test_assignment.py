@@ -0,0 +1,199 @@
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.assignment import (
+    AutoAssigner,
+    auto_assign,
+    task_weight,
+)
+from company_task_manager.manager.models import (
+    Project,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+    WorkerTaskStats,
+)
+
+
+class AutoAssignTest(TestCase):
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(name="Apollo", description="")
+        self.other_project = Project.objects.create(
+            name="Gemini", description=""
+        )
+        self.workers = [
+            Worker.objects.create_user(username=name, password="password")
+            for name in ("ann", "bob", "cid")
+        ]
+        team = Team.objects.create(name="Core")
+        team.members.add(*self.workers)
+        team.project.add(self.project)
+        outsider_team = Team.objects.create(name="Other")
+        outsider_team.members.add(
+            Worker.objects.create(username="outsider")
+        )
+        outsider_team.project.add(self.other_project)
+        self.far = date.today() + timedelta(days=30)
+
+    def create_tasks(self, count, project=None, **fields):
+        fields.setdefault("deadline", self.far)
+        fields.setdefault("priority", "low")
+        return [
+            Task.objects.create(
+                name=f"Task {number}",
+                description="Description",
+                task_type=self.task_type,
+                project=project or self.project,
+                **fields,
+            )
+            for number in range(count)
+        ]
+
+    def open_tasks(self):
+        return {
+            stats.worker.username: stats.open_tasks
+            for stats in WorkerTaskStats.objects.select_related("worker")
+        }
+
+    def test_task_weight(self):
+        today = date.today()
+        self.assertEqual(task_weight("low", self.far, today), 1)
+        self.assertEqual(task_weight("urgent", self.far, today), 8)
+        self.assertEqual(task_weight("low", today, today), 5)
+
+    def test_spreads_tasks_over_team_members(self):
+        busy = self.create_tasks(1, priority="urgent")[0]
+        busy.assigned.add(self.workers[0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            picks = auto_assign(self.create_tasks(6))
+
+        self.assertEqual(len(picks), 6)
+        self.assertEqual(
+            self.open_tasks(),
+            {"ann": 1, "bob": 3, "cid": 3, "outsider": 0},
+        )
+
+    def test_candidates_come_from_the_project_teams(self):
+        task = self.create_tasks(1, project=self.other_project)[0]
+        unlinked = Project.objects.create(name="Mercury", description="")
+        orphan = self.create_tasks(1, project=unlinked)[0]
+        done = self.create_tasks(1, is_completed=True)[0]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            picks = auto_assign([task, orphan, done])
+
+        self.assertEqual(list(picks), [task.pk])
+        self.assertEqual(
+            list(task.assigned.values_list("username", flat=True)),
+            ["outsider"],
+        )
+        self.assertFalse(orphan.assigned.exists())
+        self.assertFalse(done.assigned.exists())
+
+    def test_assigner_reads_once_per_batch(self):
+        tasks = self.create_tasks(2) + self.create_tasks(
+            2, project=self.other_project
+        )
+        tasks = tasks * 250
+
+        with self.assertNumQueries(2):
+            assigner = AutoAssigner({self.project.pk, self.other_project.pk})
+        with self.assertNumQueries(0):
+            picks = assigner.assign(tasks, count=2)
+
+        self.assertEqual(len(picks), 4)
+        loads = sorted(assigner.loads[worker.pk] for worker in self.workers)
+        self.assertLessEqual(loads[-1] - loads[0], 1)
+
+    def test_create_view_auto_assigns(self):
+        self.client.force_login(self.workers[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("manager:task-create"), {
+                "name": "New",
+                "description": "Description",
+                "deadline": self.far,
+                "priority": "low",
+                "task_type": self.task_type.pk,
+                "project": self.project.pk,
+                "auto_assign": "on",
+            })
+
+        self.assertEqual(response.status_code, 302)
+        task = Task.objects.get(name="New")
+        self.assertEqual(task.assigned.count(), 1)
+        self.assertEqual(sum(self.open_tasks().values()), 1)
+
+    def test_create_view_requires_project_to_auto_assign(self):
+        self.client.force_login(self.workers[0])
+        response = self.client.post(reverse("manager:task-create"), {
+            "name": "New",
+            "description": "Description",
+            "deadline": self.far,
+            "priority": "low",
+            "task_type": self.task_type.pk,
+            "auto_assign": "on",
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("project", response.context["form"].errors)
+
+    def test_create_view_requires_candidates_to_auto_assign(self):
+        empty = Project.objects.create(name="Mercury", description="")
+        team = Team.objects.create(name="Idle")
+        team.members.add(
+            Worker.objects.create(username="retired", is_active=False)
+        )
+        team.project.add(empty)
+        self.client.force_login(self.workers[0])
+        response = self.client.post(reverse("manager:task-create"), {
+            "name": "New",
+            "description": "Description",
+            "deadline": self.far,
+            "priority": "low",
+            "task_type": self.task_type.pk,
+            "project": empty.pk,
+            "auto_assign": "on",
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("project", response.context["form"].errors)
+        self.assertFalse(Task.objects.filter(name="New").exists())
+
+    def test_import_auto_assigns_unassigned_tasks(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "tasks.jsonl")
+        with open(path, "w") as stream:
+            for number in range(9):
+                stream.write(json.dumps({
+                    "name": f"Imported {number}",
+                    "description": "",
+                    "deadline": self.far.isoformat(),
+                    "is_completed": False,
+                    "priority": "low",
+                    "task_type": "Bug",
+                    "project": "Apollo",
+                    "assigned": ["ann"] if number == 0 else [],
+                    "tags": [],
+                }) + "\n")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "import_data", "tasks", path, "--auto-assign",
+                "--batch-size", "5", stdout=StringIO(),
+            )
+
+        self.assertEqual(
+            self.open_tasks(),
+            {"ann": 3, "bob": 3, "cid": 3, "outsider": 0},
+        )
@@ -0,0 +1,142 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path, reverse
+
+from company_task_manager.manager import urls as manager_urls
+from company_task_manager.manager.models import Task, TaskType, Team, Worker
+from company_task_manager.manager.views import (
+    AsyncTaskDetailView,
+    AsyncTaskListView,
+    AsyncTeamDetailView,
+    AsyncTeamsListView,
+    AsyncWorkerDetailView,
+    AsyncWorkerListView,
+)
+
+ASYNC_VIEWS = {
+    "task-list": AsyncTaskListView,
+    "task-detail": AsyncTaskDetailView,
+    "worker-list": AsyncWorkerListView,
+    "worker-detail": AsyncWorkerDetailView,
+    "team-list": AsyncTeamsListView,
+    "team-detail": AsyncTeamDetailView,
+}
+
+# core/urls.py as it is built with ASYNC_VIEWS enabled.
+urlpatterns = [
+    path("", include(([
+        path(str(pattern.pattern), view.as_view(), name=pattern.name)
+        if (view := ASYNC_VIEWS.get(pattern.name)) else pattern
+        for pattern in manager_urls.urlpatterns
+    ], "manager"))),
+    path("accounts/", include("django.contrib.auth.urls")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        task_type = TaskType.objects.create(name="Bug")
+        for i in range(7):
+            task = Task.objects.create(
+                name=f"Task {i}",
+                description="Description",
+                deadline=date.today() + timedelta(days=i),
+                priority="low",
+                task_type=task_type,
+            )
+            task.assigned.add(self.worker)
+        self.task = task
+        self.team = Team.objects.create(name="Rocket")
+        self.team.members.add(self.worker)
+        self.client.force_login(self.worker)
+
+    def test_views_are_async(self):
+        for view_class in ASYNC_VIEWS.values():
+            self.assertTrue(view_class.view_is_async, view_class)
+
+    def pages(self):
+        return [
+            ("task-list", None),
+            ("task-detail", {"pk": self.task.pk}),
+            ("worker-list", None),
+            ("worker-detail", {"pk": self.worker.pk}),
+            ("team-list", None),
+            ("team-detail", {"pk": self.team.pk}),
+        ]
+
+    async def test_pages_render(self):
+        await self.async_client.aforce_login(self.worker)
+        for name, kwargs in self.pages():
+            url = reverse(f"manager:{name}", kwargs=kwargs)
+            response = await self.async_client.get(url)
+            self.assertEqual(response.status_code, 200, name)
+            self.assertTrue(response.has_header("ETag"), name)
+
+    async def test_offset_pagination(self):
+        await self.async_client.aforce_login(self.worker)
+        url = reverse("manager:task-list")
+        response = await self.async_client.get(url, {"page": 2})
+        page = response.context["page_obj"]
+        self.assertEqual(page.paginator.count, 7)
+        self.assertEqual(
+            [task.name for task in page], ["Task 5", "Task 6"]
+        )
+        response = await self.async_client.get(url, {"page": 3})
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(PAGINATION_MODE="cursor")
+    async def test_cursor_pagination(self):
+        await self.async_client.aforce_login(self.worker)
+        url = reverse("manager:task-list")
+        response = await self.async_client.get(url)
+        page = response.context["page_obj"]
+        response = await self.async_client.get(
+            url, {"cursor": page.next_cursor}
+        )
+        self.assertEqual(
+            [task.name for task in response.context["page_obj"]],
+            ["Task 5", "Task 6"],
+        )
+        response = await self.async_client.get(url, {"cursor": "broken"})
+        self.assertEqual(response.status_code, 404)
+
+    async def test_missing_object(self):
+        await self.async_client.aforce_login(self.worker)
+        url = reverse("manager:task-detail", kwargs={"pk": 0})
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 404)
+
+    async def test_login_required(self):
+        response = await self.async_client.get(reverse("manager:task-list"))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("login", response.url)
+
+    async def test_not_modified(self):
+        await self.async_client.aforce_login(self.worker)
+        url = reverse("manager:task-detail", kwargs={"pk": self.task.pk})
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(
+            url, headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_same_queries_as_sync_views(self):
+        for name, kwargs in self.pages():
+            counts = []
+            for urlconf in ("core.urls", __name__):
+                cache.clear()
+                with override_settings(ROOT_URLCONF=urlconf):
+                    url = reverse(f"manager:{name}", kwargs=kwargs)
+                    with CaptureQueriesContext(connection) as queries:
+                        self.client.get(url)
+                counts.append(len(queries))
+            self.assertEqual(counts[0], counts[1], name)
@@ -0,0 +1,194 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from company_task_manager.manager import autocomplete
+from company_task_manager.manager.autocomplete import PrefixIndex
+from company_task_manager.manager.models import Worker
+
+
+class PrefixIndexTest(SimpleTestCase):
+    def setUp(self):
+        self.index = PrefixIndex([
+            (1, "jdoe", "John", "Doe"),
+            (2, "jane", "Jane", "Smith"),
+            (3, "bsmith", "Bob", "Smith"),
+        ])
+
+    def test_prefix_matches_any_name(self):
+        self.assertEqual(
+            [row[0] for row in self.index.search("j")], [2, 1]
+        )
+        self.assertEqual(
+            [row[0] for row in self.index.search("SMI")], [2, 3]
+        )
+        self.assertEqual(self.index.search("x"), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search("", limit=2)), 2)
+
+    def test_search_after(self):
+        # Jane, then jdoe under "jdoe", which is before "john".
+        self.assertEqual(
+            self.index.search("j", after=("jane", 2)),
+            [(1, "jdoe", "John", "Doe")],
+        )
+        self.assertEqual(self.index.search("j", after=("jdoe", 1)), [])
+
+    def test_add_and_remove(self):
+        self.index.add(1, "jdoe", "Jack", "Black")
+        self.assertEqual(self.index.search("doe"), [])
+        self.assertEqual(
+            self.index.search("bla"), [(1, "jdoe", "Jack", "Black")]
+        )
+
+        self.index.remove(1)
+        self.assertEqual(self.index.search("jdoe"), [])
+        self.assertEqual(len(self.index), 2)
+
+
+class WorkerAutocompleteTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        autocomplete.workers.reset()
+        self.user = Worker.objects.create_user(
+            username="admin", password="password"
+        )
+        self.worker = Worker.objects.create_user(
+            username="jdoe", first_name="John", last_name="Doe"
+        )
+        Worker.objects.create_user(username="inactive", is_active=False)
+        self.url = reverse("manager:api-worker-autocomplete")
+        self.client.force_login(self.user)
+
+    def search(self, query):
+        response = self.client.get(self.url, {"q": query})
+        self.assertEqual(response.status_code, 200)
+        return [row["username"] for row in response.json()["results"]]
+
+    def test_login_required(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_search(self):
+        self.assertEqual(self.search("jo"), ["jdoe"])
+        self.assertEqual(self.search("DOE"), ["jdoe"])
+        self.assertEqual(self.search("in"), [])
+        self.assertEqual(self.search(""), [])
+
+    def test_index_answers_without_queries(self):
+        self.search("jo")
+        # Session and user only.
+        with self.assertNumQueries(2):
+            self.search("jo")
+
+    def test_saves_and_deletes_update_the_index(self):
+        self.search("jo")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.first_name = "Jack"
+            self.worker.save()
+            Worker.objects.create_user(username="joe")
+        with self.assertNumQueries(2):
+            self.assertEqual(self.search("j"), ["jdoe", "joe"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.delete()
+        self.assertEqual(self.search("j"), ["joe"])
+
+    def test_change_in_another_process_rebuilds(self):
+        self.search("jo")
+        Worker.objects.filter(pk=self.worker.pk).update(first_name="Ann")
+        autocomplete.bump_generation()
+
+        self.assertEqual(self.search("ann"), ["jdoe"])
+
+    def test_change_in_another_process_is_replayed(self):
+        self.search("jo")
+        previous = autocomplete.workers.generation
+        Worker.objects.filter(pk=self.worker.pk).update(first_name="Ann")
+        autocomplete.publish_change(self.worker.pk, ("jdoe", "Ann", "Doe"))
+
+        with self.assertNumQueries(2):
+            self.assertEqual(self.search("ann"), ["jdoe"])
+        self.assertEqual(autocomplete.workers.generation, previous + 1)
+
+    def test_missing_change_rebuilds(self):
+        self.search("jo")
+        Worker.objects.filter(pk=self.worker.pk).update(first_name="Ann")
+        current = autocomplete.publish_change(
+            self.worker.pk, ("jdoe", "Ann", "Doe")
+        )
+        cache.delete(autocomplete.CHANGE_KEY.format(current))
+
+        with self.assertNumQueries(3):
+            self.assertEqual(self.search("ann"), ["jdoe"])
+
+    def test_unsearchable_changes_keep_the_generation(self):
+        self.search("jo")
+        current = autocomplete.generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.email = "jdoe@example.com"
+            self.worker.save()
+
+        self.assertEqual(autocomplete.generation(), current)
+
+    def test_waiting_thread_does_not_rebuild_again(self):
+        index = autocomplete.WorkerIndex()
+        built = []
+        index.build = lambda: built.append(1) or PrefixIndex()
+        thread = threading.Thread(target=index.get)
+        with index.lock:
+            thread.start()
+            # The thread saw no index and now waits for the lock.
+            time.sleep(0.05)
+            index.index = PrefixIndex()
+            index.generation = autocomplete.generation()
+        thread.join()
+
+        self.assertEqual(built, [])
+
+    def page_through(self, query):
+        response = self.client.get(self.url, {"q": query, "limit": 2})
+        pages = []
+        while True:
+            data = response.json()
+            pages.append([row["username"] for row in data["results"]])
+            if data["next"] is None:
+                return pages
+            response = self.client.get(data["next"])
+
+    def test_pages_through_every_match(self):
+        for number in range(4):
+            Worker.objects.create_user(
+                username=f"j{number}", first_name="Joe"
+            )
+
+        self.assertEqual(
+            self.page_through("j"),
+            [["j0", "j1"], ["j2", "j3"], ["jdoe"]],
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"q": "j", "cursor": "x"})
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(WORKER_AUTOCOMPLETE_INDEX=False)
+    def test_database_fallback_pages(self):
+        for number in range(4):
+            Worker.objects.create_user(
+                username=f"j{number}", first_name="Joe"
+            )
+
+        self.assertEqual(
+            self.page_through("j"),
+            [["j0", "j1"], ["j2", "j3"], ["jdoe"]],
+        )
+
+    @override_settings(WORKER_AUTOCOMPLETE_INDEX=False)
+    def test_database_fallback(self):
+        self.assertEqual(self.search("jo"), ["jdoe"])
+        self.assertEqual(self.search("DOE"), ["jdoe"])
+        self.assertEqual(self.search("in"), [])
@@ -0,0 +1,129 @@
+import asyncio
+
+from django.test import SimpleTestCase, TestCase
+
+from company_task_manager.manager.benchmarks import concurrency, runner
+from company_task_manager.manager.benchmarks.seed import seed
+from company_task_manager.manager.models import (
+    Project,
+    ProjectMemberStats,
+    ProjectTaskStats,
+    Task,
+)
+
+
+class BenchmarkRunnerTest(TestCase):
+    def test_run_measures_every_route(self):
+        report = runner.run([20], repeat=1)
+        results = report["results"]["20"]
+
+        self.assertIn("manager:index", results)
+        self.assertIn("manager:task-detail", results)
+        self.assertEqual(
+            len(results), len(list(runner.manager_routes()))
+        )
+        for row in results.values():
+            self.assertLess(row["status"], 400)
+            self.assertGreater(row["queries"], 0)
+
+
+class SeedTest(TestCase):
+    def test_seeds_summaries(self):
+        seed(50)
+
+        self.assertEqual(
+            ProjectTaskStats.objects.count(), Project.objects.count()
+        )
+        self.assertEqual(
+            sum(ProjectTaskStats.objects.values_list(
+                "overdue_tasks", flat=True
+            )),
+            Task.objects.filter(is_overdue=True).exclude(
+                project=None
+            ).count(),
+        )
+        self.assertTrue(Task.objects.filter(is_overdue=True).exists())
+        self.assertTrue(ProjectMemberStats.objects.exists())
+
+
+class BenchmarkCheckTest(TestCase):
+    def setUp(self):
+        self.report = {
+            "results": {
+                "1000": {
+                    "manager:index": {
+                        "status": 200,
+                        "wall_ms": 10.0,
+                        "db_ms": 2.0,
+                        "queries": 3,
+                    }
+                }
+            }
+        }
+
+    def test_within_budget(self):
+        budgets = {"default": {"queries": 5, "wall_ms": 50}}
+        self.assertEqual(runner.check(self.report, budgets), [])
+
+    def test_route_and_size_budgets_override_default(self):
+        budgets = {
+            "default": {"queries": 5},
+            "routes": {"manager:index": {"queries": 2}},
+            "sizes": {"1000": {"manager:index": {"wall_ms": 5}}},
+        }
+        failures = runner.check(self.report, budgets)
+
+        self.assertEqual(len(failures), 2)
+        self.assertIn("wall_ms 10.0 > budget 5", failures[0])
+        self.assertIn("queries 3 > budget 2", failures[1])
+
+    def test_regression_against_baseline(self):
+        baseline = {
+            "results": {
+                "1000": {
+                    "manager:index": {"wall_ms": 5.0, "queries": 2}
+                }
+            }
+        }
+        failures = runner.check(
+            self.report, {"max_regression": 0.5}, baseline
+        )
+
+        self.assertEqual(len(failures), 2)
+        self.assertIn("queries 2 -> 3", failures[0])
+        self.assertIn("wall_ms 5.0 -> 10.0", failures[1])
+
+
+class ConcurrencyClientTest(SimpleTestCase):
+    async def serve(self, reader, writer):
+        request = await reader.readuntil(b"\r\n\r\n")
+        self.requests.append(request.decode())
+        status = b"200 OK" if b"sessionid=abc" in request else b"302 Found"
+        writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Length: 0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    async def run_clients(self, cookie):
+        self.requests = []
+        server = await asyncio.start_server(self.serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await concurrency.run_clients(
+                "127.0.0.1", port, "/tasks/", cookie,
+                clients=3, requests=6, delay=0.01,
+            )
+
+    def test_slow_clients(self):
+        report = asyncio.run(self.run_clients("sessionid=abc"))
+
+        self.assertEqual(report["errors"], 0)
+        self.assertEqual(len(self.requests), 6)
+        self.assertTrue(self.requests[0].startswith("GET /tasks/ HTTP/1.1"))
+        self.assertGreaterEqual(report["p50_ms"], 20)
+        self.assertLessEqual(report["p50_ms"], report["p95_ms"])
+
+    def test_non_200_responses_are_errors(self):
+        report = asyncio.run(self.run_clients("sessionid=other"))
+
+        self.assertEqual(report["errors"], 6)
+        self.assertIsNone(report["p95_ms"])
@@ -0,0 +1,141 @@
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Activity,
+    Tag,
+    Task,
+    TaskType,
+    Worker,
+)
+
+
+class TaskBulkActionTest(TestCase):
+    def setUp(self):
+        self.user = Worker.objects.create_user(
+            username="user", password="password"
+        )
+        self.other = Worker.objects.create_user(
+            username="other", password="password"
+        )
+        task_type = TaskType.objects.create(name="Bug")
+        self.tasks = [
+            Task.objects.create(
+                name=f"Task {i}",
+                description="Description",
+                deadline=date.today(),
+                priority="low",
+                task_type=task_type,
+            )
+            for i in range(3)
+        ]
+        self.tasks[0].assigned.add(self.user)
+        self.tasks[1].assigned.add(self.user)
+        self.client.force_login(self.user)
+
+    def post(self, action, **data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse("manager:task-bulk"),
+                {
+                    "tasks": [task.pk for task in self.tasks],
+                    "action": action,
+                    **data,
+                },
+            )
+
+    def test_complete_only_permitted_tasks(self):
+        response = self.post("complete")
+
+        self.assertRedirects(response, reverse("manager:task-list"))
+        self.assertEqual(
+            list(
+                Task.objects.order_by("pk")
+                .values_list("is_completed", flat=True)
+            ),
+            [True, True, False],
+        )
+        self.user.task_stats.refresh_from_db()
+        self.assertEqual(self.user.task_stats.completed_tasks, 2)
+        self.assertEqual(self.user.task_stats.open_tasks, 0)
+
+    def test_superuser_completes_every_task(self):
+        self.user.is_superuser = True
+        self.user.save()
+
+        self.post("complete")
+
+        self.assertFalse(Task.objects.filter(is_completed=False).exists())
+
+    def test_set_priority(self):
+        self.post("priority", priority="urgent")
+
+        self.assertEqual(Task.objects.filter(priority="urgent").count(), 3)
+        self.user.task_stats.refresh_from_db()
+        self.assertEqual(self.user.task_stats.urgent_open, 2)
+
+    def test_assign_and_unassign(self):
+        self.post("assign", workers=[self.other.pk, self.user.pk])
+
+        self.assertEqual(self.other.assigned_tasks.count(), 3)
+        self.assertEqual(self.user.assigned_tasks.count(), 3)
+        self.other.task_stats.refresh_from_db()
+        self.assertEqual(self.other.task_stats.open_tasks, 3)
+
+        self.post("unassign", workers=[self.other.pk])
+
+        self.assertEqual(self.other.assigned_tasks.count(), 0)
+        self.other.task_stats.refresh_from_db()
+        self.assertEqual(self.other.task_stats.open_tasks, 0)
+
+    def logged(self, action):
+        return sorted(
+            (entry.object_id, entry.changes)
+            for entry in Activity.objects.filter(action=action)
+        )
+
+    def test_only_changed_links_are_logged_and_bumped(self):
+        versions = {
+            task.pk: task.version
+            for task in Task.objects.filter(pk__in=[t.pk for t in self.tasks])
+        }
+
+        self.post("assign", workers=[self.user.pk])
+
+        self.assertEqual(
+            self.logged(Activity.ASSIGNED),
+            [(self.tasks[2].pk, {"workers": [self.user.pk]})],
+        )
+        for task in Task.objects.filter(pk__in=versions):
+            self.assertEqual(
+                task.version != versions[task.pk],
+                task.pk == self.tasks[2].pk,
+            )
+
+        self.post("unassign", workers=[self.other.pk])
+        self.assertEqual(self.logged(Activity.UNASSIGNED), [])
+
+    def test_add_tags(self):
+        tag = Tag.objects.create(name="sprint")
+        self.tasks[0].tags.add(tag)
+
+        self.post("tag", tags=[tag.pk])
+
+        self.assertEqual(tag.tasks.count(), 3)
+
+    def test_missing_action_argument(self):
+        response = self.post("assign")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "manager/task_bulk_form.html")
+        self.assertFormError(
+            response.context["form"],
+            "workers",
+            "This field is required for this action.",
+        )
+
+    def test_get_not_allowed(self):
+        response = self.client.get(reverse("manager:task-bulk"))
+        self.assertEqual(response.status_code, 405)
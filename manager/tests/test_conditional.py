@@ -0,0 +1,142 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Project,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today(),
+            priority="low",
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+        self.team = Team.objects.create(name="Rocket")
+        self.client.force_login(self.worker)
+
+    def revalidate(self, url, response, **extra):
+        return self.client.get(
+            url, HTTP_IF_NONE_MATCH=response["ETag"], **extra
+        )
+
+    def test_detail_not_modified(self):
+        url = reverse("manager:task-detail", kwargs={"pk": self.task.pk})
+        response = self.client.get(url)
+        self.assertTrue(response.has_header("Last-Modified"))
+
+        # Session, user and the validator query.
+        with self.assertNumQueries(3):
+            response = self.revalidate(url, response)
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_not_modified_since(self):
+        url = reverse("manager:task-detail", kwargs={"pk": self.task.pk})
+        response = self.client.get(url)
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_sends_no_last_modified(self):
+        response = self.client.get(reverse("manager:task-list"))
+
+        self.assertTrue(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_detail_modified_by_save_and_m2m(self):
+        url = reverse("manager:task-detail", kwargs={"pk": self.task.pk})
+        response = self.client.get(url)
+
+        self.task.assigned.add(self.worker)
+        response = self.revalidate(url, response)
+        self.assertEqual(response.status_code, 200)
+
+        self.task.refresh_from_db()
+        self.task.priority = "high"
+        self.task.save()
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_list_modified_by_new_and_deleted_rows(self):
+        url = reverse("manager:team-list")
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+        other = Team.objects.create(name="Comet")
+        response = self.revalidate(url, response)
+        self.assertEqual(response.status_code, 200)
+
+        other.delete()
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_project_rename_modifies_team_list(self):
+        project = Project.objects.create(name="Apollo", description="")
+        self.team.project.add(project)
+        url = reverse("manager:team-list")
+        response = self.client.get(url)
+
+        project.name = "Artemis"
+        project.save()
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_worker_stats_modify_worker_pages(self):
+        url = reverse("manager:worker-detail", kwargs={"pk": self.worker.pk})
+        response = self.client.get(url)
+
+        self.task.assigned.add(self.worker)
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_etag_depends_on_user_and_query(self):
+        url = reverse("manager:task-list")
+        response = self.client.get(url)
+
+        self.assertEqual(
+            self.client.get(
+                url, {"query": "Task"}, HTTP_IF_NONE_MATCH=response["ETag"]
+            ).status_code,
+            200,
+        )
+        self.client.force_login(
+            Worker.objects.create_user(username="other", password="password")
+        )
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_etag_changes_when_logging_in_again(self):
+        url = reverse("manager:task-list")
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+        self.client.logout()
+        self.client.login(username="worker", password="password")
+
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    @override_settings(PAGINATION_MODE="cursor")
+    def test_cursor_list_validates_page_window(self):
+        url = reverse("manager:task-list")
+        response = self.client.get(url)
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+        Task.objects.filter(pk=self.task.pk).update(name="Changed")
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+        self.task.refresh_from_db()
+        self.task.save()
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
@@ -0,0 +1,112 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Task,
+    TaskType,
+    Project,
+    Team,
+    Worker,
+)
+
+
+class DashboardCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.project = Project.objects.create(
+            name="Apollo", description="Moon landing"
+        )
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today(),
+            priority="high",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+        self.team = Team.objects.create(name="Rocket")
+        self.client.force_login(self.worker)
+
+    def get_index(self):
+        response = self.client.get(reverse("manager:index"))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def project_names(self):
+        return [
+            project["name"]
+            for project in self.get_index().context["projects"]
+        ]
+
+    def test_second_hit_reads_from_cache(self):
+        self.get_index()
+        # Session and user; the sidebar permissions come from the cache.
+        with self.assertNumQueries(2):
+            self.get_index()
+
+    def test_assignment_changes_invalidate(self):
+        self.assertEqual(self.project_names(), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assigned.add(self.worker)
+        self.assertEqual(self.project_names(), ["Apollo"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.assigned_tasks.remove(self.task)
+        self.assertEqual(self.project_names(), [])
+
+    def test_open_task_count_follows_completion(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assigned.add(self.worker)
+        self.assertEqual(
+            self.get_index().context["projects"][0]["open_tasks"], 1
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.is_completed = True
+            self.task.save()
+        self.assertEqual(
+            self.get_index().context["projects"][0]["open_tasks"], 0
+        )
+
+    def test_project_rename_invalidates(self):
+        self.task.assigned.add(self.worker)
+        self.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.name = "Artemis"
+            self.project.save()
+        self.assertEqual(self.project_names(), ["Artemis"])
+
+    def test_team_membership_and_rename_invalidate(self):
+        self.assertEqual(list(self.get_index().context["teams"]), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.members.add(self.worker)
+            self.team.name = "Booster"
+            self.team.save()
+        self.assertEqual(
+            [team["name"] for team in self.get_index().context["teams"]],
+            ["Booster"]
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.team.delete()
+        self.assertEqual(list(self.get_index().context["teams"]), [])
+
+    def test_invalidation_waits_for_commit(self):
+        self.get_index()
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.task.assigned.add(self.worker)
+        self.assertEqual(self.project_names(), [])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.project_names(), ["Apollo"])
+
+    def test_other_workers_cache_is_kept(self):
+        other = Worker.objects.create(username="other")
+        self.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assigned.add(other)
+        with self.assertNumQueries(2):
+            self.get_index()
@@ -0,0 +1,134 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from company_task_manager.manager.deadlines import (
+    DUE_SOON,
+    OVERDUE,
+    DeadlineScheduler,
+)
+from company_task_manager.manager.models import (
+    DeadlineNotification,
+    Task,
+    TaskType,
+    Worker,
+)
+
+
+class DeadlineSchedulerTest(TestCase):
+    def setUp(self):
+        self.worker = Worker.objects.create_user(username="worker")
+        self.today = date.today()
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.task = self.create_task("Task", self.today + timedelta(days=3))
+        self.scheduler = DeadlineScheduler(due_soon_days=2)
+
+    def create_task(self, name, deadline):
+        task = Task.objects.create(
+            name=name,
+            description="Description",
+            deadline=deadline,
+            priority="low",
+            task_type=self.task_type,
+        )
+        task.assigned.add(self.worker)
+        return task
+
+    def fire(self, days):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.scheduler.fire(self.today + timedelta(days=days))
+
+    def notifications(self):
+        return list(
+            DeadlineNotification.objects.order_by("pk").values_list(
+                "task__name", "worker__username", "kind"
+            )
+        )
+
+    def test_saving_sets_overdue_flag(self):
+        task = self.create_task("Late", self.today - timedelta(days=1))
+        self.assertTrue(task.is_overdue)
+
+        task.is_completed = True
+        task.save()
+        task.refresh_from_db()
+        self.assertFalse(task.is_overdue)
+
+    def test_save_that_flags_overdue_queues_notification(self):
+        # The deadline passes and the task is edited before the scheduler
+        # runs.
+        Task.objects.filter(pk=self.task.pk).update(
+            deadline=self.today - timedelta(days=1)
+        )
+        task = Task.objects.get(pk=self.task.pk)
+        task.name = "Edited"
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        self.assertEqual(
+            self.notifications(), [("Edited", "worker", OVERDUE)]
+        )
+
+        call_command("run_deadline_scheduler", "--once", stdout=StringIO())
+        self.assertEqual(len(self.notifications()), 1)
+
+    def test_events_fire_once_in_deadline_order(self):
+        self.assertEqual(self.scheduler.load(), 1)
+        self.assertEqual(self.fire(0), {OVERDUE: 0, DUE_SOON: 0})
+        self.assertEqual(self.fire(1), {OVERDUE: 0, DUE_SOON: 1})
+        self.assertEqual(self.notifications(), [("Task", "worker", DUE_SOON)])
+
+        self.assertEqual(self.fire(4), {OVERDUE: 1, DUE_SOON: 0})
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_overdue)
+        self.assertEqual(len(self.notifications()), 2)
+
+        self.assertEqual(self.fire(5), {OVERDUE: 0, DUE_SOON: 0})
+
+    def test_restart_does_not_repeat_notifications(self):
+        self.scheduler.load()
+        self.fire(1)
+        restarted = DeadlineScheduler(due_soon_days=2)
+        restarted.load()
+        with self.captureOnCommitCallbacks(execute=True):
+            restarted.fire(self.today + timedelta(days=1))
+        self.assertEqual(len(self.notifications()), 1)
+
+    def test_poll_follows_changed_and_new_tasks(self):
+        self.scheduler.load()
+        self.task.deadline = self.today + timedelta(days=10)
+        self.task.save()
+        done = self.create_task("Done", self.today)
+        done.is_completed = True
+        done.save()
+        self.create_task("New", self.today + timedelta(days=1))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.scheduler.poll(), 3)
+        self.assertEqual(self.fire(1), {OVERDUE: 0, DUE_SOON: 1})
+        self.assertEqual(self.notifications(), [("New", "worker", DUE_SOON)])
+        self.assertEqual(self.fire(4), {OVERDUE: 1, DUE_SOON: 0})
+        self.assertFalse(Task.objects.get(pk=self.task.pk).is_overdue)
+
+    def test_missed_due_soon_is_skipped_once_overdue(self):
+        self.scheduler.load()
+        self.assertEqual(self.fire(4), {OVERDUE: 1, DUE_SOON: 0})
+        self.assertEqual(self.notifications(), [("Task", "worker", OVERDUE)])
+
+    def test_command_once(self):
+        # A deadline that passed without the task being written.
+        Task.objects.filter(pk=self.task.pk).update(
+            deadline=self.today - timedelta(days=1)
+        )
+        self.assertEqual(self.worker.task_stats.overdue_tasks, 0)
+        out = StringIO()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("run_deadline_scheduler", "--once", stdout=out)
+
+        self.assertIn("1 overdue", out.getvalue())
+        self.task.refresh_from_db()
+        self.assertTrue(self.task.is_overdue)
+        self.worker.task_stats.refresh_from_db()
+        self.assertEqual(self.worker.task_stats.overdue_tasks, 1)
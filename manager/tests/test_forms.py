@@ -1,6 +1,9 @@
+from datetime import date
+
 from django.test import TestCase
 
 from company_task_manager.manager.models import (
+    Task,
     Worker,
     Team,
     Tag,
@@ -77,6 +80,54 @@ class TaskFormTest(FormTestCase):
         self.assertIn("name", form.errors)
 
 
+class PickerWidgetTest(FormTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(20):
+            Worker.objects.create(username=f"member{i:02}")
+            Tag.objects.create(name=f"tag{i:02}")
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today(),
+            priority="low",
+            task_type=self.task_type,
+        )
+        self.task.assigned.add(self.worker)
+
+    def test_renders_only_selected_options(self):
+        form = TaskForm(instance=self.task)
+        html = str(form["assigned"])
+
+        self.assertEqual(html.count("<option"), 1)
+        self.assertIn("selected", html)
+        self.assertIn('data-search-url="/api/workers/autocomplete/"', html)
+        self.assertNotIn("<option", str(form["tags"]))
+        self.assertIn("manager/js/search_select.js", str(form.media))
+
+    def test_optional_single_select_keeps_empty_option(self):
+        html = str(TaskForm(instance=self.task)["project"])
+        self.assertEqual(html.count("<option"), 1)
+        self.assertIn('value="" selected', html)
+
+    def test_invalid_ids_render_no_options(self):
+        form = TeamForm(data={"name": "Team", "members": ["x"]})
+        self.assertFalse(form.is_valid())
+        self.assertNotIn("<option", str(form["members"]))
+
+    def test_submitted_ids_validated_in_one_query(self):
+        workers = Worker.objects.values_list("pk", flat=True)[:10]
+        form = TeamForm(data={
+            "name": "Team",
+            "members": list(workers),
+            "project": [self.project.pk],
+        })
+        # One query per picker.
+        with self.assertNumQueries(2):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(len(form.cleaned_data["members"]), 10)
+
+
 class TaskSearchFormTest(FormTestCase):
     def test_valid_form(self):
         form_data = {"query": "Test", "show_my_tasks": True}
@@ -0,0 +1,138 @@
+import json
+import time
+from types import SimpleNamespace
+
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+
+from company_task_manager.manager import activity
+from company_task_manager.manager.middleware import (
+    ActivityMiddleware,
+    QueryRecorder,
+    RequestTimingMiddleware,
+)
+from company_task_manager.manager.models import Worker
+
+
+@override_settings(
+    REQUEST_TIMING_ENABLED=True,
+    REQUEST_TIMING_SLOW_MS=None,
+    REQUEST_TIMING_MAX_QUERIES=None,
+)
+class RequestTimingMiddlewareTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.client.force_login(self.worker)
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse("manager:index"))
+        timing = response["Server-Timing"]
+
+        for metric in ("db;dur=", "tpl;dur=", "view;dur=", "total;dur="):
+            self.assertIn(metric, timing)
+
+    def test_logs_record_keyed_by_url_name(self):
+        with self.assertLogs("manager.performance", "INFO") as logs:
+            self.client.get(reverse("manager:task-list"))
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(logs.records[0].levelname, "INFO")
+        self.assertEqual(record["url_name"], "manager:task-list")
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["queries"], 0)
+        self.assertGreater(record["template_ms"], 0)
+        self.assertNotIn("duplicates", record)
+
+    def test_timings_add_up_to_total(self):
+        with self.assertLogs("manager.performance", "INFO") as logs:
+            self.client.get(reverse("manager:task-list"))
+
+        record = logs.records[0].timing
+        parts = ("db_ms", "template_ms", "view_ms")
+        for part in parts:
+            self.assertGreaterEqual(record[part], 0, part)
+        self.assertAlmostEqual(
+            sum(record[part] for part in parts), record["total_ms"], delta=0.1
+        )
+
+    def test_queries_while_rendering_are_not_template_time(self):
+        middleware = RequestTimingMiddleware(lambda request: None)
+        request = RequestFactory().get("/")
+        request._query_recorder = recorder = QueryRecorder()
+        request._template_seconds = 0.0
+
+        def render():
+            recorder(
+                lambda *args: time.sleep(0.05), "SELECT 1", (), False, {}
+            )
+
+        response = SimpleNamespace(render=render)
+        middleware.process_template_response(request, response).render()
+
+        self.assertGreaterEqual(recorder.seconds, 0.05)
+        self.assertLess(request._template_seconds, 0.02)
+
+    @override_settings(REQUEST_TIMING_MAX_QUERIES=0)
+    def test_flags_requests_over_threshold(self):
+        with self.assertLogs("manager.performance", "WARNING") as logs:
+            self.client.get(reverse("manager:index"))
+
+        record = logs.records[0].timing
+        self.assertEqual(logs.records[0].levelname, "WARNING")
+        self.assertIn("duplicates", record)
+
+
+class QueryRecorderTest(TestCase):
+    def test_reports_repeated_statements(self):
+        recorder = QueryRecorder()
+
+        def execute(sql, params, many, context):
+            return sql
+
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 1", "SELECT 1"):
+            recorder(execute, sql, (), False, {})
+
+        self.assertEqual(recorder.count, 4)
+        self.assertEqual(
+            recorder.duplicates(), [{"sql": "SELECT 1", "count": 3}]
+        )
+
+
+class RequestTimingDisabledTest(TestCase):
+    def test_no_header_when_disabled(self):
+        response = self.client.get(reverse("login"))
+        self.assertFalse(response.has_header("Server-Timing"))
+
+
+class ActivityMiddlewareTest(SimpleTestCase):
+    def test_sets_current_request(self):
+        request = RequestFactory().get("/")
+        middleware = ActivityMiddleware(
+            lambda request: activity.current_request.get()
+        )
+
+        self.assertFalse(iscoroutinefunction(middleware))
+        self.assertIs(middleware(request), request)
+        self.assertIsNone(activity.current_request.get())
+
+    async def test_runs_async_under_async_handlers(self):
+        request = RequestFactory().get("/")
+
+        async def get_response(request):
+            return activity.current_request.get()
+
+        middleware = ActivityMiddleware(get_response)
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertIs(await middleware(request), request)
+        self.assertIsNone(activity.current_request.get())
@@ -0,0 +1,85 @@
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import Worker
+
+
+class CachedPermissionBackendTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.add_tag = Permission.objects.get(codename="add_tag")
+        self.view_tag = Permission.objects.get(codename="view_tag")
+
+    def fresh_worker(self):
+        return Worker.objects.get(pk=self.worker.pk)
+
+    def has_perm(self, perm):
+        return self.fresh_worker().has_perm(perm)
+
+    def test_permissions_are_cached_across_requests(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.user_permissions.add(self.add_tag)
+        worker = self.fresh_worker()
+        self.assertTrue(worker.has_perm("manager.add_tag"))
+
+        worker = self.fresh_worker()
+        with self.assertNumQueries(0):
+            self.assertTrue(worker.has_perm("manager.add_tag"))
+            self.assertFalse(worker.has_perm("manager.view_tag"))
+
+    def test_sidebar_does_not_load_permissions_twice(self):
+        self.client.force_login(self.worker)
+        self.client.get(reverse("manager:index"))
+
+        # Session and user only; the sidebar's add_tag check is cached.
+        with self.assertNumQueries(2):
+            self.client.get(reverse("manager:index"))
+
+    def test_user_permission_change_invalidates(self):
+        self.assertFalse(self.has_perm("manager.add_tag"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.user_permissions.add(self.add_tag)
+        self.assertTrue(self.has_perm("manager.add_tag"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_tag.user_set.remove(self.worker)
+        self.assertFalse(self.has_perm("manager.add_tag"))
+
+    def test_group_changes_invalidate(self):
+        group = Group.objects.create(name="Leads")
+        self.assertFalse(self.has_perm("manager.add_tag"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            group.permissions.add(self.add_tag)
+            self.worker.groups.add(group)
+        self.assertTrue(self.has_perm("manager.add_tag"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            group.permissions.add(self.view_tag)
+        self.assertTrue(self.has_perm("manager.view_tag"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            group.user_set.clear()
+        self.assertFalse(self.has_perm("manager.add_tag"))
+
+    def test_superuser_and_active_changes_invalidate(self):
+        self.assertFalse(self.has_perm("manager.add_tag"))
+
+        self.worker.is_staff = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.save()
+        worker = self.fresh_worker()
+        self.assertEqual(worker.get_all_permissions(), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.user_permissions.add(self.add_tag)
+        self.worker.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.worker.save()
+        self.assertFalse(self.has_perm("manager.add_tag"))
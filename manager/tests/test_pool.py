@@ -0,0 +1,125 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+
+from django.db import connections
+from django.test import SimpleTestCase
+
+from company_task_manager.manager.db import pool as db_pool
+from company_task_manager.manager.db.pool import ConnectionPool, PoolExhausted
+from company_task_manager.manager.db.sqlite3.base import DatabaseWrapper
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "pool.sqlite3")
+        self.opened = 0
+
+    def connect(self):
+        self.opened += 1
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    def make_pool(self, **options):
+        pool = ConnectionPool(self.connect, **options)
+        self.addCleanup(pool.close_all)
+        return pool
+
+    def test_reuses_returned_connections(self):
+        pool = self.make_pool(size=2)
+
+        first, waited = pool.checkout()
+        pool.checkin(first)
+        second, _ = pool.checkout()
+
+        self.assertIs(second, first)
+        self.assertEqual(waited, 0.0)
+        self.assertEqual(self.opened, 1)
+        self.assertEqual(pool.metrics()["checkouts"], 2)
+        self.assertEqual(pool.metrics()["in_use"], 1)
+
+    def test_exhausted_pool_raises_after_timeout(self):
+        pool = self.make_pool(size=1, timeout=0.05)
+        pool.checkout()
+
+        with self.assertLogs("manager.performance", "WARNING") as logs:
+            with self.assertRaises(PoolExhausted):
+                pool.checkout()
+
+        self.assertEqual(pool.metrics()["exhausted"], 1)
+        record = logs.records[0].pool
+        self.assertEqual(record["exhausted"], 1)
+        self.assertEqual(record["in_use"], 1)
+        self.assertEqual(self.opened, 1)
+
+    def test_logs_metrics_periodically(self):
+        pool = self.make_pool(name="replica", report_interval=0)
+
+        with self.assertLogs("manager.performance", "INFO") as logs:
+            pool.checkout()
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["pool"], "replica")
+        self.assertEqual(record["checkouts"], 1)
+        self.assertEqual(logs.records[0].pool, record)
+
+        pool = self.make_pool(report_interval=None)
+        with self.assertNoLogs("manager.performance"):
+            pool.checkout()
+
+    def test_checkout_waits_for_a_returned_connection(self):
+        pool = self.make_pool(size=1, timeout=5)
+        connection, _ = pool.checkout()
+        timer = threading.Timer(0.05, pool.checkin, [connection])
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        reused, waited = pool.checkout()
+
+        self.assertIs(reused, connection)
+        self.assertGreater(waited, 0)
+        metrics = pool.metrics()
+        self.assertEqual(metrics["waits"], 1)
+        self.assertGreater(metrics["max_wait_ms"], 0)
+
+    def test_replaces_broken_and_expired_connections(self):
+        pool = self.make_pool(size=1)
+        connection, _ = pool.checkout()
+        connection.close()
+        pool.checkin(connection)
+
+        replacement, _ = pool.checkout()
+        self.assertIsNot(replacement, connection)
+        replacement.execute("SELECT 1")
+
+        pool.max_lifetime = 0
+        pool.checkin(replacement)
+        self.assertEqual(pool.metrics()["open"], 0)
+        self.assertEqual(pool.metrics()["discarded"], 2)
+        self.assertEqual(self.opened, 2)
+
+    def test_wrapper_returns_connection_on_close(self):
+        settings_dict = {
+            **connections.settings["default"],
+            "NAME": self.path,
+            "POOL": {"SIZE": 2},
+        }
+        self.addCleanup(db_pool.pools.pop, "pooled", None)
+        wrapper = DatabaseWrapper(settings_dict, alias="pooled")
+
+        with wrapper.cursor() as cursor:
+            cursor.execute("CREATE TABLE item (id integer)")
+        raw = wrapper.connection
+        wrapper.close()
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM item")
+        self.assertIs(wrapper.connection, raw)
+        wrapper.close()
+
+        metrics = db_pool.pool_metrics()["pooled"]
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertEqual(metrics["idle"], 1)
+        wrapper.pool.close_all()
@@ -0,0 +1,151 @@
+import re
+import unittest
+from datetime import date
+
+from django.db import connection
+from django.test import RequestFactory, TestCase
+
+from company_task_manager.manager import stats
+from company_task_manager.manager.models import (
+    Project,
+    Task,
+    TaskType,
+    Worker,
+)
+from company_task_manager.manager.pagination import keyset_filter
+from company_task_manager.manager.views import (
+    TaskListView,
+    TeamsListView,
+    WorkerListView,
+)
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN")
+class QueryPlanTest(TestCase):
+    """
+    Hot-path queries must be answered from an index: no full table scans
+    and, for paginated lists, no temporary b-tree to sort the rows.
+    """
+
+    def setUp(self):
+        self.worker = Worker.objects.create(username="worker")
+        self.project = Project.objects.create(name="Apollo", description="")
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today(),
+            priority="high",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+        self.task.assigned.add(self.worker)
+
+    def assert_indexed(self, queryset, *tables, sorted_by_index=False):
+        plan = queryset.explain()
+        # Paginated lists may walk an index in order and stop at LIMIT;
+        # everything else has to seek.
+        scan = r"(?! USING (COVERING )?INDEX)" if sorted_by_index else ""
+        for table in tables:
+            self.assertNotRegex(plan, rf"SCAN {table}\b{scan}", msg=plan)
+        if sorted_by_index:
+            self.assertNotIn("TEMP B-TREE FOR ORDER BY", plan, msg=plan)
+        return plan
+
+    def view_queryset(self, view_class, **params):
+        view = view_class()
+        request = RequestFactory().get("/", params)
+        request.user = self.worker
+        view.setup(request)
+        return view.get_queryset()
+
+    def test_task_list(self):
+        self.assert_indexed(
+            self.view_queryset(TaskListView)[:5],
+            "manager_task",
+            sorted_by_index=True,
+        )
+
+    def test_task_list_cursor_page(self):
+        queryset = self.view_queryset(TaskListView).filter(
+            keyset_filter(("deadline", "pk"), [date.today(), 1], "gt")
+        )
+        self.assert_indexed(
+            queryset[:5], "manager_task", sorted_by_index=True
+        )
+
+    def test_my_tasks(self):
+        self.assert_indexed(
+            self.view_queryset(TaskListView, show_my_tasks="on")[:5],
+            "manager_task",
+            "manager_task_assigned",
+        )
+
+    def test_task_search(self):
+        self.assert_indexed(
+            self.view_queryset(TaskListView, query="task")[:5],
+            "manager_task",
+        )
+
+    def test_open_tasks_by_deadline(self):
+        plan = self.assert_indexed(
+            Task.objects.filter(
+                is_completed=False, deadline__lt=date.today()
+            ).order_by("deadline"),
+            "manager_task",
+        )
+        self.assertIn("task_open_deadline_idx", plan)
+
+    def test_project_open_tasks(self):
+        plan = self.assert_indexed(
+            Task.objects.filter(
+                project=self.project, is_completed=False
+            ).order_by("deadline"),
+            "manager_task",
+        )
+        self.assertIn("task_project_open_idx", plan)
+
+    def test_assignee_open_tasks(self):
+        self.assert_indexed(
+            Task.objects.filter(assigned=self.worker, is_completed=False),
+            "manager_task",
+            "manager_task_assigned",
+        )
+
+    def test_worker_list(self):
+        self.assert_indexed(
+            self.view_queryset(WorkerListView)[:5],
+            "manager_worker",
+            sorted_by_index=True,
+        )
+
+    def test_team_list(self):
+        self.assert_indexed(
+            self.view_queryset(TeamsListView)[:5],
+            "manager_team",
+            sorted_by_index=True,
+        )
+
+    def test_task_detail(self):
+        self.assert_indexed(
+            Task.objects.select_related("task_type", "project").filter(
+                pk=self.task.pk
+            ),
+            "manager_task",
+            "manager_tasktype",
+            "manager_project",
+        )
+
+    def test_dashboard_projects(self):
+        self.assert_indexed(
+            Project.objects.filter(tasks__assigned=self.worker),
+            "manager_task",
+            "manager_task_assigned",
+        )
+
+    def test_worker_stats(self):
+        self.assert_indexed(
+            stats.compute_stats([self.worker.pk]),
+            "manager_task",
+            "manager_task_assigned",
+            "manager_worker",
+        )
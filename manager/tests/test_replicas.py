@@ -0,0 +1,129 @@
+import os
+import sqlite3
+import tempfile
+from datetime import date, timedelta
+
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+
+from company_task_manager.manager import autocomplete
+from company_task_manager.manager.models import (
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+from company_task_manager.manager.routers import ReplicaRouter
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_PIN_SECONDS=60)
+class ReplicaRoutingTest(TransactionTestCase):
+    """
+    Runs against a second SQLite file standing in for a replica, refreshed
+    from the primary only when ``replicate`` is called.
+    """
+
+    # The replica alias only exists once setUpClass has added it, so it
+    # cannot be named up front for the test runner.
+    databases = "__all__"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.replica_path = os.path.join(cls.directory.name, "replica.sqlite3")
+        connections.settings["replica"] = {
+            **connections.settings["default"],
+            "NAME": cls.replica_path,
+        }
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+        cls.directory.cleanup()
+
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.task = Task.objects.create(
+            name="Original",
+            description="Description",
+            deadline=date.today() + timedelta(days=3),
+            priority="low",
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+        self.client.force_login(self.worker)
+        self.replicate()
+        Task.objects.filter(pk=self.task.pk).update(name="Renamed")
+        self.url = reverse("manager:task-detail", kwargs={"pk": self.task.pk})
+
+    def replicate(self):
+        connections["replica"].close()
+        primary = connections["default"]
+        primary.ensure_connection()
+        target = sqlite3.connect(self.replica_path)
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+
+    def test_get_reads_from_replica(self):
+        response = self.client.get(self.url)
+
+        self.assertContains(response, "Original")
+        self.assertNotContains(response, "Renamed")
+        self.assertNotIn("primary_until", response.cookies)
+
+    def test_write_pins_client_to_primary(self):
+        response = self.client.post(
+            reverse("manager:task-complete", kwargs={"pk": self.task.pk})
+        )
+        self.assertIn("primary_until", response.cookies)
+
+        cache.clear()
+        self.assertContains(self.client.get(self.url), "Renamed")
+
+        self.client.cookies["primary_until"] = "0"
+        cache.clear()
+        self.assertContains(self.client.get(self.url), "Original")
+
+    def test_shared_caches_are_filled_from_primary(self):
+        # Written to the primary only, and read by GETs that are allowed
+        # to use the replica, without clearing the caches in between.
+        autocomplete.workers.reset()
+        self.worker.user_permissions.add(
+            Permission.objects.get(codename="view_position")
+        )
+        Team.objects.create(name="Core").members.add(self.worker)
+        Worker.objects.create_user(username="newcomer")
+
+        self.assertEqual(
+            self.client.get(reverse("manager:position-list")).status_code,
+            200,
+        )
+        self.assertContains(self.client.get(reverse("manager:index")), "Core")
+        response = self.client.get(
+            reverse("manager:api-worker-autocomplete"), {"q": "new"}
+        )
+        self.assertEqual(
+            [row["username"] for row in response.json()["results"]],
+            ["newcomer"],
+        )
+        # The replica itself still lags behind.
+        self.assertContains(self.client.get(self.url), "Original")
+
+    def test_reads_outside_requests_use_primary(self):
+        router = ReplicaRouter()
+
+        self.assertEqual(router.db_for_read(Task), "default")
+        self.assertEqual(router.db_for_write(Task), "default")
+        self.assertFalse(router.allow_migrate("replica", "manager"))
+        self.assertEqual(Task.objects.get(pk=self.task.pk).name, "Renamed")
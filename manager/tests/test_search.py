@@ -0,0 +1,109 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Task,
+    TaskSearchDocument,
+    Tag,
+    Project,
+    TaskType,
+    Worker,
+)
+from company_task_manager.manager.search import search_tasks
+
+
+class SearchTestCase(TestCase):
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(
+            name="Apollo",
+            description="Moon landing"
+        )
+        self.tag = Tag.objects.create(name="backend")
+        self.task = Task.objects.create(
+            name="Fix login redirect",
+            description="Users land on a blank page after login.",
+            deadline=date.today(),
+            priority="high",
+            task_type=self.task_type,
+            project=self.project,
+        )
+        self.other_task = Task.objects.create(
+            name="Write release notes",
+            description="Summarize the login changes.",
+            deadline=date.today(),
+            priority="low",
+            task_type=self.task_type,
+        )
+
+    def search(self, query):
+        return list(
+            search_tasks(Task.objects.all(), query)
+            .order_by("search_rank", "pk")
+            .values_list("name", flat=True)
+        )
+
+    def test_document_created_with_task(self):
+        document = TaskSearchDocument.objects.get(task=self.task)
+        self.assertIn("Fix login redirect", document.document)
+        self.assertIn("Apollo", document.document)
+
+    def test_search_matches_name_description_and_project(self):
+        self.assertEqual(self.search("redirect"), ["Fix login redirect"])
+        self.assertEqual(self.search("summarize"), ["Write release notes"])
+        self.assertEqual(self.search("apollo"), ["Fix login redirect"])
+
+    def test_search_matches_prefixes_of_every_term(self):
+        self.assertEqual(self.search("log red"), ["Fix login redirect"])
+        self.assertEqual(self.search("log xyz"), [])
+
+    def test_search_ranks_better_matches_first(self):
+        self.assertEqual(
+            self.search("login"),
+            ["Fix login redirect", "Write release notes"]
+        )
+
+    def test_tags_are_indexed(self):
+        self.task.tags.add(self.tag)
+        self.assertEqual(self.search("backend"), ["Fix login redirect"])
+        self.tag.tasks.clear()
+        self.assertEqual(self.search("backend"), [])
+
+    def test_renamed_project_and_tag_are_reindexed(self):
+        self.task.tags.add(self.tag)
+        self.project.name = "Artemis"
+        self.project.save()
+        self.tag.name = "frontend"
+        self.tag.save()
+        self.assertEqual(self.search("artemis"), ["Fix login redirect"])
+        self.assertEqual(self.search("frontend"), ["Fix login redirect"])
+        self.assertEqual(self.search("apollo backend"), [])
+
+    def test_deleted_tag_is_removed_from_index(self):
+        self.task.tags.add(self.tag)
+        self.tag.delete()
+        self.assertEqual(self.search("backend"), [])
+
+    def test_deleted_task_is_removed_from_index(self):
+        self.task.delete()
+        self.assertEqual(self.search("redirect"), [])
+
+    def test_rebuild_command_restores_missing_documents(self):
+        TaskSearchDocument.objects.all().delete()
+        self.assertEqual(self.search("redirect"), [])
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(self.search("redirect"), ["Fix login redirect"])
+
+    def test_task_list_view_uses_search(self):
+        Worker.objects.create_user(username="user", password="password")
+        self.client.login(username="user", password="password")
+        response = self.client.get(
+            reverse("manager:task-list"), {"query": "apollo"}
+        )
+        self.assertEqual(
+            list(response.context["task_list"]), [self.task]
+        )
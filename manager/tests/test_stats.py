@@ -0,0 +1,147 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Project,
+    ProjectMemberStats,
+    ProjectTaskStats,
+    Task,
+    TaskType,
+    Worker,
+    WorkerTaskStats,
+)
+
+
+class WorkerTaskStatsTest(TestCase):
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.other = Worker.objects.create(username="other")
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today() + timedelta(days=3),
+            priority="high",
+            task_type=self.task_type,
+        )
+
+    def assert_stats(self, worker, **expected):
+        stats = WorkerTaskStats.objects.get(worker=worker)
+        for field, value in expected.items():
+            self.assertEqual(getattr(stats, field), value, field)
+
+    def test_stats_row_created_with_worker(self):
+        self.assert_stats(self.worker, open_tasks=0, completed_tasks=0)
+
+    def test_assignment_updates_counters(self):
+        self.task.assigned.add(self.worker, self.other)
+        self.assert_stats(self.worker, open_tasks=1, high_open=1)
+        self.assert_stats(self.other, open_tasks=1, high_open=1)
+
+        self.task.assigned.remove(self.other)
+        self.assert_stats(self.other, open_tasks=0, high_open=0)
+
+        self.worker.assigned_tasks.clear()
+        self.assert_stats(self.worker, open_tasks=0, high_open=0)
+
+    def test_removing_unassigned_worker_is_ignored(self):
+        self.task.assigned.add(self.worker)
+        self.task.assigned.remove(self.other)
+        self.assert_stats(self.other, open_tasks=0)
+        self.assert_stats(self.worker, open_tasks=1)
+
+    def test_reverse_assignment_updates_counters(self):
+        self.worker.assigned_tasks.add(self.task)
+        self.assert_stats(self.worker, open_tasks=1, high_open=1)
+
+    def test_task_changes_move_counters(self):
+        self.task.assigned.add(self.worker)
+        self.task.priority = "urgent"
+        self.task.deadline = date.today() - timedelta(days=1)
+        self.task.save()
+        self.assert_stats(
+            self.worker, high_open=0, urgent_open=1, overdue_tasks=1
+        )
+
+        self.task.is_completed = True
+        self.task.save()
+        self.assert_stats(
+            self.worker,
+            open_tasks=0,
+            completed_tasks=1,
+            urgent_open=0,
+            overdue_tasks=0,
+        )
+
+    def test_passed_deadline_does_not_take_back_uncounted_overdue(self):
+        project = Project.objects.create(name="Apollo", description="")
+        self.task.project = project
+        self.task.save()
+        self.task.assigned.add(self.worker)
+        # The deadline passes without the scheduler flagging the task.
+        Task.objects.filter(pk=self.task.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        task = Task.objects.get(pk=self.task.pk)
+
+        task.is_completed = True
+        task.save()
+
+        self.assert_stats(self.worker, completed_tasks=1, overdue_tasks=0)
+        self.assertEqual(
+            ProjectTaskStats.objects.get(project=project).overdue_tasks, 0
+        )
+        self.assertEqual(
+            ProjectMemberStats.objects.get(
+                project=project, worker=self.worker
+            ).overdue_tasks,
+            0,
+        )
+
+    def test_reconcile_agrees_with_incremental_overdue(self):
+        self.task.assigned.add(self.worker)
+        Task.objects.filter(pk=self.task.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        call_command("reconcile_worker_stats", stdout=StringIO())
+        self.assert_stats(self.worker, overdue_tasks=0)
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.is_completed = True
+        task.save()
+
+        self.assert_stats(self.worker, completed_tasks=1, overdue_tasks=0)
+        out = StringIO()
+        call_command("reconcile_worker_stats", stdout=out)
+        self.assertIn("repaired 0", out.getvalue())
+
+    def test_deleting_task_releases_counters(self):
+        self.task.assigned.add(self.worker)
+        self.task.delete()
+        self.assert_stats(self.worker, open_tasks=0, high_open=0)
+
+    def test_complete_view_updates_counters(self):
+        self.task.assigned.add(self.worker)
+        self.client.login(username="worker", password="password")
+        self.client.post(
+            reverse("manager:task-complete", kwargs={"pk": self.task.pk})
+        )
+        self.assert_stats(self.worker, open_tasks=0, completed_tasks=1)
+
+    def test_reconcile_repairs_drift(self):
+        self.task.assigned.add(self.worker)
+        WorkerTaskStats.objects.filter(worker=self.worker).update(
+            open_tasks=42
+        )
+        WorkerTaskStats.objects.filter(worker=self.other).delete()
+        out = StringIO()
+        call_command("reconcile_worker_stats", stdout=out)
+        self.assertIn("repaired 2", out.getvalue())
+        self.assert_stats(self.worker, open_tasks=1, high_open=1)
+        self.assert_stats(self.other, open_tasks=0)
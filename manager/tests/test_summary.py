@@ -0,0 +1,221 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company_task_manager.manager.bulk import apply_action
+from company_task_manager.manager.models import (
+    Project,
+    ProjectMemberStats,
+    ProjectTaskStats,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+
+class ProjectSummaryTest(TestCase):
+    def setUp(self):
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(name="Apollo", description="")
+        self.other_project = Project.objects.create(
+            name="Gemini", description=""
+        )
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password"
+        )
+        self.other = Worker.objects.create(username="other")
+        self.task = self.create_task("Task", priority="high")
+
+    def create_task(self, name, project=None, **fields):
+        fields.setdefault("deadline", date.today() + timedelta(days=3))
+        fields.setdefault("priority", "low")
+        return Task.objects.create(
+            name=name,
+            description="Description",
+            task_type=self.task_type,
+            project=project or self.project,
+            **fields,
+        )
+
+    def assert_project(self, project, **expected):
+        stats = ProjectTaskStats.objects.get(project=project)
+        for field, value in expected.items():
+            self.assertEqual(getattr(stats, field), value, field)
+
+    def member_stats(self, project):
+        return dict(
+            (row[0], row[1:])
+            for row in ProjectMemberStats.objects.filter(
+                project=project
+            ).values_list("worker__username", "open_tasks", "overdue_tasks")
+        )
+
+    def test_task_changes_update_project_counters(self):
+        self.assert_project(self.project, open_tasks=1, high_open=1)
+
+        self.task.priority = "urgent"
+        self.task.deadline = date.today() - timedelta(days=1)
+        self.task.save()
+        self.assert_project(
+            self.project, high_open=0, urgent_open=1, overdue_tasks=1
+        )
+
+        self.task.is_completed = True
+        self.task.save()
+        self.assert_project(
+            self.project,
+            open_tasks=0,
+            completed_tasks=1,
+            total_tasks=1,
+            overdue_tasks=0,
+        )
+
+    def test_moving_task_between_projects(self):
+        self.task.assigned.add(self.worker)
+        self.task.project = self.other_project
+        self.task.save()
+
+        self.assert_project(self.project, open_tasks=0, high_open=0)
+        self.assert_project(self.other_project, open_tasks=1, high_open=1)
+        self.assertEqual(self.member_stats(self.project), {"worker": (0, 0)})
+        self.assertEqual(
+            self.member_stats(self.other_project), {"worker": (1, 0)}
+        )
+
+    def test_assignments_update_member_counters(self):
+        late = self.create_task(
+            "Late", deadline=date.today() - timedelta(days=1)
+        )
+        self.task.assigned.add(self.worker, self.other)
+        self.worker.assigned_tasks.add(late)
+        self.assertEqual(
+            self.member_stats(self.project),
+            {"worker": (2, 1), "other": (1, 0)},
+        )
+
+        self.task.assigned.remove(self.other)
+        self.worker.assigned_tasks.clear()
+        self.assertEqual(
+            self.member_stats(self.project),
+            {"worker": (0, 0), "other": (0, 0)},
+        )
+
+    def test_deleting_tasks_and_projects(self):
+        self.task.assigned.add(self.worker)
+        self.task.delete()
+        self.assert_project(self.project, open_tasks=0, high_open=0)
+        self.assertEqual(self.member_stats(self.project), {"worker": (0, 0)})
+
+        self.create_task("Other").assigned.add(self.worker)
+        self.project.delete()
+        self.assertFalse(ProjectTaskStats.objects.filter(
+            project_id=self.project.pk
+        ).exists())
+        self.assertFalse(ProjectMemberStats.objects.exists())
+
+    def test_bulk_actions_refresh_summary(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_action(
+                self.worker, Task.objects.all(), "assign",
+                workers=[self.worker],
+            )
+        self.assertEqual(self.member_stats(self.project), {"worker": (1, 0)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_action(self.worker, Task.objects.all(), "complete")
+        self.assert_project(self.project, open_tasks=0, completed_tasks=1)
+        self.assertEqual(self.member_stats(self.project), {"worker": (0, 0)})
+
+    def test_rebuild_repairs_drift(self):
+        self.task.assigned.add(self.worker)
+        ProjectTaskStats.objects.filter(project=self.project).update(
+            open_tasks=42
+        )
+        ProjectTaskStats.objects.filter(project=self.other_project).delete()
+        ProjectMemberStats.objects.all().delete()
+        out = StringIO()
+
+        call_command("rebuild_project_summary", stdout=out)
+
+        self.assertIn("Rebuilt 2 project summaries", out.getvalue())
+        self.assert_project(self.project, open_tasks=1, high_open=1)
+        self.assert_project(self.other_project, open_tasks=0)
+        self.assertEqual(self.member_stats(self.project), {"worker": (1, 0)})
+
+    def test_rebuild_agrees_with_incremental_overdue(self):
+        self.task.assigned.add(self.worker)
+        # The deadline passes without the scheduler flagging the task.
+        Task.objects.filter(pk=self.task.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        call_command("rebuild_project_summary", stdout=StringIO())
+        task = Task.objects.get(pk=self.task.pk)
+
+        task.is_completed = True
+        task.save()
+
+        self.assert_project(self.project, completed_tasks=1, overdue_tasks=0)
+        self.assertEqual(self.member_stats(self.project), {"worker": (0, 0)})
+
+
+class ProjectDetailViewTest(TestCase):
+    def setUp(self):
+        task_type = TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(name="Apollo", description="")
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password", first_name="Ann"
+        )
+        outsider = Worker.objects.create(username="outsider")
+        team = Team.objects.create(name="Core")
+        team.members.add(self.worker)
+        team.project.add(self.project)
+        for number in range(3):
+            task = Task.objects.create(
+                name=f"Task {number}",
+                description="Description",
+                deadline=date.today() + timedelta(days=number - 1),
+                priority="low",
+                task_type=task_type,
+                project=self.project,
+                is_completed=number == 2,
+            )
+            task.assigned.add(self.worker, outsider)
+        self.client.force_login(self.worker)
+        self.url = reverse(
+            "manager:project-detail", kwargs={"pk": self.project.pk}
+        )
+
+    def test_reads_only_from_summary(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([
+            query["sql"] for query in queries
+            if '"manager_task"' in query["sql"]
+        ])
+        self.assertEqual(response.context["project"].task_stats.open_tasks, 2)
+        self.assertContains(response, "1 of 3 tasks completed")
+
+        workload = response.context["teams"][0]
+        self.assertEqual(workload["team"].name, "Core")
+        self.assertEqual(
+            [(member["worker"].username, member["open_tasks"],
+              member["overdue_tasks"]) for member in workload["members"]],
+            [("worker", 2, 1)],
+        )
+        others = response.context["others"]
+        self.assertEqual(
+            [member["worker"].username for member in others], ["outsider"]
+        )
+
+    def test_num_queries(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(6):
+            self.client.get(self.url)
@@ -0,0 +1,132 @@
+import os
+import tempfile
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from company_task_manager.manager.models import (
+    Position,
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+    WorkerTaskStats,
+)
+from company_task_manager.manager.search import search_tasks
+
+
+class TransferTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.worker = Worker.objects.create_user(
+            username="worker",
+            password="password",
+            first_name="John",
+            position=Position.objects.create(name="Developer"),
+        )
+        project = Project.objects.create(name="Apollo", description="")
+        task = Task.objects.create(
+            name="Fix login",
+            description="Description",
+            deadline=date(2030, 1, 1),
+            priority="high",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=project,
+        )
+        task.assigned.add(self.worker)
+        task.tags.add(Tag.objects.create(name="backend"))
+        team = Team.objects.create(name="Rocket")
+        team.members.add(self.worker)
+        team.project.add(project)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def export(self, entity, name):
+        err = StringIO()
+        call_command(
+            "export_data", entity, output=self.path(name),
+            stdout=StringIO(), stderr=err,
+        )
+        return err.getvalue()
+
+    def import_(self, entity, name):
+        out = StringIO()
+        call_command("import_data", entity, self.path(name), stdout=out)
+        return out.getvalue()
+
+    def roundtrip(self, extension):
+        for entity in ("workers", "tasks", "teams"):
+            self.assertTrue(
+                self.export(entity, f"{entity}.{extension}").startswith(
+                    f"Exported 1 {entity} in "
+                )
+            )
+        Task.objects.all().delete()
+        Team.objects.all().delete()
+        Worker.objects.all().delete()
+        for entity in ("workers", "tasks", "teams"):
+            self.import_(entity, f"{entity}.{extension}")
+
+        worker = Worker.objects.get(username="worker")
+        self.assertTrue(worker.check_password("password"))
+        self.assertEqual(worker.position.name, "Developer")
+
+        task = Task.objects.get(name="Fix login")
+        self.assertEqual(task.project.name, "Apollo")
+        self.assertEqual(task.deadline, date(2030, 1, 1))
+        self.assertEqual(list(task.assigned.all()), [worker])
+        self.assertEqual(
+            list(task.tags.values_list("name", flat=True)), ["backend"]
+        )
+
+        team = Team.objects.get(name="Rocket")
+        self.assertEqual(list(team.members.all()), [worker])
+        self.assertEqual(
+            list(team.project.values_list("name", flat=True)), ["Apollo"]
+        )
+
+        self.assertEqual(
+            WorkerTaskStats.objects.get(worker=worker).open_tasks, 1
+        )
+        self.assertEqual(
+            list(search_tasks(Task.objects.all(), "backend")), [task]
+        )
+
+    def test_jsonl_roundtrip(self):
+        self.roundtrip("jsonl")
+
+    def test_csv_roundtrip(self):
+        self.roundtrip("csv")
+
+    def test_import_upserts_by_natural_key(self):
+        self.export("tasks", "tasks.jsonl")
+        Task.objects.update(priority="low", description="Changed")
+        Task.objects.get().assigned.clear()
+
+        output = self.import_("tasks", "tasks.jsonl")
+        self.assertIn("Imported 1 tasks", output)
+        task = Task.objects.get()
+        self.assertEqual(task.priority, "high")
+        self.assertEqual(task.description, "Description")
+        self.assertEqual(list(task.assigned.all()), [self.worker])
+
+    def test_unknown_usernames_are_reported(self):
+        with open(self.path("tasks.jsonl"), "w") as stream:
+            stream.write(
+                '{"name": "New", "description": "", "deadline": '
+                '"2030-01-01", "is_completed": false, "priority": "low", '
+                '"task_type": "Chore", "project": "", '
+                '"assigned": ["ghost", "worker"], "tags": []}\n'
+            )
+        output = self.import_("tasks", "tasks.jsonl")
+        self.assertIn("Skipped 1 unknown usernames", output)
+        task = Task.objects.get(name="New")
+        self.assertIsNone(task.project)
+        self.assertEqual(list(task.assigned.all()), [self.worker])
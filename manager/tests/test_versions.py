@@ -0,0 +1,135 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from company_task_manager.manager.models import (
+    Position,
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+
+class FragmentVersionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.worker = Worker.objects.create_user(
+            username="worker", password="password", is_superuser=True
+        )
+        self.project = Project.objects.create(name="Apollo", description="")
+        self.task = Task.objects.create(
+            name="Task",
+            description="Description",
+            deadline=date.today(),
+            priority="low",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+        self.team = Team.objects.create(name="Rocket")
+        self.client.force_login(self.worker)
+
+    def version(self, obj):
+        return type(obj).objects.values_list(
+            "version", flat=True
+        ).get(pk=obj.pk)
+
+    def test_save_bumps_version(self):
+        self.task.name = "Renamed"
+        self.task.save()
+
+        self.assertEqual(self.task.version, 2)
+        self.assertEqual(self.version(self.task), 2)
+
+    def test_save_after_concurrent_bump_gets_a_new_version(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        self.worker.username = "renamed"
+        self.task.assigned.add(self.worker)
+        self.worker.save()
+        bumped = self.version(self.task)
+
+        stale.description = "Changed"
+        stale.save()
+
+        self.assertEqual(stale.version, bumped + 1)
+        self.assertEqual(self.version(self.task), bumped + 1)
+
+    def test_save_with_update_fields_bumps_version(self):
+        self.task.name = "Renamed"
+        self.task.save(update_fields=["name"])
+
+        self.assertEqual(self.task.version, 2)
+        self.assertEqual(self.version(self.task), 2)
+
+    def test_login_does_not_bump_worker(self):
+        self.client.login(username="worker", password="password")
+        self.assertEqual(self.version(self.worker), 1)
+
+    def test_m2m_changes_bump_owner(self):
+        self.task.assigned.add(self.worker)
+        self.assertEqual(self.version(self.task), 2)
+        self.assertEqual(self.task.version, 2)
+
+        self.worker.assigned_tasks.remove(self.task)
+        self.assertEqual(self.version(self.task), 3)
+
+        self.team.members.add(self.worker)
+        self.worker.teams.clear()
+        self.assertEqual(self.version(self.team), 3)
+
+    def test_displayed_objects_bump_dependents(self):
+        self.team.project.add(self.project)
+        self.task.assigned.add(self.worker)
+        self.worker.task_completed.add(self.task)
+        team_version = self.version(self.team)
+        task_version = self.version(self.task)
+        worker_version = self.version(self.worker)
+
+        self.project.name = "Artemis"
+        self.project.save()
+        self.assertEqual(self.version(self.team), team_version + 1)
+        self.assertEqual(self.version(self.task), task_version + 1)
+
+        self.task.refresh_from_db()
+        self.task.name = "Renamed"
+        self.task.save()
+        self.assertEqual(self.version(self.worker), worker_version + 1)
+
+        tag = Tag.objects.create(name="backend")
+        self.task.tags.add(tag)
+        task_version = self.version(self.task)
+        tag.delete()
+        self.assertEqual(self.version(self.task), task_version + 1)
+
+    def test_position_rename_bumps_workers(self):
+        position = Position.objects.create(name="Developer")
+        Worker.objects.filter(pk=self.worker.pk).update(position=position)
+
+        position.name = "Engineer"
+        position.save()
+
+        self.assertEqual(self.version(self.worker), 2)
+
+    def test_cached_row_follows_version(self):
+        url = reverse("manager:task-list")
+        self.assertContains(self.client.get(url), "Task</a>")
+
+        Task.objects.filter(pk=self.task.pk).update(name="Hidden")
+        self.assertContains(self.client.get(url), "Task</a>")
+
+        self.task.refresh_from_db()
+        self.task.name = "Shown"
+        self.task.save()
+        self.assertContains(self.client.get(url), "Shown</a>")
+
+    def test_cached_detail_follows_assignment(self):
+        url = reverse("manager:task-detail", kwargs={"pk": self.task.pk})
+        self.assertNotContains(self.client.get(url), "worker (")
+
+        self.task.assigned.add(self.worker)
+
+        self.assertContains(self.client.get(url), "worker (")
@@ -1,4 +1,7 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.core.cache import cache
+from django.db import connection
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
@@ -391,3 +394,167 @@ class PositionUpdateViewTest(BaseTestCase):
         self.assertEqual(response.status_code, 302)
         self.position.refresh_from_db()
         self.assertEqual(self.position.name, "Updated Position")
+
+
+class QueryCountTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user.is_superuser = True
+        self.user.save()
+        for i in range(8):
+            worker = Worker.objects.create(
+                username=f"member{i}",
+                position=self.position
+            )
+            self.team.members.add(worker)
+            task = Task.objects.create(
+                name=f"Task {i}",
+                description="Description",
+                project=Project.objects.create(
+                    name=f"Project {i}",
+                    description="Description"
+                ),
+                task_type=self.task_type,
+                deadline=datetime.now() + timedelta(days=i)
+            )
+            task.assigned.add(worker, self.user)
+            task.tags.add(self.tag, Tag.objects.create(name=f"Tag {i}"))
+            worker.task_completed.add(task)
+            worker.tasks_not_completed.add(self.task)
+            self.team.project.add(task.project)
+            Team.objects.create(name=f"Team {i}").project.add(
+                task.project, self.project
+            )
+        self.client.force_login(self.user)
+
+    def assert_get_num_queries(self, num, url_name, kwargs=None):
+        url = reverse(url_name, kwargs=kwargs)
+        with self.assertNumQueries(num):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_index_view(self):
+        self.assert_get_num_queries(4, "manager:index")
+
+    # List and detail views run one extra validator query for conditional
+    # GET.
+    def test_task_list_view(self):
+        self.assert_get_num_queries(5, "manager:task-list")
+        Task.objects.create(
+            name="Extra Task",
+            description="Description",
+            project=Project.objects.create(name="Extra", description=""),
+            task_type=self.task_type,
+            deadline=datetime.now()
+        )
+        self.assert_get_num_queries(5, "manager:task-list")
+
+    def test_task_detail_view(self):
+        task = Task.objects.get(name="Task 0")
+        self.assert_get_num_queries(
+            6, "manager:task-detail", kwargs={"pk": task.pk}
+        )
+
+    def test_worker_list_view(self):
+        self.assert_get_num_queries(7, "manager:worker-list")
+
+    def test_worker_detail_view(self):
+        worker = Worker.objects.get(username="member0")
+        self.assert_get_num_queries(
+            6, "manager:worker-detail", kwargs={"pk": worker.pk}
+        )
+
+    def test_team_list_view(self):
+        self.assert_get_num_queries(6, "manager:team-list")
+
+    def test_team_detail_view(self):
+        self.assert_get_num_queries(
+            6, "manager:team-detail", kwargs={"pk": self.team.pk}
+        )
+
+    def test_tag_list_view(self):
+        self.assert_get_num_queries(3, "manager:tag-list")
+
+    def test_position_list_view(self):
+        self.assert_get_num_queries(3, "manager:position-list")
+
+    def test_task_update_view(self):
+        self.assert_get_num_queries(
+            7, "manager:task-update", kwargs={"pk": self.task.pk}
+        )
+
+    def test_team_update_view(self):
+        self.assert_get_num_queries(
+            7, "manager:team-update", kwargs={"pk": self.team.pk}
+        )
+
+
+@override_settings(PAGINATION_MODE="cursor")
+class CursorPaginationTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(11):
+            Task.objects.create(
+                name=f"Paged Task {i:02}",
+                description="Description",
+                task_type=self.task_type,
+                deadline=datetime(2024, 1, 1) + timedelta(days=i // 2)
+            )
+
+    def get_page(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("manager:task-list"), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in queries)
+        )
+        return response
+
+    def test_walks_forward_and_back_without_count(self):
+        response = self.get_page({})
+        names = [task.name for task in response.context["task_list"]]
+        self.assertEqual(names, [f"Paged Task {i:02}" for i in range(5)])
+        self.assertFalse(response.context["page_obj"].has_previous())
+
+        pages = [names]
+        while response.context["page_obj"].has_next():
+            response = self.get_page(
+                {"cursor": response.context["page_obj"].next_cursor}
+            )
+            pages.append(
+                [task.name for task in response.context["task_list"]]
+            )
+        seen = [name for page in pages for name in page]
+        self.assertEqual(
+            seen,
+            [f"Paged Task {i:02}" for i in range(11)] + [self.task.name]
+        )
+
+        response = self.get_page(
+            {"cursor": response.context["page_obj"].previous_cursor}
+        )
+        self.assertEqual(
+            [task.name for task in response.context["task_list"]],
+            pages[-2]
+        )
+
+    def test_cursor_survives_search_query(self):
+        response = self.get_page({"query": "paged"})
+        next_cursor = response.context["page_obj"].next_cursor
+        self.assertContains(response, f"cursor={next_cursor}")
+        self.assertContains(response, "query=paged")
+        response = self.get_page({"query": "paged", "cursor": next_cursor})
+        self.assertEqual(len(response.context["task_list"]), 5)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(
+            reverse("manager:task-list"), {"cursor": "garbage"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_worker_and_team_lists(self):
+        for url_name in ("manager:worker-list", "manager:team-list"):
+            response = self.client.get(reverse(url_name))
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNone(response.context["paginator"])
@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase
+
+from company_task_manager.manager import urls as manager_urls
+from company_task_manager.manager import warmup
+from company_task_manager.manager.benchmarks import runner
+from company_task_manager.manager.management.commands.profile_imports import (
+    parse_importtime,
+)
+
+BUDGETS = Path(runner.__file__).with_name("budgets.json")
+
+STARTUP_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import core.wsgi
+imported = time.perf_counter()
+from manager import warmup
+warmup.warmup(open_db=False)
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "warmup_ms": (time.perf_counter() - imported) * 1000,
+}))
+"""
+
+
+class WarmupTest(TestCase):
+    def test_warmup_compiles_templates_and_resolves_routes(self):
+        names = warmup.template_names()
+        self.assertIn("manager/task_list.html", names)
+        self.assertIn("includes/pagination.html", names)
+        self.assertIn(f"{settings.CRISPY_TEMPLATE_PACK}/field.html", names)
+
+        with self.assertLogs("manager.performance", "INFO"):
+            record = warmup.warmup()
+
+        self.assertEqual(record["templates"], len(names))
+        self.assertEqual(record["routes"], len(manager_urls.urlpatterns))
+        self.assertEqual(record["connections"], 1)
+
+    def test_parse_importtime(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     django.utils\n"
+            "import time:      3000 |       3120 |   django.conf\n"
+        )
+
+        self.assertEqual(parse_importtime(output), [
+            ("django.utils", 120, 120),
+            ("django.conf", 3000, 3120),
+        ])
+
+    def test_profile_imports_lists_slowest_imports(self):
+        out = StringIO()
+
+        call_command("profile_imports", "--limit", "3", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("Imported core.wsgi in "))
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[2].endswith("core.wsgi"))
+
+    def test_startup_within_budget(self):
+        budget = json.loads(BUDGETS.read_text())["startup"]
+        result = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": "core.settings",
+                "DJANGO_DEBUG": "False",
+            },
+            check=True,
+        )
+        timings = json.loads(result.stdout.splitlines()[-1])
+
+        for metric, limit in budget.items():
+            self.assertLessEqual(
+                timings[metric], limit, f"{metric} over startup budget"
+            )
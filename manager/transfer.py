@@ -0,0 +1,383 @@
+import csv
+import json
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Prefetch
+
+from manager import stats
+from manager.assignment import AutoAssigner
+from manager.models import (
+    Position,
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+from manager.signals import bulk_changed
+
+LIST_SEPARATOR = "|"
+
+TASK_FIELDS = (
+    "name", "description", "deadline", "is_completed", "priority",
+    "task_type", "project", "assigned", "tags",
+)
+WORKER_FIELDS = (
+    "username", "password", "first_name", "last_name", "email",
+    "is_staff", "is_superuser", "is_active", "position",
+)
+TEAM_FIELDS = ("name", "members", "projects")
+LIST_FIELDS = {"assigned", "tags", "members", "projects"}
+BOOLEAN_FIELDS = {"is_completed", "is_staff", "is_superuser", "is_active"}
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def write_records(records, fields, stream, fmt):
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=fields)
+        writer.writeheader()
+    count = 0
+    for record in records:
+        if fmt == "csv":
+            writer.writerow({
+                field: LIST_SEPARATOR.join(value)
+                if field in LIST_FIELDS else value
+                for field, value in record.items()
+            })
+        else:
+            stream.write(json.dumps(record, default=str) + "\n")
+        count += 1
+    return count
+
+
+def read_records(stream, fmt):
+    if fmt != "csv":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+        return
+
+    for row in csv.DictReader(stream):
+        record = {}
+        for field, value in row.items():
+            if field in LIST_FIELDS:
+                value = [item for item in value.split(LIST_SEPARATOR) if item]
+            elif field in BOOLEAN_FIELDS:
+                value = value.strip().lower() in ("1", "true", "yes")
+            record[field] = value
+        yield record
+
+
+def export_tasks(chunk_size=2000):
+    tasks = Task.objects.select_related(
+        "task_type", "project"
+    ).prefetch_related(
+        Prefetch("assigned", queryset=Worker.objects.only("username")),
+        Prefetch("tags", queryset=Tag.objects.only("name")),
+    ).order_by("pk")
+    for task in tasks.iterator(chunk_size=chunk_size):
+        yield {
+            "name": task.name,
+            "description": task.description,
+            "deadline": task.deadline.isoformat(),
+            "is_completed": task.is_completed,
+            "priority": task.priority,
+            "task_type": task.task_type.name,
+            "project": task.project.name if task.project else "",
+            "assigned": [worker.username for worker in task.assigned.all()],
+            "tags": [tag.name for tag in task.tags.all()],
+        }
+
+
+def export_workers(chunk_size=2000):
+    workers = Worker.objects.select_related("position").order_by("pk")
+    for worker in workers.iterator(chunk_size=chunk_size):
+        yield {
+            "username": worker.username,
+            "password": worker.password,
+            "first_name": worker.first_name,
+            "last_name": worker.last_name,
+            "email": worker.email,
+            "is_staff": worker.is_staff,
+            "is_superuser": worker.is_superuser,
+            "is_active": worker.is_active,
+            "position": worker.position.name if worker.position else "",
+        }
+
+
+def export_teams(chunk_size=2000):
+    teams = Team.objects.prefetch_related(
+        Prefetch("members", queryset=Worker.objects.only("username")),
+        Prefetch("project", queryset=Project.objects.only("name")),
+    ).order_by("pk")
+    for team in teams.iterator(chunk_size=chunk_size):
+        yield {
+            "name": team.name,
+            "members": [worker.username for worker in team.members.all()],
+            "projects": [project.name for project in team.project.all()],
+        }
+
+
+def listed(batch, field):
+    return (name for record in batch for name in record.get(field, []))
+
+
+def resolve_names(model, names, defaults=None):
+    """
+    Map names to primary keys, creating the missing rows in one insert.
+    """
+    names = {name for name in names if name}
+    found = dict(
+        model.objects.filter(name__in=names).values_list("name", "pk")
+    )
+    missing = names - found.keys()
+    if missing:
+        model.objects.bulk_create(
+            [model(name=name, **(defaults or {})) for name in missing]
+        )
+        found.update(
+            model.objects.filter(name__in=missing).values_list("name", "pk")
+        )
+    return found
+
+
+def resolve_usernames(usernames, report):
+    usernames = set(usernames)
+    found = dict(
+        Worker.objects.filter(
+            username__in=usernames
+        ).values_list("username", "pk")
+    )
+    report.skipped_references += len(usernames - found.keys())
+    return found
+
+
+def replace_relations(through, owner_field, target_field, links):
+    """
+    Replace the m2m rows of every owner in ``links`` ({owner_id: target_ids})
+    with a delete and a bulk insert, returning the previous target ids.
+    """
+    existing = through.objects.filter(**{f"{owner_field}__in": links})
+    previous = set(existing.values_list(target_field, flat=True))
+    existing.delete()
+    through.objects.bulk_create(
+        [
+            through(**{owner_field: owner_id, target_field: target_id})
+            for owner_id, target_ids in links.items()
+            for target_id in target_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return previous
+
+
+def upsert(model, objects, key, lookup_field, fields):
+    """
+    Update the rows whose natural key ``key(obj)`` matches one of
+    ``objects`` and insert the others. ``lookup_field`` narrows the query
+    for existing rows. Returns the saved objects keyed by natural key.
+    """
+    lookup = {key(obj): obj for obj in objects}
+    candidates = model.objects.filter(**{
+        f"{lookup_field}__in": {
+            getattr(obj, lookup_field) for obj in lookup.values()
+        }
+    }).order_by("pk")
+
+    existing = {}
+    for obj in candidates:
+        existing.setdefault(key(obj), obj)
+
+    to_update, to_create = [], []
+    for obj_key, obj in lookup.items():
+        if obj_key in existing:
+            obj.pk = existing[obj_key].pk
+            to_update.append(obj)
+        else:
+            to_create.append(obj)
+    model.objects.bulk_update(to_update, fields)
+    model.objects.bulk_create(to_create)
+    return lookup
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.skipped_references = 0
+
+
+def import_tasks(records, report, batch_size=1000, auto_assign=False):
+    for batch in batched(records, batch_size):
+        with transaction.atomic():
+            task_types = resolve_names(
+                TaskType, (record["task_type"] for record in batch)
+            )
+            projects = resolve_names(
+                Project,
+                (record.get("project") for record in batch),
+                defaults={"description": ""},
+            )
+            tags = resolve_names(Tag, listed(batch, "tags"))
+            workers = resolve_usernames(listed(batch, "assigned"), report)
+
+            tasks = upsert(
+                Task,
+                [
+                    Task(
+                        name=record["name"],
+                        description=record["description"],
+                        deadline=record["deadline"],
+                        is_completed=record["is_completed"],
+                        is_overdue=stats.is_overdue(
+                            record["is_completed"], record["deadline"]
+                        ),
+                        priority=record["priority"],
+                        task_type_id=task_types[record["task_type"]],
+                        project_id=projects.get(record.get("project")),
+                    )
+                    for record in batch
+                ],
+                key=lambda task: (task.name, task.project_id),
+                lookup_field="name",
+                fields=[
+                    "description", "deadline", "is_completed",
+                    "is_overdue", "priority", "task_type",
+                ],
+            )
+            assigned, tagged = {}, {}
+            for record in batch:
+                task = tasks[
+                    (record["name"], projects.get(record.get("project")))
+                ]
+                assigned[task.pk] = {
+                    workers[name] for name in record.get("assigned", [])
+                    if name in workers
+                }
+                tagged[task.pk] = {
+                    tags[name] for name in record.get("tags", [])
+                }
+            if auto_assign:
+                unassigned = [
+                    task for task in tasks.values() if not assigned[task.pk]
+                ]
+                assigner = AutoAssigner(
+                    {task.project_id for task in unassigned}
+                )
+                for task_id, worker_ids in assigner.assign(
+                    unassigned
+                ).items():
+                    assigned[task_id] = set(worker_ids)
+
+            previous = replace_relations(
+                Task.assigned.through, "task_id", "worker_id", assigned
+            )
+            replace_relations(Task.tags.through, "task_id", "tag_id", tagged)
+            bulk_changed.send(
+                sender=Task,
+                task_ids=list(assigned),
+                worker_ids=previous.union(*assigned.values()),
+            )
+        report.rows += len(batch)
+        yield report
+
+
+def import_workers(records, report, batch_size=1000):
+    for batch in batched(records, batch_size):
+        with transaction.atomic():
+            positions = resolve_names(
+                Position, (record.get("position") for record in batch)
+            )
+            workers = upsert(
+                Worker,
+                [
+                    Worker(
+                        username=record["username"],
+                        password=(
+                            record.get("password") or make_password(None)
+                        ),
+                        first_name=record.get("first_name", ""),
+                        last_name=record.get("last_name", ""),
+                        email=record.get("email", ""),
+                        is_staff=record.get("is_staff", False),
+                        is_superuser=record.get("is_superuser", False),
+                        is_active=record.get("is_active", True),
+                        position_id=positions.get(record.get("position")),
+                    )
+                    for record in batch
+                ],
+                key=lambda worker: worker.username,
+                lookup_field="username",
+                fields=[
+                    "password", "first_name", "last_name", "email",
+                    "is_staff", "is_superuser", "is_active", "position",
+                ],
+            )
+            bulk_changed.send(
+                sender=Worker,
+                worker_ids=[worker.pk for worker in workers.values()],
+            )
+        report.rows += len(batch)
+        yield report
+
+
+def import_teams(records, report, batch_size=1000):
+    for batch in batched(records, batch_size):
+        with transaction.atomic():
+            projects = resolve_names(
+                Project,
+                listed(batch, "projects"),
+                defaults={"description": ""},
+            )
+            workers = resolve_usernames(listed(batch, "members"), report)
+            teams = upsert(
+                Team,
+                [Team(name=record["name"]) for record in batch],
+                key=lambda team: team.name,
+                lookup_field="name",
+                fields=["name"],
+            )
+            members, linked = {}, {}
+            for record in batch:
+                team = teams[record["name"]]
+                members[team.pk] = {
+                    workers[name] for name in record.get("members", [])
+                    if name in workers
+                }
+                linked[team.pk] = {
+                    projects[name] for name in record.get("projects", [])
+                }
+
+            previous = replace_relations(
+                Team.members.through, "team_id", "worker_id", members
+            )
+            replace_relations(
+                Team.project.through, "team_id", "project_id", linked
+            )
+            bulk_changed.send(
+                sender=Team,
+                worker_ids=previous.union(*members.values()),
+                team_ids=list(members),
+            )
+        report.rows += len(batch)
+        yield report
+
+
+EXPORTERS = {
+    "tasks": (export_tasks, TASK_FIELDS),
+    "workers": (export_workers, WORKER_FIELDS),
+    "teams": (export_teams, TEAM_FIELDS),
+}
+
+IMPORTERS = {
+    "tasks": import_tasks,
+    "workers": import_workers,
+    "teams": import_teams,
+}
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 
 from manager.views import (
@@ -8,6 +9,8 @@ from manager.views import (
     TaskCompleteView,
     TaskUpdateView,
     TaskDeleteView,
+    TaskBulkActionView,
+    TaskHistoryView,
     WorkerListView,
     WorkerDetailView,
     WorkerCreateView,
@@ -26,8 +29,28 @@ from manager.views import (
     PositionCreateView,
     PositionUpdateView,
     PositionDeleteView,
+    ProjectDetailView,
+    TaskApiView,
+    WorkerApiView,
+    WorkerAutocompleteView,
+    TeamApiView,
+    ProjectApiView,
+    TagApiView,
+    AsyncTaskListView,
+    AsyncTaskDetailView,
+    AsyncWorkerListView,
+    AsyncWorkerDetailView,
+    AsyncTeamsListView,
+    AsyncTeamDetailView,
 )
 
+
+def read_view(view_class, async_view_class):
+    if settings.ASYNC_VIEWS:
+        return async_view_class.as_view()
+    return view_class.as_view()
+
+
 urlpatterns = [
     path(
         "",
@@ -36,12 +59,12 @@ urlpatterns = [
     ),
     path(
         "tasks/",
-        TaskListView.as_view(),
+        read_view(TaskListView, AsyncTaskListView),
         name="task-list",
     ),
     path(
         "tasks/<int:pk>/",
-        TaskDetailView.as_view(),
+        read_view(TaskDetailView, AsyncTaskDetailView),
         name="task-detail",
     ),
     path(
@@ -49,6 +72,16 @@ urlpatterns = [
         TaskCompleteView.as_view(),
         name="task-complete"
     ),
+    path(
+        "tasks/<int:pk>/history/",
+        TaskHistoryView.as_view(),
+        name="task-history"
+    ),
+    path(
+        "tasks/bulk/",
+        TaskBulkActionView.as_view(),
+        name="task-bulk"
+    ),
     path(
         "tasks/create/",
         TaskCreateView.as_view(),
@@ -66,12 +99,12 @@ urlpatterns = [
     ),
     path(
         "workers/",
-        WorkerListView.as_view(),
+        read_view(WorkerListView, AsyncWorkerListView),
         name="worker-list"
     ),
     path(
         "workers/<int:pk>/",
-        WorkerDetailView.as_view(),
+        read_view(WorkerDetailView, AsyncWorkerDetailView),
         name="worker-detail"
     ),
     path(
@@ -91,12 +124,12 @@ urlpatterns = [
     ),
     path(
         "teams/",
-        TeamsListView.as_view(),
+        read_view(TeamsListView, AsyncTeamsListView),
         name="team-list",
     ),
     path(
         "teams/<int:pk>/",
-        TeamDetailView.as_view(),
+        read_view(TeamDetailView, AsyncTeamDetailView),
         name="team-detail"
     ),
     path(
@@ -114,6 +147,11 @@ urlpatterns = [
         TeamDeleteView.as_view(),
         name="team-delete"
     ),
+    path(
+        "projects/<int:pk>/",
+        ProjectDetailView.as_view(),
+        name="project-detail"
+    ),
     path(
         "tags/",
         TagListView.as_view(),
@@ -154,6 +192,36 @@ urlpatterns = [
         PositionDeleteView.as_view(),
         name="position-delete"
     ),
+    path(
+        "api/tasks/",
+        TaskApiView.as_view(),
+        name="api-task-list"
+    ),
+    path(
+        "api/workers/",
+        WorkerApiView.as_view(),
+        name="api-worker-list"
+    ),
+    path(
+        "api/workers/autocomplete/",
+        WorkerAutocompleteView.as_view(),
+        name="api-worker-autocomplete"
+    ),
+    path(
+        "api/teams/",
+        TeamApiView.as_view(),
+        name="api-team-list"
+    ),
+    path(
+        "api/projects/",
+        ProjectApiView.as_view(),
+        name="api-project-list"
+    ),
+    path(
+        "api/tags/",
+        TagApiView.as_view(),
+        name="api-tag-list"
+    ),
 ]
 
 app_name = "manager"
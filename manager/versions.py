@@ -0,0 +1,94 @@
+from django.db.models import F, Q
+from django.utils import timezone
+
+from manager.models import (
+    Position,
+    Project,
+    Tag,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+)
+
+# Rows whose cached fragments display another object, keyed by the
+# displayed model: {displayed model: {model to bump: lookups to it}}.
+DEPENDENTS = {
+    Project: {Task: ("project",), Team: ("project",)},
+    Tag: {Task: ("tags",)},
+    TaskType: {Task: ("task_type",)},
+    Position: {Worker: ("position",)},
+    Worker: {Task: ("assigned",), Team: ("members",)},
+    Task: {Worker: ("task_completed", "tasks_not_completed")},
+}
+
+
+def bump(model, pks):
+    """
+    Increment ``version`` and ``updated_at`` of the given rows, invalidating
+    every template fragment and HTTP validator of the previous version.
+    """
+    model.objects.filter(pk__in=list(pks)).update(
+        version=F("version") + 1, updated_at=timezone.now()
+    )
+
+
+def touch(model, pks):
+    if any(field.name == "updated_at" for field in model._meta.fields):
+        model.objects.filter(pk__in=list(pks)).update(
+            updated_at=timezone.now()
+        )
+
+
+def bump_dependents(model, pks):
+    pks = list(pks)
+    if not pks:
+        return
+    for dependent, lookups in DEPENDENTS.get(model, {}).items():
+        condition = Q()
+        for lookup in lookups:
+            condition |= Q(**{f"{lookup}__in": pks})
+        dependent.objects.filter(
+            pk__in=dependent.objects.filter(condition).values("pk")
+        ).update(version=F("version") + 1, updated_at=timezone.now())
+
+
+# Many-to-many relations shown in the fragments of their owning model.
+OWNERS = {
+    Task.assigned.through: (Task, "assigned"),
+    Task.tags.through: (Task, "tags"),
+    Team.members.through: (Team, "members"),
+    Team.project.through: (Team, "project"),
+    Worker.task_completed.through: (Worker, "task_completed"),
+    Worker.tasks_not_completed.through: (Worker, "tasks_not_completed"),
+}
+
+
+def relation_changed(through, instance, action, reverse, pk_set):
+    """
+    Bump the owners of a changed many-to-many relation and touch the
+    ``updated_at`` of the rows on the other side.
+    """
+    owner, name = OWNERS[through]
+    field = owner._meta.get_field(name)
+    if action == "pre_clear":
+        instance_column, other_column = (
+            field.m2m_reverse_field_name(), field.m2m_field_name()
+        ) if reverse else (
+            field.m2m_field_name(), field.m2m_reverse_field_name()
+        )
+        pk_set = list(
+            through.objects.filter(
+                **{instance_column: instance.pk}
+            ).values_list(f"{other_column}_id", flat=True)
+        )
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    if reverse:
+        bump(owner, pk_set)
+        touch(field.related_model, [instance.pk])
+    else:
+        bump(owner, [instance.pk])
+        instance.version += 1
+        touch(field.related_model, pk_set)
@@ -6,6 +6,8 @@ from manager.views.task_views import (
     TaskDeleteView,
     TaskCompleteView,
     TaskCreateView,
+    TaskBulkActionView,
+    TaskHistoryView,
 )
 from manager.views.worker_views import (
     WorkerListView,
@@ -27,9 +29,26 @@ from manager.views.tag_views import (
     TagDeleteView,
     TagUpdateView,
 )
+from manager.views.project_views import ProjectDetailView
 from manager.views.position_views import (
     PositionListView,
     PositionCreateView,
     PositionDeleteView,
     PositionUpdateView,
 )
+from manager.views.api_views import (
+    TaskApiView,
+    WorkerApiView,
+    WorkerAutocompleteView,
+    TeamApiView,
+    ProjectApiView,
+    TagApiView,
+)
+from manager.views.async_views import (
+    AsyncTaskListView,
+    AsyncTaskDetailView,
+    AsyncWorkerListView,
+    AsyncWorkerDetailView,
+    AsyncTeamsListView,
+    AsyncTeamDetailView,
+)
@@ -0,0 +1,312 @@
+import json
+from collections import defaultdict
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import generic
+
+from manager.autocomplete import search_position, search_workers
+from manager.forms import TaskSearchForm, TeamSearchForm, WorkerSearchForm
+from manager.models import Project, Tag, Task, Team, Worker
+from manager.pagination import (
+    CURSOR_ERRORS,
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+)
+from manager.search import search_tasks
+from manager.transfer import batched
+
+
+class Many:
+    """
+    A multi-valued field, fetched with one extra query per page or chunk.
+    """
+
+    def __init__(self, lookup):
+        self.lookup = lookup
+
+
+class ApiListView(LoginRequiredMixin, generic.View):
+    """
+    Read-only JSON list of ``model`` rows built from ``values()``, without
+    instantiating models. ``fields`` maps output names to a lookup or a
+    Many(lookup); clients pick a subset with ``?fields=a,b``. Pages are
+    cursor paginated over ``ordering``; ``?stream=1`` streams every row
+    instead, reading the queryset in ``stream_chunk_size`` chunks.
+    """
+
+    raise_exception = True
+    model = None
+    fields = {}
+    ordering = ("pk",)
+    page_size = 50
+    max_page_size = 500
+    stream_chunk_size = 2000
+
+    def get_queryset(self):
+        return self.model.objects.all()
+
+    def get_fields(self):
+        names = self.request.GET.get("fields")
+        if not names:
+            return self.fields
+        selected = {}
+        for name in names.split(","):
+            if name not in self.fields:
+                raise ValueError(f"Unknown field: {name}")
+            selected[name] = self.fields[name]
+        return selected
+
+    def get_page_size(self):
+        try:
+            size = int(self.request.GET.get("limit", self.page_size))
+        except ValueError:
+            raise ValueError("limit must be an integer")
+        return max(1, min(size, self.max_page_size))
+
+    def get(self, request, *args, **kwargs):
+        try:
+            fields = self.get_fields()
+            page_size = self.get_page_size()
+        except ValueError as error:
+            return JsonResponse({"error": str(error)}, status=400)
+
+        queryset = self.get_queryset()
+        columns = {"pk", *self.ordering}
+        columns.update(
+            spec for spec in fields.values() if not isinstance(spec, Many)
+        )
+        rows = queryset.values(*columns)
+
+        if request.GET.get("stream"):
+            return StreamingHttpResponse(
+                self.stream(rows.order_by(*self.ordering), fields),
+                content_type="application/json",
+            )
+
+        try:
+            page = paginate_by_cursor(
+                rows, self.ordering, page_size, request.GET.get("cursor")
+            )
+        except (InvalidCursor, ValidationError, ValueError, TypeError):
+            return JsonResponse({"error": "Invalid cursor."}, status=400)
+        return JsonResponse({
+            "results": self.serialize(page.object_list, fields),
+            "next": self.page_url(page.next_cursor),
+            "previous": self.page_url(page.previous_cursor),
+        })
+
+    def stream(self, rows, fields):
+        yield '{"results": ['
+        separator = ""
+        chunks = rows.iterator(chunk_size=self.stream_chunk_size)
+        for batch in batched(chunks, self.stream_chunk_size):
+            yield separator + ",".join(
+                json.dumps(record, cls=DjangoJSONEncoder)
+                for record in self.serialize(batch, fields)
+            )
+            separator = ","
+        yield "]}"
+
+    def serialize(self, rows, fields):
+        pks = [row["pk"] for row in rows]
+        related = {
+            name: self.related_values(spec.lookup, pks)
+            for name, spec in fields.items()
+            if isinstance(spec, Many)
+        }
+        return [
+            {
+                name: (
+                    related[name].get(row["pk"], [])
+                    if name in related else row[spec]
+                )
+                for name, spec in fields.items()
+            }
+            for row in rows
+        ]
+
+    def related_values(self, lookup, pks):
+        values = defaultdict(list)
+        if not pks:
+            return values
+        pairs = self.model.objects.filter(
+            pk__in=pks, **{f"{lookup}__isnull": False}
+        ).order_by("pk", lookup).values_list("pk", lookup)
+        for pk, value in pairs:
+            values[pk].append(value)
+        return values
+
+    def page_url(self, cursor):
+        if cursor is None:
+            return None
+        params = self.request.GET.copy()
+        params["cursor"] = cursor
+        return f"{self.request.path}?{params.urlencode()}"
+
+
+class TaskApiView(ApiListView):
+    model = Task
+    ordering = ("deadline", "pk")
+    fields = {
+        "id": "pk",
+        "name": "name",
+        "description": "description",
+        "deadline": "deadline",
+        "is_completed": "is_completed",
+        "priority": "priority",
+        "task_type": "task_type__name",
+        "project": "project__name",
+        "assigned": Many("assigned__username"),
+        "tags": Many("tags__name"),
+    }
+
+    def get_queryset(self):
+        queryset = Task.objects.all()
+        form = TaskSearchForm(self.request.GET)
+
+        if form.is_valid():
+            if query := form.cleaned_data.get("query"):
+                queryset = search_tasks(queryset, query)
+                self.ordering = ("search_rank",) + TaskApiView.ordering
+
+            if form.cleaned_data.get("show_my_tasks"):
+                queryset = queryset.filter(assigned=self.request.user)
+        return queryset
+
+
+class WorkerApiView(ApiListView):
+    model = Worker
+    ordering = ("username", "pk")
+    fields = {
+        "id": "pk",
+        "username": "username",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "email": "email",
+        "position": "position__name",
+        "open_tasks": "task_stats__open_tasks",
+        "completed_tasks": "task_stats__completed_tasks",
+        "overdue_tasks": "task_stats__overdue_tasks",
+        "teams": Many("teams__name"),
+    }
+
+    def get_queryset(self):
+        queryset = Worker.objects.all()
+        form = WorkerSearchForm(self.request.GET)
+
+        if form.is_valid():
+            return queryset.filter(
+                username__istartswith=form.cleaned_data["username"]
+            )
+        return queryset
+
+
+class WorkerAutocompleteView(LoginRequiredMixin, generic.View):
+    """
+    Active workers whose username, first name or last name starts with
+    ``?q=``, answered from the in-process prefix index. ``next`` links to
+    the following matches, like the cursor pages of ApiListView.
+    """
+
+    raise_exception = True
+    max_limit = 50
+
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get("q", "").strip()
+        try:
+            limit = int(request.GET.get("limit", 10))
+        except ValueError:
+            return JsonResponse(
+                {"error": "limit must be an integer"}, status=400
+            )
+        if not query:
+            return JsonResponse({"results": [], "next": None})
+        limit = max(1, min(limit, self.max_limit))
+        after = None
+        if cursor := request.GET.get("cursor"):
+            try:
+                direction, after = decode_cursor(cursor, 2)
+                if direction != "next":
+                    raise InvalidCursor(cursor)
+            except CURSOR_ERRORS:
+                return JsonResponse({"error": "Invalid cursor."}, status=400)
+        try:
+            rows = search_workers(query, limit + 1, after)
+        except CURSOR_ERRORS:
+            return JsonResponse({"error": "Invalid cursor."}, status=400)
+        next_url = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            params = request.GET.copy()
+            params["cursor"] = encode_cursor(
+                "next", search_position(query, rows[-1])
+            )
+            next_url = f"{request.path}?{params.urlencode()}"
+        return JsonResponse({
+            "results": [
+                {
+                    "id": pk,
+                    "username": username,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                }
+                for pk, username, first_name, last_name in rows
+            ],
+            "next": next_url,
+        })
+
+
+class TeamApiView(ApiListView):
+    model = Team
+    ordering = ("name", "pk")
+    fields = {
+        "id": "pk",
+        "name": "name",
+        "members": Many("members__username"),
+        "projects": Many("project__name"),
+    }
+
+    def get_queryset(self):
+        queryset = Team.objects.all()
+        form = TeamSearchForm(self.request.GET)
+
+        if form.is_valid():
+            return queryset.filter(name__icontains=form.cleaned_data["name"])
+        return queryset
+
+
+class ProjectApiView(ApiListView):
+    model = Project
+    ordering = ("name", "pk")
+    fields = {
+        "id": "pk",
+        "name": "name",
+        "description": "description",
+        "teams": Many("teams__name"),
+    }
+
+    def get_queryset(self):
+        queryset = Project.objects.all()
+        if name := self.request.GET.get("name"):
+            return queryset.filter(name__icontains=name)
+        return queryset
+
+
+class TagApiView(ApiListView):
+    model = Tag
+    ordering = ("name", "pk")
+    fields = {
+        "id": "pk",
+        "name": "name",
+    }
+
+    def get_queryset(self):
+        queryset = Tag.objects.all()
+        if name := self.request.GET.get("name"):
+            return queryset.filter(name__icontains=name)
+        return queryset
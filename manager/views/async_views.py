@@ -0,0 +1,140 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import InvalidPage
+from django.http import Http404
+
+from manager.pagination import CURSOR_ERRORS, apaginate_by_cursor
+from manager.views.task_views import TaskDetailView, TaskListView
+from manager.views.team_views import TeamDetailView, TeamsListView
+from manager.views.worker_views import WorkerDetailView, WorkerListView
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    """
+    LoginRequiredMixin for async views: the user is loaded with
+    ``request.auser()`` instead of the lazy, synchronous ``request.user``.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        return self.adispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(
+            request, *args, **kwargs
+        )
+
+
+class AsyncConditionalGetMixin:
+    """
+    Async ``get`` of ConditionalGetMixin views. Every query of the view runs
+    on the async ORM; the template is rendered by the handler afterwards.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        etag, last_modified = await self.aget_validators()
+        response = self.not_modified_response(etag, last_modified)
+        if response is None:
+            response = await self.aget_response()
+        return self.add_validator_headers(response, etag, last_modified)
+
+
+class AsyncListMixin(AsyncConditionalGetMixin):
+    async def aget_response(self):
+        self.object_list = self.get_queryset()
+        self.paginated = await self.apaginate_queryset(
+            self.object_list, self.get_paginate_by(self.object_list)
+        )
+        return self.render_to_response(self.get_context_data())
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.paginated
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if self.get_pagination_mode() == "cursor":
+            try:
+                page = await apaginate_by_cursor(
+                    queryset,
+                    self.cursor_ordering,
+                    page_size,
+                    self.request.GET.get(self.cursor_kwarg),
+                )
+            except CURSOR_ERRORS:
+                raise Http404("Invalid cursor.")
+            return None, page, page.object_list, page.has_other_pages()
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        paginator.count = await queryset.acount()
+        number = self.request.GET.get(self.page_kwarg) or 1
+        if number == "last":
+            number = paginator.num_pages
+        try:
+            number = paginator.validate_number(number)
+        except InvalidPage as error:
+            raise Http404(f"Invalid page ({number}): {error}")
+
+        bottom = (number - 1) * page_size
+        top = bottom + page_size
+        if top + paginator.orphans >= paginator.count:
+            top = paginator.count
+        rows = [row async for row in queryset[bottom:top]]
+        page = paginator._get_page(rows, number, paginator)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class AsyncDetailMixin(AsyncConditionalGetMixin):
+    async def aget_response(self):
+        try:
+            self.object = await self.get_queryset().aget(
+                pk=self.kwargs[self.pk_url_kwarg]
+            )
+        except self.model.DoesNotExist:
+            raise Http404(
+                f"No {self.model._meta.verbose_name} found matching the "
+                f"query"
+            )
+        return self.render_to_response(
+            self.get_context_data(object=self.object)
+        )
+
+
+class AsyncTaskListView(
+    AsyncLoginRequiredMixin, AsyncListMixin, TaskListView
+):
+    pass
+
+
+class AsyncTaskDetailView(
+    AsyncLoginRequiredMixin, AsyncDetailMixin, TaskDetailView
+):
+    pass
+
+
+class AsyncWorkerListView(
+    AsyncLoginRequiredMixin, AsyncListMixin, WorkerListView
+):
+    pass
+
+
+class AsyncWorkerDetailView(
+    AsyncLoginRequiredMixin, AsyncDetailMixin, WorkerDetailView
+):
+    pass
+
+
+class AsyncTeamsListView(
+    AsyncLoginRequiredMixin, AsyncListMixin, TeamsListView
+):
+    pass
+
+
+class AsyncTeamDetailView(
+    AsyncLoginRequiredMixin, AsyncDetailMixin, TeamDetailView
+):
+    pass
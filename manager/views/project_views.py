@@ -0,0 +1,15 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views import generic
+
+from manager.models import Project
+from manager.summary import team_workload
+
+
+class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
+    model = Project
+    queryset = Project.objects.select_related("task_stats")
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(team_workload(self.object))
+        return context
@@ -1,34 +1,54 @@
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import render, get_object_or_404, redirect
+from django.db import transaction
+from django.shortcuts import get_object_or_404, redirect
+from django.template.response import TemplateResponse
 from django.views import generic
 from django.urls import reverse_lazy
-from django.db.models import Q
+from django.db.models import Prefetch
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
 )
 
-from manager.models import Task, Project
-from manager.forms import TaskForm, TaskSearchForm
+from manager import access
+from manager.assignment import auto_assign
+from manager.bulk import apply_action
+from manager.conditional import ConditionalGetMixin
+from manager.dashboard import get_dashboard
+from manager.models import Activity, Task, Worker
+from manager.forms import (
+    TaskBulkActionForm,
+    TaskCreateForm,
+    TaskForm,
+    TaskSearchForm,
+)
+from manager.pagination import CursorPaginationMixin
+from manager.search import search_tasks
 
 
 @login_required
 def index(request):
     worker = request.user
-    assigned_tasks = worker.assigned_tasks.all()
-    projects = Project.objects.filter(tasks__in=assigned_tasks).distinct()
+    dashboard = get_dashboard(worker)
 
     context = {
         "worker": worker,
-        "projects": projects
+        "teams": dashboard["teams"],
+        "projects": dashboard["projects"]
     }
 
-    return render(request, "manager/index.html", context=context)
+    return TemplateResponse(request, "manager/index.html", context=context)
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    generic.ListView
+):
     model = Task
     paginate_by = 5
+    cursor_ordering = ("deadline", "pk")
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(TaskListView, self).get_context_data(**kwargs)
@@ -38,71 +58,166 @@ class TaskListView(LoginRequiredMixin, generic.ListView):
         context["search_form"] = TaskSearchForm(
             initial={"query": query, "show_my_tasks": show_my_tasks}
         )
+        context["bulk_form"] = TaskBulkActionForm()
         return context
 
     def get_queryset(self):
-        queryset = Task.objects.all()
+        queryset = Task.objects.select_related("project").only(
+            "name", "is_completed", "is_overdue", "priority", "deadline",
+            "version", "project__name",
+        )
         form = TaskSearchForm(self.request.GET)
 
         if form.is_valid():
             query = form.cleaned_data.get("query")
 
             if query:
-                queryset = queryset.filter(
-                    Q(name__icontains=query)
-                    | Q(project__name__icontains=query)
+                queryset = search_tasks(queryset, query)
+                self.cursor_ordering = (
+                    ("search_rank",) + TaskListView.cursor_ordering
                 )
 
             if show_my_tasks := form.cleaned_data.get("show_my_tasks"):
                 queryset = queryset.filter(assigned=self.request.user)
 
-        return queryset
+        return queryset.order_by(*self.cursor_ordering)
 
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+class TaskDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Task
+    queryset = Task.objects.select_related(
+        "task_type", "project"
+    ).prefetch_related(
+        Prefetch(
+            "assigned",
+            queryset=Worker.objects.only(
+                "username", "first_name", "last_name"
+            )
+        ),
+        "tags",
+    )
+
+    def get_queryset(self):
+        return access.viewable(self.request.user, super().get_queryset())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["can_complete"] = access.can_complete(
+            self.request.user, self.object
+        )
+        return context
+
+
+class TaskHistoryView(
+    LoginRequiredMixin,
+    CursorPaginationMixin,
+    generic.ListView
+):
+    template_name = "manager/task_history.html"
+    paginate_by = 20
+    pagination_mode = "cursor"
+    cursor_ordering = ("-pk",)
+
+    def get_queryset(self):
+        self.task = get_object_or_404(
+            access.viewable(self.request.user, Task.objects.only("name")),
+            pk=self.kwargs["pk"],
+        )
+        return Activity.objects.filter(
+            model=Activity.TASK, object_id=self.task.pk
+        ).select_related("actor").only(
+            "created_at", "action", "changes", "actor",
+            "actor__username", "actor__first_name", "actor__last_name",
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        task = self.get_object()
-        user = self.request.user
-        context["can_complete"] = (
-            not task.is_completed
-            and (user in task.assigned.all() or user.is_superuser)
+        context["task"] = self.task
+        events = context["object_list"]
+        worker_ids = {
+            worker_id
+            for event in events
+            for worker_id in event.changes.get("workers", [])
+        }
+        usernames = dict(
+            Worker.objects.filter(pk__in=worker_ids)
+            .values_list("pk", "username")
         )
+        for event in events:
+            event.fields = {
+                field: value for field, value in event.changes.items()
+                if field != "workers"
+            }
+            event.workers = [
+                usernames.get(worker_id, f"#{worker_id}")
+                for worker_id in event.changes.get("workers", [])
+            ]
         return context
 
 
 class TaskCreateView(LoginRequiredMixin, generic.CreateView):
     model = Task
-    form_class = TaskForm
+    form_class = TaskCreateForm
     success_url = reverse_lazy("manager:task-list")
 
+    @transaction.atomic
     def form_valid(self, form):
         response = super().form_valid(form)
 
         assigned_workers = form.cleaned_data.get("assigned", [])
         if assigned_workers:
             self.object.assigned.set(assigned_workers)
+        elif form.cleaned_data.get("auto_assign"):
+            auto_assign([self.object])
 
         return response
 
 
 class TaskCompleteView(LoginRequiredMixin, generic.View):
     @staticmethod
+    @transaction.atomic
     def post(request, pk):
         task = get_object_or_404(Task, pk=pk)
-        if request.user in task.assigned.all() or request.user.is_superuser:
+        if access.can_complete(request.user, task):
             task.is_completed = True
             task.save()
         return redirect("manager:task-detail", pk=pk)
 
 
+class TaskBulkActionView(LoginRequiredMixin, generic.FormView):
+    form_class = TaskBulkActionForm
+    template_name = "manager/task_bulk_form.html"
+    http_method_names = ["post"]
+    success_url = reverse_lazy("manager:task-list")
+
+    def form_valid(self, form):
+        apply_action(
+            self.request.user,
+            form.cleaned_data["tasks"],
+            form.cleaned_data["action"],
+            workers=form.cleaned_data["workers"],
+            tags=form.cleaned_data["tags"],
+            priority=form.cleaned_data["priority"],
+        )
+        return super().form_valid(form)
+
+
 class TaskUpdateView(LoginRequiredMixin, generic.UpdateView):
     model = Task
     form_class = TaskForm
     success_url = reverse_lazy("manager:task-list")
 
+    def get_queryset(self):
+        return access.editable(self.request.user, super().get_queryset())
+
+    @transaction.atomic
+    def form_valid(self, form):
+        return super().form_valid(form)
+
 
 class TaskDeleteView(
     LoginRequiredMixin,
@@ -112,3 +227,6 @@ class TaskDeleteView(
     permission_required = "manager.view_task"
     model = Task
     success_url = reverse_lazy("manager:task-list")
+
+    def get_queryset(self):
+        return access.editable(self.request.user, super().get_queryset())
@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from django.views import generic
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import (
@@ -5,16 +6,24 @@ from django.contrib.auth.mixins import (
     PermissionRequiredMixin,
 )
 
-from manager.models import Team
+from manager.conditional import ConditionalGetMixin
+from manager.models import Team, Project, Worker
+from manager.pagination import CursorPaginationMixin
 from manager.forms import (
     TeamForm,
     TeamSearchForm,
 )
 
 
-class TeamsListView(LoginRequiredMixin, generic.ListView):
+class TeamsListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    generic.ListView
+):
     model = Team
     paginate_by = 5
+    cursor_ordering = ("name", "pk")
 
     def get_context_data(self, *, object_list=None, **kwargs):
         context = super(TeamsListView, self).get_context_data(**kwargs)
@@ -26,7 +35,9 @@ class TeamsListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self):
-        queryset = Team.objects.all()
+        queryset = Team.objects.prefetch_related(
+            Prefetch("project", queryset=Project.objects.only("name"))
+        ).order_by(*self.cursor_ordering)
         form = TeamSearchForm(self.request.GET)
 
         if form.is_valid():
@@ -36,8 +47,19 @@ class TeamsListView(LoginRequiredMixin, generic.ListView):
         return queryset
 
 
-class TeamDetailView(LoginRequiredMixin, generic.DetailView):
+class TeamDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Team
+    queryset = Team.objects.prefetch_related(
+        Prefetch(
+            "members",
+            queryset=Worker.objects.only("first_name", "last_name")
+        ),
+        Prefetch("project", queryset=Project.objects.only("name")),
+    )
 
 
 class TeamCreateView(
@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from django.views import generic
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import (
@@ -5,7 +6,9 @@ from django.contrib.auth.mixins import (
     PermissionRequiredMixin,
 )
 
-from manager.models import Worker
+from manager.conditional import ConditionalGetMixin
+from manager.models import Worker, Task
+from manager.pagination import CursorPaginationMixin
 from manager.forms import (
     WorkerCreationForm,
     WorkerForm,
@@ -13,9 +16,26 @@ from manager.forms import (
 )
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+def worker_queryset():
+    task_names = Task.objects.only("name")
+    return Worker.objects.select_related(
+        "position", "task_stats"
+    ).prefetch_related(
+        Prefetch("task_completed", queryset=task_names),
+        Prefetch("tasks_not_completed", queryset=task_names),
+    )
+
+
+class WorkerListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    generic.ListView
+):
     model = Worker
+    validator_fields = ("updated_at", "task_stats__updated_at")
     paginate_by = 5
+    cursor_ordering = ("username", "pk")
     context_object_name = "workers"
 
     def get_context_data(self, *, object_list=None, **kwargs):
@@ -28,18 +48,26 @@ class WorkerListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self):
-        queryset = Worker.objects.all()
+        queryset = worker_queryset().order_by(*self.cursor_ordering)
         form = WorkerSearchForm(self.request.GET)
 
         if form.is_valid():
             return queryset.filter(
-                username__icontains=form.cleaned_data["username"]
+                username__istartswith=form.cleaned_data["username"]
             )
         return queryset
 
 
-class WorkerDetailView(LoginRequiredMixin, generic.DetailView):
+class WorkerDetailView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    generic.DetailView
+):
     model = Worker
+    validator_fields = ("updated_at", "task_stats__updated_at")
+
+    def get_queryset(self):
+        return worker_queryset()
 
 
 class WorkerCreateView(
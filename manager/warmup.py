@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.utils import get_app_template_dirs
+from django.urls import resolve, reverse
+from django.urls.converters import IntConverter
+
+from manager import urls as manager_urls
+
+logger = logging.getLogger("manager.performance")
+
+TEMPLATE_DIRECTORIES = ("manager", "includes")
+
+
+def template_names():
+    """
+    Names of the templates under templates/manager and templates/includes,
+    and of the crispy-forms template pack the forms are rendered with.
+    """
+    engine = engines["django"].engine
+    roots = [
+        (directory, subdirectory)
+        for directory in engine.dirs
+        for subdirectory in TEMPLATE_DIRECTORIES
+    ] + [
+        (directory, settings.CRISPY_TEMPLATE_PACK)
+        for directory in get_app_template_dirs("templates")
+    ]
+    names = set()
+    for directory, subdirectory in roots:
+        root = os.path.join(directory, subdirectory)
+        for path, _, files in os.walk(root):
+            for file in files:
+                if file.endswith(".html"):
+                    names.add(os.path.relpath(
+                        os.path.join(path, file), directory
+                    ).replace(os.sep, "/"))
+    return sorted(names)
+
+
+def compile_templates():
+    """
+    Load every template of template_names(). The cached loader, used
+    outside of DEBUG, keeps them compiled for the first requests.
+    """
+    engine = engines["django"].engine
+    compiled = 0
+    for name in template_names():
+        try:
+            engine.get_template(name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as error:
+            logger.warning("Could not precompile %s: %s", name, error)
+        else:
+            compiled += 1
+    return compiled
+
+
+def resolve_routes():
+    """
+    Reverse and resolve every route of manager/urls.py, which populates the
+    URL resolver and imports all the views.
+    """
+    for pattern in manager_urls.urlpatterns:
+        kwargs = {
+            name: 1 if isinstance(converter, IntConverter) else "warmup"
+            for name, converter in pattern.pattern.converters.items()
+        }
+        resolve(reverse(f"manager:{pattern.name}", kwargs=kwargs))
+    return len(manager_urls.urlpatterns)
+
+
+def open_connections():
+    """
+    Connect to every database. Pooled connections are returned to their
+    pool right away; persistent ones stay open for the current thread.
+    """
+    for connection in connections.all():
+        connection.ensure_connection()
+        if not connection.settings_dict["CONN_MAX_AGE"]:
+            connection.close()
+    return len(connections.all())
+
+
+def warmup(open_db=True):
+    """
+    Do the work that would otherwise slow down the first requests of a
+    fresh process. Returns and logs what was done and how long it took.
+    """
+    started = time.perf_counter()
+    record = {
+        "templates": compile_templates(),
+        "routes": resolve_routes(),
+        "connections": open_connections() if open_db else 0,
+    }
+    record["warmup_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    logger.info(json.dumps(record), extra={"warmup": record})
+    return record
@@ -0,0 +1,61 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+
+class SearchSelectMixin:
+    """
+    Select widget for a ModelChoiceField that renders only the selected
+    options, read with one query. Other choices are looked up while typing
+    from the JSON endpoint at ``search_url``; ``search_param`` is its query
+    parameter and ``label_fields`` the result keys shown for each row.
+    """
+
+    def __init__(self, search_url, search_param="name",
+                 label_fields=("name",), attrs=None):
+        super().__init__(attrs)
+        self.search_url = search_url
+        self.search_param = search_param
+        self.label_fields = label_fields
+
+    class Media:
+        js = ["manager/js/search_select.js"]
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"].update({
+            "data-search-url": str(self.search_url),
+            "data-search-param": self.search_param,
+            "data-label-fields": ",".join(self.label_fields),
+        })
+        return context
+
+    def selected_objects(self, value):
+        value = [pk for pk in value if pk not in (None, "")]
+        if not value:
+            return []
+        try:
+            return list(self.choices.queryset.filter(pk__in=value))
+        except (ValueError, TypeError, ValidationError):
+            return []
+
+    def optgroups(self, name, value, attrs=None):
+        options = []
+        if not self.allow_multiple_selected and not self.is_required:
+            options.append(self.create_option(
+                name, "", self.choices.field.empty_label or "",
+                not any(value), 0, attrs=attrs,
+            ))
+        for obj in self.selected_objects(value):
+            option_value, label = self.choices.choice(obj)
+            options.append(self.create_option(
+                name, option_value, label, True, len(options), attrs=attrs
+            ))
+        return [(None, options, 0)]
+
+
+class SearchSelect(SearchSelectMixin, forms.Select):
+    pass
+
+
+class SearchSelectMultiple(SearchSelectMixin, forms.SelectMultiple):
+    pass